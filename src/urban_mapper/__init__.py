@@ -17,6 +17,7 @@ from .modules import (
     ParquetLoader,
     DataFrameLoader,
     HuggingFaceLoader,
+    PartitionedLoader,
     GeoImputerBase,
     SimpleGeoImputer,
     AddressGeoImputer,
@@ -48,6 +49,7 @@ __all__ = [
     "ParquetLoader",
     "DataFrameLoader",
     "HuggingFaceLoader",
+    "PartitionedLoader",
     "GeoImputerBase",
     "SimpleGeoImputer",
     "AddressGeoImputer",
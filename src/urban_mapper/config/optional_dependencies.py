@@ -33,6 +33,10 @@ OPTIONAL_DEPENDENCIES: Dict[str, OptionalDependencyInfo] = {
         extra="jupytergis_mixins",
         description="JupyterGIS features require the optional `jupytergis` dependencies.",
     ),
+    "raster": OptionalDependencyInfo(
+        extra="raster",
+        description="Raster zonal statistics require the optional `rasterio` dependency.",
+    ),
     "pipeline_generators": OptionalDependencyInfo(
         extra="pipeline_generators",
         description="Pipeline generators require optional LLM dependencies.",
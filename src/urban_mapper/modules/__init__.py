@@ -6,6 +6,7 @@ from .loader import (
     ParquetLoader,
     DataFrameLoader,
     HuggingFaceLoader,
+    PartitionedLoader,
 )
 from .imputer import (
     GeoImputerBase,
@@ -53,6 +54,7 @@ __all__ = [
     "ParquetLoader",
     "DataFrameLoader",
     "HuggingFaceLoader",
+    "PartitionedLoader",
     "GeoImputerBase",
     "SimpleGeoImputer",
     "AddressGeoImputer",
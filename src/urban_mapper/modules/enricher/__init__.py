@@ -2,9 +2,22 @@ from .aggregator import (
     BaseAggregator,
     SimpleAggregator,
     CountAggregator,
+    DistinctCountAggregator,
+    CategoricalAggregator,
     AGGREGATION_FUNCTIONS,
+    DISTINCT_COUNT_METHODS,
+    CATEGORICAL_METHODS,
 )
-from .enrichers import SingleAggregatorEnricher
+from .enrichers import (
+    SingleAggregatorEnricher,
+    TemporalBinnedEnricher,
+    SpatialLagEnricher,
+    LayerOverlayEnricher,
+    ArealInterpolationEnricher,
+    FlowMatrixEnricher,
+    ZonalStatisticsEnricher,
+)
+from .helpers import TemporalCube, FlowMatrix
 from .abc_enricher import EnricherBase
 from .enricher_factory import EnricherFactory
 from .factory.registries import register_enricher, register_aggregator
@@ -14,9 +27,21 @@ __all__ = [
     "BaseAggregator",
     "SimpleAggregator",
     "CountAggregator",
+    "DistinctCountAggregator",
+    "CategoricalAggregator",
     "SingleAggregatorEnricher",
+    "TemporalBinnedEnricher",
+    "SpatialLagEnricher",
+    "LayerOverlayEnricher",
+    "ArealInterpolationEnricher",
+    "FlowMatrixEnricher",
+    "ZonalStatisticsEnricher",
+    "TemporalCube",
+    "FlowMatrix",
     "EnricherFactory",
     "register_enricher",
     "register_aggregator",
     "AGGREGATION_FUNCTIONS",
+    "DISTINCT_COUNT_METHODS",
+    "CATEGORICAL_METHODS",
 ]
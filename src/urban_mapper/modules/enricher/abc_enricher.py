@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Optional, Any, Union, Dict
+from pathlib import Path
+from typing import Optional, Any, Union, Dict, List
 import geopandas as gpd
 import pandas as pd
 import numpy as np
@@ -23,6 +24,12 @@ class EnricherBase(ABC):
         - [x] Computing statistics on related data
         - [x] Joining external information to the urban layer
 
+    !!! tip "Several Datasets"
+        Given a dictionary of datasets, enrichers run once per dataset selected by
+        `config.data_id`. When configured with `with_datasets_combined()`, the selected
+        datasets are instead stacked with a categorical `data_id` column and handed in one go
+        to `_enrich_datasets`, which enrichers supporting it implement.
+
     Attributes:
         config: Configuration object for the enricher, containing parameters
             that control the enrichment process.
@@ -81,6 +88,76 @@ class EnricherBase(ABC):
         """
         NotImplementedError("Preview method not implemented.")
 
+    @property
+    def required_columns(self) -> Optional[List[str]]:
+        """Columns of the input data the enrichment reads, `None` if unknown.
+
+        When every enricher of a pipeline knows its columns, the pipeline maps and
+        enriches a projection of the data instead of a full copy of it.
+        """
+        return None
+
+    def _enrich_datasets(
+        self,
+        input_geodataframe: gpd.GeoDataFrame,
+        urban_layer: UrbanLayerBase,
+        **kwargs,
+    ) -> UrbanLayerBase:
+        """Internal method to enrich from several datasets at once.
+
+        !!! warning "Method Not Implemented"
+            Enrichers supporting `with_datasets_combined()` must implement this.
+
+        Args:
+            input_geodataframe: The stacked datasets, with a categorical `data_id` column.
+            urban_layer: The urban layer to be enriched.
+            **kwargs: Extra parameters to tweak the enrichment.
+
+        Returns:
+            The enriched urban layer.
+
+        Raises:
+            ValueError: If the enricher does not support enriching across datasets.
+        """
+        raise ValueError(
+            f"{type(self).__name__} does not support enriching across datasets."
+        )
+
+    def _enrich_incremental(
+        self,
+        batches: List[gpd.GeoDataFrame],
+        urban_layer: UrbanLayerBase,
+        state_path: Path,
+        **kwargs,
+    ) -> UrbanLayerBase:
+        """Internal method to merge new batches of data into a persisted aggregate state.
+
+        !!! warning "Method Not Implemented"
+            Enrichers supporting incremental pipelines must implement this.
+
+        Args:
+            batches: New batches of data, mapped to the urban layer.
+            urban_layer: The urban layer to be enriched.
+            state_path: File holding the aggregate state of the previous batches.
+            **kwargs: Extra parameters to tweak the enrichment.
+
+        Returns:
+            The enriched urban layer.
+
+        Raises:
+            ValueError: If the enricher does not support incremental enrichment.
+        """
+        raise ValueError(
+            f"{type(self).__name__} does not support incremental enrichment."
+        )
+
+    def _selects_dataset(self, key: str) -> bool:
+        """Whether the dataset `key` is selected by `config.data_id`."""
+        data_id = self.config.data_id
+        if data_id is None:
+            return True
+        return key in data_id if isinstance(data_id, list) else key == data_id
+
     def set_layer_data_source(
         self, urban_layer: UrbanLayerBase, index: Index
     ) -> UrbanLayerBase:
@@ -93,7 +170,7 @@ class EnricherBase(ABC):
         Returns:
             Urban layer with new column data_id.
         """
-        if self.config.data_id:
+        if self.config.data_id and not isinstance(self.config.data_id, list):
             if "data_id" not in urban_layer.layer:
                 urban_layer.layer["data_id"] = pd.Series(np.nan, dtype="object")
 
@@ -103,7 +180,9 @@ class EnricherBase(ABC):
 
     def enrich(
         self,
-        input_geodataframe: Union[Dict[str, gpd.GeoDataFrame], gpd.GeoDataFrame],
+        input_geodataframe: Union[
+            Dict[str, gpd.GeoDataFrame], gpd.GeoDataFrame, UrbanLayerBase
+        ],
         urban_layer: UrbanLayerBase,
         **kwargs,
     ) -> UrbanLayerBase:
@@ -113,7 +192,8 @@ class EnricherBase(ABC):
         implementation-specific `_enrich` method after any needed validation.
 
         Args:
-            input_geodataframe: one or more `GeoDataFrame` with data to enrich with.
+            input_geodataframe: one or more `GeoDataFrame` with data to enrich with, or
+                another urban layer, whose `layer` is then used (e.g., with `overlay_by`).
             urban_layer: Urban layer to beef up with data from input_geodataframe.
             **kwargs: Additional bespoke parameters to customise enrichment.
 
@@ -137,13 +217,76 @@ class EnricherBase(ABC):
             ...     .build()
             >>> enriched_streets = enricher.enrich(taxi_trips, streets)
         """
+        if isinstance(input_geodataframe, UrbanLayerBase):
+            input_geodataframe = input_geodataframe.layer
         if isinstance(input_geodataframe, gpd.GeoDataFrame):
             return self._enrich(input_geodataframe, urban_layer, **kwargs)
+        elif self.config.across_datasets:
+            from urban_mapper.modules.enricher.helpers import concat_datasets
+
+            combined = concat_datasets(
+                {
+                    key: gdf
+                    for key, gdf in input_geodataframe.items()
+                    if self._selects_dataset(key)
+                },
+                columns=self.required_columns,
+            )
+            return self._enrich_datasets(combined, urban_layer, **kwargs)
         else:
             enriched_layer = urban_layer
 
             for key, gdf in input_geodataframe.items():
-                if self.config.data_id is None or self.config.data_id == key:
+                if self._selects_dataset(key):
                     enriched_layer = self._enrich(gdf, enriched_layer, **kwargs)
 
             return enriched_layer
+
+    def enrich_incremental(
+        self,
+        input_geodataframe: Union[Dict[str, gpd.GeoDataFrame], gpd.GeoDataFrame],
+        urban_layer: UrbanLayerBase,
+        state_path: Union[str, Path],
+        **kwargs,
+    ) -> UrbanLayerBase:
+        """Enrich an `urban layer` with a new batch of data, on top of the previous ones.
+
+        Rather than aggregating the whole history again, the aggregate state of the
+        previous batches (counts, sums, extrema, sketches per element) is loaded from
+        `state_path`, the new batch merged into it, and the state saved back. The
+        enriched column then covers all the batches seen so far, in time proportional
+        to the new batch. The first call, without any state file, starts the history.
+
+        Args:
+            input_geodataframe: New batch of data, or several selected by `config.data_id`.
+            urban_layer: Urban layer to enrich.
+            state_path: `.npz` file holding the aggregate state.
+            **kwargs: Additional bespoke parameters to customise enrichment.
+
+        Returns:
+            The enriched urban layer.
+
+        Raises:
+            ValueError: If the enricher or its aggregation cannot be merged across batches.
+
+        Examples:
+            >>> import urban_mapper as um
+            >>> mapper = um.UrbanMapper()
+            >>> enricher = mapper.enricher\
+            ...     .with_data(group_by="nearest_street")\
+            ...     .count_by(output_column="trip_count")\
+            ...     .build()
+            >>> streets = enricher.enrich_incremental(monday_trips, streets, "trip_count.npz")
+            >>> streets = enricher.enrich_incremental(tuesday_trips, streets, "trip_count.npz")
+        """
+        if isinstance(input_geodataframe, gpd.GeoDataFrame):
+            batches = [input_geodataframe]
+        else:
+            batches = [
+                gdf
+                for key, gdf in input_geodataframe.items()
+                if self._selects_dataset(key)
+            ]
+        return self._enrich_incremental(
+            batches, urban_layer, Path(state_path), **kwargs
+        )
@@ -11,6 +11,8 @@ The module includes:
 - BaseAggregator: Abstract base class defining the aggregator interface
 - SimpleAggregator: Performs standard statistical operations (mean, sum, etc.)
 - CountAggregator: Counts records, optionally with custom counting functions
+- DistinctCountAggregator: Counts distinct values, exactly or with HyperLogLog sketches
+- CategoricalAggregator: Computes the mode, top-k or shares of categorical values
 
 These aggregators are primarily used by the enricher component to perform
 spatial enrichment operations, such as counting points within regions,
@@ -30,12 +32,24 @@ Examples:
     >>> result = aggregator.aggregate(data)
 """
 
-from .aggregators import SimpleAggregator, CountAggregator, AGGREGATION_FUNCTIONS
+from .aggregators import (
+    SimpleAggregator,
+    CountAggregator,
+    DistinctCountAggregator,
+    CategoricalAggregator,
+    AGGREGATION_FUNCTIONS,
+    DISTINCT_COUNT_METHODS,
+    CATEGORICAL_METHODS,
+)
 from .abc_aggregator import BaseAggregator
 
 __all__ = [
     "SimpleAggregator",
     "CountAggregator",
+    "DistinctCountAggregator",
+    "CategoricalAggregator",
     "BaseAggregator",
     "AGGREGATION_FUNCTIONS",
+    "DISTINCT_COUNT_METHODS",
+    "CATEGORICAL_METHODS",
 ]
@@ -1,8 +1,19 @@
+import hashlib
+import json
 from abc import ABC, abstractmethod
+from typing import List, Optional
 import pandas as pd
 import numpy as np
+from pandas.core.groupby import DataFrameGroupBy
 from beartype import beartype
 from urban_mapper.utils import require_arguments_not_none
+from urban_mapper.modules.enricher.aggregator.helpers import (
+    GroupCodes,
+    is_list_column,
+    explode_list_column,
+    where_mask,
+    expression_columns,
+)
 
 
 @beartype
@@ -21,7 +32,14 @@ class BaseAggregator(ABC):
 
     !!! note "To Implement"
         All concrete aggregators must inherit from this and
-        implement `_aggregate`.
+        implement `_aggregate`. Those able to reduce integer group codes with
+        vectorised primitives may also override `_reduce`.
+
+    !!! tip "Conditions And Weights"
+        Aggregators accepting a `where` expression (e.g., `"injuries > 0"`) only
+        aggregate the rows matching it, and those accepting a `weight` column weigh
+        every row by it. Both are evaluated once over whole columns, then applied
+        to the group codes, rather than per group.
 
     Examples:
         >>> import urban_mapper as um
@@ -37,6 +55,107 @@ class BaseAggregator(ABC):
         ...     .build()
     """
 
+    consumes_list_groups: bool = False
+    """Whether `_aggregate` handles list-valued group columns itself (through `GroupCodes`
+    or `_groupby`). Otherwise, `aggregate` explodes them beforehand."""
+
+    where: Optional[str] = None
+    """Boolean expression rows must match to be aggregated, see `where_mask`."""
+
+    weight: Optional[str] = None
+    """Column weighing every row, for aggregators supporting weights."""
+
+    @property
+    def group_by_columns(self) -> List[str]:
+        """The `group_by_column`, as a list of column names.
+
+        Aggregators grouping by several columns hold a list in `group_by_column`; the
+        first column is the one mapped to the `urban layer` (e.g., `nearest_street`),
+        the others break its groups down (e.g., by vehicle type).
+        """
+        if isinstance(self.group_by_column, str):
+            return [self.group_by_column]
+        return list(self.group_by_column)
+
+    @property
+    def breaks_down(self) -> bool:
+        """Whether results are broken down below the `urban layer` element.
+
+        True when grouping by several columns; enrichers then lay results out per
+        category (see the `SingleAggregatorEnricher` breakdowns) rather than as one
+        value per element.
+        """
+        return len(self.group_by_columns) > 1
+
+    @property
+    def required_columns(self) -> Optional[List[str]]:
+        """Columns of the input data the aggregation reads, `None` if unknown.
+
+        Lets pipelines hand aggregators a projection of the data rather than the
+        whole of it. Aggregators passing rows to arbitrary functions return `None`.
+        """
+        return None
+
+    @property
+    def mergeable_reduction(self) -> Optional[str]:
+        """Reduction whose results on separate batches of data can be merged, if any.
+
+        One of `MERGEABLE_REDUCTIONS`, for aggregators whose state per group (counts,
+        sums, extrema, sketches) can be kept across batches (see `AggregateState`);
+        `None` for aggregators needing all the rows of a group at once (e.g., medians).
+        """
+        return None
+
+    @property
+    def state_fingerprint(self) -> str:
+        """Digest of the configuration an `AggregateState` of this aggregator depends on.
+
+        Covers the aggregator type, its reduction, and the columns, `where` and `weight`
+        it reads, so that a persisted state is never merged with batches aggregated
+        differently.
+        """
+        configuration = {
+            "aggregator": type(self).__name__,
+            "reduction": self.mergeable_reduction,
+            "group_by": self.group_by_columns,
+            "value_column": getattr(self, "value_column", None),
+            "where": self.where,
+            "weight": self.weight,
+            "precision": getattr(self, "precision", None),
+        }
+        return hashlib.sha256(
+            json.dumps(configuration, sort_keys=True, default=str).encode()
+        ).hexdigest()[:16]
+
+    def _with_condition_columns(self, columns: List[str]) -> Optional[List[str]]:
+        """Add the columns read by `where` and `weight` to `columns`, `None` if unknown."""
+        if self.where is not None:
+            where_columns = expression_columns(self.where)
+            if where_columns is None:
+                return None
+            columns = columns + where_columns
+        if self.weight is not None:
+            columns = columns + [self.weight]
+        return list(dict.fromkeys(columns))
+
+    def _matching(
+        self, input_dataframe: pd.DataFrame, groups: GroupCodes
+    ) -> GroupCodes:
+        """Keep the group codes of the rows matching `where`."""
+        if self.where is None:
+            return groups
+        matches = where_mask(input_dataframe, self.where)[groups.rows]
+        return GroupCodes(groups.codes[matches], groups.rows[matches], groups.keys)
+
+    def _weights(
+        self, input_dataframe: pd.DataFrame, groups: GroupCodes
+    ) -> Optional[np.ndarray]:
+        """`weight` of every coded row, missing weights counting as `0`, or `None`."""
+        if self.weight is None:
+            return None
+        weights = pd.to_numeric(input_dataframe[self.weight], errors="coerce")
+        return np.nan_to_num(weights.to_numpy(dtype=np.float64)[groups.rows])
+
     @abstractmethod
     def _aggregate(self, input_dataframe: pd.DataFrame) -> pd.DataFrame:
         """Perform the aggregation on the input DataFrame.
@@ -70,9 +189,72 @@ class BaseAggregator(ABC):
         Raises:
             ValueError: If input_dataframe is None or empty.
         """
-        first_value = input_dataframe.iloc[0][self.group_by_column]
-
-        if isinstance(first_value, (list, tuple, set, np.ndarray)):
-            input_dataframe = input_dataframe.explode(self.group_by_column)
+        if not self.consumes_list_groups and is_list_column(
+            input_dataframe[self.group_by_columns[0]]
+        ):
+            input_dataframe = explode_list_column(
+                input_dataframe, self.group_by_columns[0]
+            )
 
         return self._aggregate(input_dataframe)
+
+    def _groupby(self, input_dataframe: pd.DataFrame) -> DataFrameGroupBy:
+        """Group the input DataFrame by `group_by_column`, for non-vectorised aggregations.
+
+        Rows not matching `where` are dropped, and list-valued group columns are
+        exploded first, as `DataFrame.groupby` cannot group by lists.
+
+        Args:
+            input_dataframe: DataFrame to group.
+
+        Returns:
+            The `DataFrameGroupBy` of the input DataFrame.
+        """
+        if self.where is not None:
+            input_dataframe = input_dataframe[where_mask(input_dataframe, self.where)]
+        if is_list_column(input_dataframe[self.group_by_columns[0]]):
+            input_dataframe = explode_list_column(
+                input_dataframe, self.group_by_columns[0]
+            )
+        return input_dataframe.groupby(self.group_by_column)
+
+    def reduce(self, input_dataframe: pd.DataFrame, groups: GroupCodes) -> np.ndarray:
+        """Reduce the input DataFrame over already computed group codes.
+
+        Used by enrichers grouping records by more than the `group_by_column` alone
+        (e.g., by `urban layer` element *and* time bin), which encode those groups
+        themselves. Rows not matching `where` are dropped before handing the codes
+        to `_reduce`.
+
+        Args:
+            input_dataframe: DataFrame the codes were computed from.
+            groups: Group code of the rows of `input_dataframe` to reduce.
+
+        Returns:
+            One value per group, ordered like the codes.
+        """
+        return self._reduce(input_dataframe, self._matching(input_dataframe, groups))
+
+    def _reduce(self, input_dataframe: pd.DataFrame, groups: GroupCodes) -> np.ndarray:
+        """Reduce the input DataFrame over group codes already matching `where`.
+
+        The default implementation substitutes the codes to the `group_by_column` and
+        falls back on `_aggregate`; aggregators that can should override it with a
+        vectorised implementation.
+
+        Args:
+            input_dataframe: DataFrame the codes were computed from.
+            groups: Group code of the rows of `input_dataframe` to reduce.
+
+        Returns:
+            One value per group, ordered like the codes. `NaN` for groups `_aggregate` left out.
+        """
+        group_by_columns = self.group_by_columns
+        grouped_dataframe = input_dataframe.iloc[groups.rows].assign(
+            **{group_by_columns[0]: groups.codes},
+            **{column: 0 for column in group_by_columns[1:]},
+        )
+        aggregated = self._aggregate(grouped_dataframe)["value"]
+        if isinstance(aggregated.index, pd.MultiIndex):
+            aggregated.index = aggregated.index.get_level_values(0)
+        return aggregated.reindex(np.arange(groups.n_groups)).to_numpy(dtype=np.float64)
@@ -6,6 +6,8 @@ class, each implementing a specific type of aggregation operation:
 
 - SimpleAggregator: Applies standard statistical functions to grouped data
 - CountAggregator: Counts records within each group, optionally with conditions
+- DistinctCountAggregator: Counts distinct values within each group, exactly or with HyperLogLog
+- CategoricalAggregator: Mode, top-k and shares of the categories within each group
 
 It also exports the AGGREGATION_FUNCTIONS dictionary, which provides convenient
 access to common aggregation functions (mean, sum, min, max, etc.).
@@ -13,5 +15,15 @@ access to common aggregation functions (mean, sum, min, max, etc.).
 
 from .simple_aggregator import SimpleAggregator, AGGREGATION_FUNCTIONS
 from .count_aggregator import CountAggregator
+from .distinct_count_aggregator import DistinctCountAggregator, DISTINCT_COUNT_METHODS
+from .categorical_aggregator import CategoricalAggregator, CATEGORICAL_METHODS
 
-__all__ = ["SimpleAggregator", "CountAggregator", "AGGREGATION_FUNCTIONS"]
+__all__ = [
+    "SimpleAggregator",
+    "CountAggregator",
+    "DistinctCountAggregator",
+    "CategoricalAggregator",
+    "AGGREGATION_FUNCTIONS",
+    "DISTINCT_COUNT_METHODS",
+    "CATEGORICAL_METHODS",
+]
@@ -0,0 +1,219 @@
+from typing import Dict, List, Optional, Tuple, Union
+import numpy as np
+import pandas as pd
+from beartype import beartype
+from scipy import sparse
+from urban_mapper.modules.enricher.aggregator.abc_aggregator import BaseAggregator
+from urban_mapper.modules.enricher.aggregator.helpers import GroupCodes
+from urban_mapper.utils.helpers import require_attribute_columns
+
+
+CATEGORICAL_METHODS: Dict[str, str] = {
+    "mode": "Most frequent category of every group",
+    "top_k": "The k most frequent categories of every group, with their counts",
+    "category_shares": "Share of every category within every group",
+}
+
+
+@beartype
+class CategoricalAggregator(BaseAggregator):
+    """Aggregator For Categorical Values In Groups.
+
+    Summarises a categorical `value_column` per group, e.g. the most common complaint
+    type per street or the share of each vehicle class per neighbourhood, without
+    running a Python function per group.
+
+    Values and group keys are factorised into integer codes, and the (group, category)
+    pairs counted in one pass into a sparse group × category `crosstab`, from which:
+
+    - [x] `mode`: the most frequent category of every group (ties go to the first
+      category in sorted order).
+    - [x] `top_k`: the `k` most frequent categories of every group, as a
+      `{category: count}` dictionary ordered by decreasing count.
+    - [x] `category_shares`: the share of every category within every group. Results
+      are broken down per category, so that the `SingleAggregatorEnricher` writes one
+      `<output_column>_<category>` column per category (see `with_breakdown`).
+
+    `where` restricts the aggregation to the rows matching an expression, and `weight`
+    counts every row as its weight (e.g., the share of passengers rather than of trips
+    per vehicle class).
+
+    Within the factory, use `aggregate_by(method="mode")`,
+    `aggregate_by(method="top_k", k=3)` or `aggregate_by(method="category_shares")`.
+
+    Attributes:
+        group_by_column: Column(s) to group by, the first one being mapped to the urban layer.
+        value_column: Column holding the categories.
+        method: One of `CATEGORICAL_METHODS`.
+        k: Number of categories kept per group by `top_k`.
+        where: Expression rows must match to be aggregated (optional).
+        weight: Column counted instead of rows (optional).
+        crosstab: Sparse `(n_groups, n_categories)` counts of the last aggregation.
+        categories: Categories of the last aggregation, one per `crosstab` column.
+
+    Examples:
+        >>> import urban_mapper as um
+        >>> mapper = um.UrbanMapper()
+        >>> enricher = mapper.enricher\
+        ...     .with_data(group_by="nearest_street", values_from="complaint_type")\
+        ...     .aggregate_by(method="mode", output_column="main_complaint")\
+        ...     .build()
+        >>> enricher = mapper.enricher\
+        ...     .with_data(group_by="nearest_street", values_from="vehicle_class")\
+        ...     .aggregate_by(method="category_shares", output_column="share")\
+        ...     .build()
+    """
+
+    consumes_list_groups = True
+
+    def __init__(
+        self,
+        group_by_column: Union[str, List[str]],
+        value_column: str,
+        method: str = "mode",
+        k: int = 3,
+        where: Optional[str] = None,
+        weight: Optional[str] = None,
+    ) -> None:
+        if method not in CATEGORICAL_METHODS:
+            raise ValueError(
+                f"Unknown categorical method '{method}'. Available: {list(CATEGORICAL_METHODS.keys())}"
+            )
+        if k < 1:
+            raise ValueError("k must be a positive integer.")
+        self.group_by_column = group_by_column
+        self.value_column = value_column
+        self.method = method
+        self.k = k
+        self.where = where
+        self.weight = weight
+        self.crosstab: Optional[sparse.csr_matrix] = None
+        self.categories: Optional[pd.Index] = None
+
+    @property
+    def required_columns(self) -> Optional[List[str]]:
+        """Columns of the input data the aggregation reads, `None` if unknown."""
+        return self._with_condition_columns(self.group_by_columns + [self.value_column])
+
+    @property
+    def breaks_down(self) -> bool:
+        """Whether results are broken down per category, as `category_shares` are."""
+        return self.method == "category_shares" or super().breaks_down
+
+    @require_attribute_columns("input_dataframe", ["group_by_column", "value_column"])
+    def _aggregate(self, input_dataframe: pd.DataFrame) -> pd.DataFrame:
+        """Summarise the categories of every group.
+
+        Args:
+            input_dataframe: DataFrame with `group_by_column` and `value_column`.
+
+        Returns:
+            DataFrame with 'value' and 'indices' (original row indices). Indexed by group,
+            or by (group, category) for `category_shares`.
+
+        Raises:
+            ValueError: If required columns are missing.
+        """
+        groups = self._matching(
+            input_dataframe,
+            GroupCodes.from_dataframe(input_dataframe, self.group_by_column),
+        )
+        if self.method != "category_shares":
+            return pd.DataFrame(
+                {
+                    "value": self._reduce(input_dataframe, groups),
+                    "indices": groups.indices(input_dataframe.index),
+                },
+                index=groups.keys,
+            )
+
+        category_codes = self._crosstab(input_dataframe, groups)
+        present = category_codes >= 0
+        cells = self.crosstab.tocoo()
+        cell_codes = np.searchsorted(
+            cells.row * len(self.categories) + cells.col,
+            groups.codes[present] * len(self.categories) + category_codes[present],
+        )
+        cell_groups = GroupCodes(
+            cell_codes, groups.rows[present], pd.RangeIndex(cells.nnz)
+        )
+        keys = groups.keys.to_frame(index=False).iloc[cells.row]
+        keys[self.value_column] = self.categories[cells.col]
+        totals = np.asarray(self.crosstab.sum(axis=1)).reshape(-1)
+        return pd.DataFrame(
+            {
+                "value": cells.data / totals[cells.row],
+                "indices": cell_groups.indices(input_dataframe.index),
+            },
+            index=pd.MultiIndex.from_frame(keys),
+        )
+
+    def _reduce(self, input_dataframe: pd.DataFrame, groups: GroupCodes) -> np.ndarray:
+        """Summarise categories over already computed group codes.
+
+        Args:
+            input_dataframe: DataFrame the codes were computed from.
+            groups: Group code of the rows of `input_dataframe` to reduce.
+
+        Returns:
+            One mode or `{category: count}` dictionary per group, ordered like the codes,
+            `None` for groups without any category. For `category_shares`, a dense
+            `(n_groups, n_categories)` array of shares.
+        """
+        self._crosstab(input_dataframe, groups)
+        if self.method == "category_shares":
+            totals = np.asarray(self.crosstab.sum(axis=1))
+            with np.errstate(invalid="ignore", divide="ignore"):
+                return np.nan_to_num(self.crosstab.toarray() / totals)
+
+        rows, columns, counts, ranks = self._ranked_cells()
+        values = np.full(groups.n_groups, None, dtype=object)
+        if self.method == "mode":
+            first = ranks == 0
+            values[rows[first]] = self.categories[columns[first]].to_numpy()
+            return values
+
+        kept = ranks < self.k
+        rows, columns, counts = rows[kept], columns[kept], counts[kept]
+        boundaries = np.flatnonzero(np.diff(rows)) + 1
+        for row, categories, category_counts in zip(
+            rows[np.r_[0, boundaries]] if len(rows) else [],
+            np.split(self.categories[columns].to_numpy(), boundaries),
+            np.split(counts, boundaries),
+        ):
+            values[row] = dict(zip(categories.tolist(), category_counts.tolist()))
+        return values
+
+    def _crosstab(
+        self, input_dataframe: pd.DataFrame, groups: GroupCodes
+    ) -> np.ndarray:
+        """Count (group, category) pairs into `crosstab`, returning the category codes."""
+        values = input_dataframe[self.value_column].to_numpy()[groups.rows]
+        category_codes, categories = pd.factorize(values, sort=True)
+        present = category_codes >= 0
+        pairs, pair_codes = np.unique(
+            groups.codes[present] * len(categories) + category_codes[present],
+            return_inverse=True,
+        )
+        weights = self._weights(input_dataframe, groups)
+        counts = np.bincount(
+            pair_codes,
+            weights=None if weights is None else weights[present],
+            minlength=len(pairs),
+        )
+        rows, columns = np.divmod(pairs, max(len(categories), 1))
+        self.categories = pd.Index(categories, name=self.value_column)
+        self.crosstab = sparse.csr_matrix(
+            (counts, (rows, columns)), shape=(groups.n_groups, len(categories))
+        )
+        return category_codes
+
+    def _ranked_cells(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Non-empty `crosstab` cells, sorted by group then decreasing count, with their rank in the group."""
+        cells = self.crosstab.tocoo()
+        order = np.lexsort((cells.col, -cells.data, cells.row))
+        rows, columns, counts = cells.row[order], cells.col[order], cells.data[order]
+        starts = np.r_[0, np.flatnonzero(np.diff(rows)) + 1]
+        sizes = np.diff(np.r_[starts, len(rows)])
+        ranks = np.arange(len(rows)) - np.repeat(starts, sizes)
+        return rows, columns, counts, ranks
@@ -1,7 +1,9 @@
-from typing import Callable, Any
+from typing import Callable, Any, List, Union, Optional
+import numpy as np
 import pandas as pd
 from beartype import beartype
 from urban_mapper.modules.enricher.aggregator.abc_aggregator import BaseAggregator
+from urban_mapper.modules.enricher.aggregator.helpers import GroupCodes, grouped_reduce
 from urban_mapper.utils.helpers import require_attribute_columns
 
 
@@ -12,6 +14,12 @@ class CountAggregator(BaseAggregator):
     Counts records per group, with an optional custom counting function. By default,
     it uses `len()` to count all records, but you can tweak it to count specific cases, see below.
 
+    !!! tip "Conditional And Weighted Counts"
+        Rather than a custom `count_function` run per group, prefer `where` to count
+        the rows matching an expression (e.g., `"injuries > 0"`) and `weight` to sum a
+        column instead of counting rows (e.g., `"passenger_count"`). Both keep the
+        count a single `np.bincount`. Within the factory, pass them to `count_by(.)`.
+
     !!! tip "Useful for"
 
         - [x] Counting taxi pickups per area
@@ -19,8 +27,10 @@ class CountAggregator(BaseAggregator):
         - [x] Totting up points of interest per district
 
     Attributes:
-        group_by_column: Column to group data by.
+        group_by_column: Column(s) to group data by, the first one being mapped to the urban layer.
         count_function: Function to count records in each group (defaults to len).
+        where: Expression rows must match to be counted (optional).
+        weight: Column whose values are summed instead of counting rows (optional).
 
     Examples:
         >>> import urban_mapper as um
@@ -34,33 +44,95 @@ class CountAggregator(BaseAggregator):
         ...     .with_data(group_by="junction")\
         ...     .count_by(output_column="incident_count")\
         ...     .build()
+        >>> enricher = mapper.enricher\
+        ...     .with_data(group_by="junction")\
+        ...     .count_by(output_column="major_incident_count", where="type == 'major'")\
+        ...     .build()
     """
 
+    consumes_list_groups = True
+
     def __init__(
         self,
-        group_by_column: str,
+        group_by_column: Union[str, List[str]],
         count_function: Callable[[pd.DataFrame], Any] = len,
+        where: Optional[str] = None,
+        weight: Optional[str] = None,
     ) -> None:
         self.group_by_column = group_by_column
         self.count_function = count_function
+        self.where = where
+        self.weight = weight
+        if weight is not None and count_function is not len:
+            raise ValueError("Weights do not apply to custom count functions.")
+
+    @property
+    def required_columns(self) -> Optional[List[str]]:
+        """Columns of the input data the aggregation reads, `None` if unknown."""
+        if self.count_function is not len:
+            return None
+        return self._with_condition_columns(self.group_by_columns)
+
+    @property
+    def mergeable_reduction(self) -> Optional[str]:
+        """Counts (or summed weights) merge across batches, custom count functions do not."""
+        return "count" if self.count_function is len else None
 
     @require_attribute_columns("input_dataframe", ["group_by_column"])
     def _aggregate(self, input_dataframe: pd.DataFrame) -> pd.DataFrame:
         """Count records per group using the count function.
 
         Groups the DataFrame by `group_by_column`, applies the count function,
-        and returns a DataFrame with counts and indices.
+        and returns a DataFrame with counts and indices. The default `len` count
+        is a `np.bincount` of factorised group codes.
 
         Args:
             input_dataframe: DataFrame to aggregate, must have `group_by_column`.
 
         Returns:
-            DataFrame with 'value' (counts) and 'indices' (original row indices).
+            DataFrame with 'value' (counts) and 'indices' (original row indices),
+            indexed by a `MultiIndex` when grouping by several columns.
 
         Raises:
             ValueError: If required column is missing.
         """
-        grouped = input_dataframe.groupby(self.group_by_column)
+        if self.count_function is len:
+            groups = self._matching(
+                input_dataframe,
+                GroupCodes.from_dataframe(input_dataframe, self.group_by_column),
+            )
+            return pd.DataFrame(
+                {
+                    "value": self._reduce(input_dataframe, groups),
+                    "indices": groups.indices(input_dataframe.index),
+                },
+                index=groups.keys,
+            )
+
+        grouped = self._groupby(input_dataframe)
         values = grouped.apply(self.count_function)
         indices = grouped.apply(lambda g: list(g.index))
         return pd.DataFrame({"value": values, "indices": indices})
+
+    def _reduce(self, input_dataframe: pd.DataFrame, groups: GroupCodes) -> np.ndarray:
+        """Count records over already computed group codes.
+
+        The default `len` count is a single `np.bincount`, of the `weight`s if set;
+        custom count functions fall back on `_aggregate`.
+
+        Args:
+            input_dataframe: DataFrame the codes were computed from.
+            groups: Group code of the rows of `input_dataframe` to count.
+
+        Returns:
+            One count per group, ordered like the codes.
+        """
+        if self.count_function is not len:
+            return super()._reduce(input_dataframe, groups)
+        return grouped_reduce(
+            np.empty(0),
+            groups.codes,
+            groups.n_groups,
+            "count",
+            weights=self._weights(input_dataframe, groups),
+        )
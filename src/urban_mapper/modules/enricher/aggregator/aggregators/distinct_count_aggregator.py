@@ -0,0 +1,135 @@
+from typing import Dict, List, Optional, Union
+import numpy as np
+import pandas as pd
+from beartype import beartype
+from urban_mapper.modules.enricher.aggregator.abc_aggregator import BaseAggregator
+from urban_mapper.modules.enricher.aggregator.helpers import (
+    GroupCodes,
+    HyperLogLogRegisters,
+)
+from urban_mapper.utils.helpers import require_attribute_columns
+
+
+DISTINCT_COUNT_METHODS: Dict[str, bool] = {
+    "distinct_count": False,
+    "approx_distinct_count": True,
+}
+
+
+@beartype
+class DistinctCountAggregator(BaseAggregator):
+    """Aggregator For Counting Distinct Values In Groups.
+
+    Counts the number of distinct values of `value_column` per group, e.g. the number of
+    distinct vehicles per street or of distinct complaint types per neighbourhood.
+
+    !!! tip "Exact or Approximate?"
+
+        - [x] `exact` (default): factorises values and group keys into integer codes and
+          counts the unique (group, value) pairs. Exact, memory grows with the number of pairs.
+        - [x] `approximate`: builds one `HyperLogLog` sketch per group. Memory is bounded
+          by `2 ** precision` bytes per group and sketches can be merged across batches,
+          see `registers`.
+
+    Within the factory, use `aggregate_by(method="distinct_count")` or
+    `aggregate_by(method="approx_distinct_count", precision=12)`.
+
+    Attributes:
+        group_by_column: Column(s) to group by, the first one being mapped to the urban layer.
+        value_column: Column whose distinct values are counted.
+        approximate: Whether to use `HyperLogLog` sketches instead of an exact count.
+        precision: Number of hash bits of the `HyperLogLog` sketches.
+        where: Expression rows must match to be counted (optional).
+        registers: Sketches of the last aggregation, when `approximate` is set.
+
+    Examples:
+        >>> import urban_mapper as um
+        >>> import pandas as pd
+        >>> mapper = um.UrbanMapper()
+        >>> data = pd.DataFrame({
+        ...     "street": ["A", "A", "A", "B"],
+        ...     "vehicle": ["x", "y", "x", "x"]
+        ... })
+        >>> enricher = mapper.enricher\
+        ...     .with_data(group_by="street", values_from="vehicle")\
+        ...     .aggregate_by(method="distinct_count", output_column="distinct_vehicles")\
+        ...     .build()
+    """
+
+    consumes_list_groups = True
+
+    def __init__(
+        self,
+        group_by_column: Union[str, List[str]],
+        value_column: str,
+        approximate: bool = False,
+        precision: int = 12,
+        where: Optional[str] = None,
+    ) -> None:
+        self.group_by_column = group_by_column
+        self.value_column = value_column
+        self.approximate = approximate
+        self.precision = precision
+        self.where = where
+        self.registers: Optional[HyperLogLogRegisters] = None
+
+    @property
+    def required_columns(self) -> Optional[List[str]]:
+        """Columns of the input data the aggregation reads, `None` if unknown."""
+        return self._with_condition_columns(self.group_by_columns + [self.value_column])
+
+    @property
+    def mergeable_reduction(self) -> Optional[str]:
+        """Approximate distinct counts merge through their sketches, exact ones do not."""
+        return "approx_distinct_count" if self.approximate else None
+
+    @require_attribute_columns("input_dataframe", ["group_by_column", "value_column"])
+    def _aggregate(self, input_dataframe: pd.DataFrame) -> pd.DataFrame:
+        """Count distinct values per group.
+
+        Args:
+            input_dataframe: DataFrame with `group_by_column` and `value_column`.
+
+        Returns:
+            DataFrame with 'value' (distinct counts) and 'indices' (original row indices).
+
+        Raises:
+            ValueError: If required columns are missing.
+        """
+        groups = self._matching(
+            input_dataframe,
+            GroupCodes.from_dataframe(input_dataframe, self.group_by_column),
+        )
+        return pd.DataFrame(
+            {
+                "value": self._reduce(input_dataframe, groups),
+                "indices": groups.indices(input_dataframe.index),
+            },
+            index=groups.keys,
+        )
+
+    def _reduce(self, input_dataframe: pd.DataFrame, groups: GroupCodes) -> np.ndarray:
+        """Count distinct values over already computed group codes.
+
+        Args:
+            input_dataframe: DataFrame the codes were computed from.
+            groups: Group code of the rows of `input_dataframe` to reduce.
+
+        Returns:
+            One distinct count (or estimate, if `approximate`) per group, ordered like the codes.
+        """
+        values = input_dataframe[self.value_column].to_numpy()[groups.rows]
+
+        if self.approximate:
+            self.registers = HyperLogLogRegisters.from_values(
+                codes=groups.codes,
+                values=values,
+                keys=groups.keys,
+                precision=self.precision,
+            )
+            return self.registers.estimate()
+
+        value_codes, uniques = pd.factorize(values)
+        present = value_codes >= 0
+        pairs = np.unique(groups.codes[present] * len(uniques) + value_codes[present])
+        return np.bincount(pairs // max(len(uniques), 1), minlength=groups.n_groups)
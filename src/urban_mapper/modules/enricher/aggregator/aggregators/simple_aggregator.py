@@ -1,7 +1,14 @@
-from typing import Callable, Dict
+from typing import Callable, Dict, List, Optional, Union
+import numpy as np
 import pandas as pd
 from beartype import beartype
 from urban_mapper.modules.enricher.aggregator.abc_aggregator import BaseAggregator
+from urban_mapper.modules.enricher.aggregator.helpers import (
+    GroupCodes,
+    grouped_reduce,
+    VECTORISED_REDUCTIONS,
+    WEIGHTED_REDUCTIONS,
+)
 
 
 AGGREGATION_FUNCTIONS: Dict[str, Callable[[pd.Series], float]] = {
@@ -24,14 +31,22 @@ class SimpleAggregator(BaseAggregator):
 
     Supports predefined functions in `AGGREGATION_FUNCTIONS` or custom ones.
 
+    !!! tip "Conditions And Weights"
+        `where` restricts the aggregation to the rows matching an expression
+        (e.g., `"fare > 0"`), and `weight` turns `sum` and `mean` into weighted ones
+        (e.g., fares weighted by `passenger_count`). Within the factory, pass them
+        to `aggregate_by(.)`.
+
     !!! question "How to Use Custom Functions"
         Simply pass you own function receiving a series as parameter per the `aggregation_function` argument.
         Within the factory it'll be throughout `aggregate_by(.)` and `method` argument.
 
     Attributes:
-        group_by_column: Column to group by.
+        group_by_column: Column(s) to group by, the first one being mapped to the urban layer.
         value_column: Column with values to aggregate.
         aggregation_function: Function to apply to grouped values.
+        where: Expression rows must match to be aggregated (optional).
+        weight: Column weighing every row, for `sum` and `mean` (optional).
 
     Examples:
         >>> import urban_mapper as um
@@ -47,31 +62,108 @@ class SimpleAggregator(BaseAggregator):
         ...     .build()
     """
 
+    consumes_list_groups = True
+
     def __init__(
         self,
-        group_by_column: str,
+        group_by_column: Union[str, List[str]],
         value_column: str,
         aggregation_function: Callable[[pd.Series], float],
+        where: Optional[str] = None,
+        weight: Optional[str] = None,
     ) -> None:
         self.group_by_column = group_by_column
         self.value_column = value_column
         self.aggregation_function = aggregation_function
+        self.where = where
+        self.weight = weight
+        if (
+            weight is not None
+            and self._vectorised_reduction() not in WEIGHTED_REDUCTIONS
+        ):
+            raise ValueError(
+                "Weights apply to the 'sum' and 'mean' aggregation functions only."
+            )
+
+    @property
+    def required_columns(self) -> Optional[List[str]]:
+        """Columns of the input data the aggregation reads, `None` if unknown."""
+        return self._with_condition_columns(self.group_by_columns + [self.value_column])
+
+    @property
+    def mergeable_reduction(self) -> Optional[str]:
+        """`sum`, `mean`, `min` and `max` merge across batches, other functions do not."""
+        return self._vectorised_reduction()
 
     def _aggregate(self, input_dataframe: pd.DataFrame) -> pd.DataFrame:
         """Aggregate data with the aggregation function.
 
         `Groups the DataFrame`, applies the function to `value_column`, and returns results.
+        Numeric `sum`, `mean`, `min` and `max` are reduced over factorised group codes,
+        other functions go through `DataFrame.groupby`.
 
         Args:
             input_dataframe: DataFrame with `group_by_column` and `value_column`.
 
         Returns:
-            DataFrame with 'value' (aggregated values) and 'indices' (row indices).
+            DataFrame with 'value' (aggregated values) and 'indices' (row indices),
+            indexed by a `MultiIndex` when grouping by several columns.
 
         Raises:
             KeyError: If required columns are missing.
         """
-        grouped = input_dataframe.groupby(self.group_by_column)
+        if self._vectorised_reduction() is not None and (
+            self.weight is not None
+            or pd.api.types.is_numeric_dtype(input_dataframe[self.value_column])
+        ):
+            groups = self._matching(
+                input_dataframe,
+                GroupCodes.from_dataframe(input_dataframe, self.group_by_column),
+            )
+            return pd.DataFrame(
+                {
+                    "value": self._reduce(input_dataframe, groups),
+                    "indices": groups.indices(input_dataframe.index),
+                },
+                index=groups.keys,
+            )
+
+        grouped = self._groupby(input_dataframe)
         aggregated = grouped[self.value_column].agg(self.aggregation_function)
         indices = grouped.apply(lambda g: list(g.index))
         return pd.DataFrame({"value": aggregated, "indices": indices})
+
+    def _reduce(self, input_dataframe: pd.DataFrame, groups: GroupCodes) -> np.ndarray:
+        """Reduce `value_column` over already computed group codes.
+
+        `sum`, `mean`, `min` and `max` of `AGGREGATION_FUNCTIONS` are computed with
+        vectorised `NumPy` primitives, weighted by `weight` if set; any other
+        function falls back on `_aggregate`.
+
+        Args:
+            input_dataframe: DataFrame the codes were computed from.
+            groups: Group code of the rows of `input_dataframe` to reduce.
+
+        Returns:
+            One aggregated value per group, ordered like the codes.
+        """
+        reduction = self._vectorised_reduction()
+        if reduction is None:
+            return super()._reduce(input_dataframe, groups)
+        values = pd.to_numeric(
+            input_dataframe[self.value_column], errors="coerce"
+        ).to_numpy(dtype=np.float64)
+        return grouped_reduce(
+            values[groups.rows],
+            groups.codes,
+            groups.n_groups,
+            reduction,
+            weights=self._weights(input_dataframe, groups),
+        )
+
+    def _vectorised_reduction(self) -> Optional[str]:
+        """Name of the vectorised reduction matching `aggregation_function`, if any."""
+        for name, function in AGGREGATION_FUNCTIONS.items():
+            if function is self.aggregation_function and name in VECTORISED_REDUCTIONS:
+                return name
+        return None
@@ -0,0 +1,21 @@
+from .group_codes import GroupCodes
+from .hyperloglog import HyperLogLogRegisters
+from .grouped_reduce import grouped_reduce, VECTORISED_REDUCTIONS, WEIGHTED_REDUCTIONS
+from .list_groups import is_list_column, flatten_list_column, explode_list_column
+from .row_conditions import where_mask, expression_columns
+from .aggregate_state import AggregateState, MERGEABLE_REDUCTIONS
+
+__all__ = [
+    "GroupCodes",
+    "HyperLogLogRegisters",
+    "grouped_reduce",
+    "VECTORISED_REDUCTIONS",
+    "WEIGHTED_REDUCTIONS",
+    "is_list_column",
+    "flatten_list_column",
+    "explode_list_column",
+    "where_mask",
+    "expression_columns",
+    "AggregateState",
+    "MERGEABLE_REDUCTIONS",
+]
@@ -0,0 +1,241 @@
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+import numpy as np
+import pandas as pd
+from beartype import beartype
+
+from .group_codes import GroupCodes
+from .hyperloglog import HyperLogLogRegisters
+
+MERGEABLE_REDUCTIONS = ("count", "sum", "mean", "min", "max", "approx_distinct_count")
+
+
+@beartype
+class AggregateState:
+    """Mergeable Per-Group State Of An Aggregation.
+
+    Rather than the aggregated values themselves, keeps what is needed to update them
+    with a new batch of data: counts, sums, extrema or `HyperLogLog` sketches per group.
+    Merging the states of two batches gives exactly the state of their union, so
+    appending a batch costs time proportional to the batch, not to the history.
+
+    | Reduction               | State                                   |
+    |-------------------------|-----------------------------------------|
+    | `count`                 | count (or summed weights)               |
+    | `sum`                   | (weighted) sum                          |
+    | `mean`                  | (weighted) sum and count of values      |
+    | `min` / `max`           | running extremum                        |
+    | `approx_distinct_count` | `HyperLogLog` registers                 |
+
+    Attributes:
+        reduction: One of `MERGEABLE_REDUCTIONS`.
+        keys: Group keys, e.g. `urban layer` elements, one per position of the arrays.
+        arrays: State arrays, by name, each with one entry (row) per key.
+        precision: Precision of the `HyperLogLog` sketches, for approximate distinct counts.
+        fingerprint: `state_fingerprint` of the aggregator the state was computed with.
+
+    Examples:
+        >>> state = AggregateState.from_batch(aggregator, first_day)
+        >>> state = state.merge(AggregateState.from_batch(aggregator, second_day))
+        >>> state.save("trip_count.npz")
+        >>> trips_per_street = pd.Series(state.values(), index=state.keys)
+    """
+
+    def __init__(
+        self,
+        reduction: str,
+        keys: pd.Index,
+        arrays: Dict[str, np.ndarray],
+        precision: Optional[int] = None,
+        fingerprint: Optional[str] = None,
+    ) -> None:
+        if reduction not in MERGEABLE_REDUCTIONS:
+            raise ValueError(
+                f"Reduction '{reduction}' cannot be merged. Available: {MERGEABLE_REDUCTIONS}"
+            )
+        self.reduction = reduction
+        self.keys = keys
+        self.arrays = arrays
+        self.precision = precision
+        self.fingerprint = fingerprint
+
+    @classmethod
+    def from_batch(
+        cls, aggregator: Any, input_dataframe: pd.DataFrame
+    ) -> "AggregateState":
+        """Compute the state of an aggregator over a batch of data.
+
+        Args:
+            aggregator: Aggregator with a `mergeable_reduction`, grouping by one column.
+            input_dataframe: Batch of data, mapped to the `urban layer`.
+
+        Returns:
+            The state of the batch, one entry per group found in it.
+
+        Raises:
+            ValueError: If the aggregator cannot be merged or breaks its groups down.
+        """
+        state = cls._from_batch(aggregator, input_dataframe)
+        state.fingerprint = aggregator.state_fingerprint
+        return state
+
+    @classmethod
+    def _from_batch(
+        cls, aggregator: Any, input_dataframe: pd.DataFrame
+    ) -> "AggregateState":
+        """State of a batch, before its `fingerprint` is set."""
+        reduction = aggregator.mergeable_reduction
+        if reduction is None:
+            raise ValueError(
+                f"{type(aggregator).__name__} results cannot be merged across batches. "
+                f"Mergeable reductions: {MERGEABLE_REDUCTIONS}"
+            )
+        if aggregator.breaks_down:
+            raise ValueError(
+                "Broken down aggregations cannot be merged across batches."
+            )
+        groups = aggregator._matching(
+            input_dataframe,
+            GroupCodes.from_dataframe(input_dataframe, aggregator.group_by_column),
+        )
+        n_groups = groups.n_groups
+        weights = aggregator._weights(input_dataframe, groups)
+        if reduction == "count":
+            counts = np.bincount(groups.codes, weights=weights, minlength=n_groups)
+            return cls(reduction, groups.keys, {"count": counts.astype(np.float64)})
+
+        values = input_dataframe[aggregator.value_column].to_numpy()[groups.rows]
+        if reduction == "approx_distinct_count":
+            sketch = HyperLogLogRegisters.from_values(
+                groups.codes, values, groups.keys, precision=aggregator.precision
+            )
+            return cls(
+                reduction,
+                groups.keys,
+                {"registers": sketch.registers},
+                precision=aggregator.precision,
+            )
+
+        values = pd.to_numeric(pd.Series(values), errors="coerce").to_numpy(
+            dtype=np.float64
+        )
+        present = ~np.isnan(values)
+        codes, values = groups.codes[present], values[present]
+        weights = None if weights is None else weights[present]
+        if reduction in ("sum", "mean"):
+            weighted = values if weights is None else values * weights
+            arrays = {"sum": np.bincount(codes, weights=weighted, minlength=n_groups)}
+            if reduction == "mean":
+                arrays["count"] = np.bincount(
+                    codes, weights=weights, minlength=n_groups
+                )
+            return cls(reduction, groups.keys, arrays)
+
+        ufunc, initial = (
+            (np.minimum, np.inf) if reduction == "min" else (np.maximum, -np.inf)
+        )
+        extrema = np.full(n_groups, initial)
+        ufunc.at(extrema, codes, values)
+        extrema[np.isinf(extrema)] = np.nan
+        return cls(reduction, groups.keys, {reduction: extrema})
+
+    def merge(self, other: "AggregateState") -> "AggregateState":
+        """Combine two states of the same aggregation, aligning them on their keys.
+
+        Args:
+            other: State of another batch.
+
+        Returns:
+            New `AggregateState` covering the union of both keys.
+
+        Raises:
+            ValueError: If both states do not come from the same aggregation.
+        """
+        if other.reduction != self.reduction or other.precision != self.precision:
+            raise ValueError(
+                f"Cannot merge a '{self.reduction}' state with a '{other.reduction}' one."
+            )
+        if other.fingerprint != self.fingerprint:
+            raise ValueError(
+                "Cannot merge states of aggregations with different configurations."
+            )
+        keys = self.keys.union(other.keys)
+        mine, theirs = keys.get_indexer(self.keys), keys.get_indexer(other.keys)
+        arrays = {}
+        for name, array in self.arrays.items():
+            if name in ("min", "max"):
+                merged = np.full((len(keys),) + array.shape[1:], np.nan)
+                merged[mine] = array
+                combine = np.fmin if name == "min" else np.fmax
+                merged[theirs] = combine(merged[theirs], other.arrays[name])
+            else:
+                merged = np.zeros((len(keys),) + array.shape[1:], dtype=array.dtype)
+                merged[mine] = array
+                combine = np.maximum if name == "registers" else np.add
+                merged[theirs] = combine(merged[theirs], other.arrays[name])
+            arrays[name] = merged
+        return AggregateState(
+            self.reduction,
+            keys,
+            arrays,
+            precision=self.precision,
+            fingerprint=self.fingerprint,
+        )
+
+    def values(self) -> np.ndarray:
+        """Aggregated value of every group, ordered like `keys`."""
+        if self.reduction == "mean":
+            with np.errstate(invalid="ignore", divide="ignore"):
+                return self.arrays["sum"] / self.arrays["count"]
+        if self.reduction == "approx_distinct_count":
+            return HyperLogLogRegisters(
+                self.keys, precision=self.precision, registers=self.arrays["registers"]
+            ).estimate()
+        return self.arrays[self.reduction]
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Save the state to a compressed `.npz` file.
+
+        Keys of object dtype are saved as strings.
+
+        Args:
+            path: Destination file.
+        """
+        keys = self.keys.to_numpy()
+        if keys.dtype == object:
+            keys = keys.astype(str)
+        np.savez_compressed(
+            path,
+            reduction=np.asarray(self.reduction),
+            precision=np.asarray(-1 if self.precision is None else self.precision),
+            fingerprint=np.asarray(self.fingerprint or ""),
+            keys=keys,
+            **{f"array_{name}": array for name, array in self.arrays.items()},
+        )
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "AggregateState":
+        """Load a state saved with `save`.
+
+        Args:
+            path: File written by `save`.
+
+        Returns:
+            The saved `AggregateState`.
+        """
+        with np.load(path, allow_pickle=False) as saved:
+            precision = int(saved["precision"])
+            fingerprint = (
+                str(saved["fingerprint"]) if "fingerprint" in saved.files else ""
+            )
+            return cls(
+                str(saved["reduction"]),
+                pd.Index(saved["keys"]),
+                {
+                    name[len("array_") :]: saved[name]
+                    for name in saved.files
+                    if name.startswith("array_")
+                },
+                precision=None if precision < 0 else precision,
+                fingerprint=fingerprint or None,
+            )
@@ -0,0 +1,115 @@
+from typing import List, Union
+import numpy as np
+import pandas as pd
+from beartype import beartype
+from .list_groups import is_list_column, flatten_list_column
+
+
+@beartype
+class GroupCodes:
+    """Integer Codes Of The Groups An Aggregator Reduces Over.
+
+    !!! warning "Internal Use Only"
+        This class is meant to be used by the aggregators themselves, you should
+        not have to deal with it unless you are writing your own vectorised aggregator.
+
+    Instead of running a Python function per group (`groupby.apply`), vectorised
+    aggregators factorise the `group_by_column` once into dense integer codes and
+    reduce the values with `NumPy` primitives (`np.bincount`, `ufunc.at`, ...).
+
+    !!! tip "Multiple Group Columns"
+        When grouping by several columns, each column is factorised separately and the
+        codes are combined into a single composite integer key (mixed radix, re-compacted
+        after every column so it never overflows), rather than hashing tuples.
+
+    Attributes:
+        codes: Group code of every record, in `[0, n_groups)`.
+        rows: Position, in the input `DataFrame`, of the row each code belongs to.
+        keys: Unique group keys, position `i` holding the key of code `i`. A `MultiIndex`
+            when grouping by several columns.
+
+    Examples:
+        >>> import pandas as pd
+        >>> data = pd.DataFrame({"street": [3, 1, 3, None]})
+        >>> groups = GroupCodes.from_dataframe(data, "street")
+        >>> groups.codes, groups.rows, list(groups.keys)
+        (array([1, 0, 1]), array([0, 1, 2]), [1.0, 3.0])
+    """
+
+    def __init__(self, codes: np.ndarray, rows: np.ndarray, keys: pd.Index) -> None:
+        self.codes = codes.astype(np.int64, copy=False)
+        self.rows = rows.astype(np.int64, copy=False)
+        self.keys = keys
+
+    @classmethod
+    def from_dataframe(
+        cls, input_dataframe: pd.DataFrame, group_by_column: Union[str, List[str]]
+    ) -> "GroupCodes":
+        """Factorise the `group_by_column`(s) of a `DataFrame`.
+
+        Keys are sorted and missing keys are dropped, mirroring `DataFrame.groupby`'s defaults.
+        List-valued columns (e.g. a record mapped to several streets, see `is_list_column`)
+        contribute one code per element of their lists, all pointing back to the same row,
+        read straight from their `CSR` offsets. Only the first group column may be list-valued.
+
+        Args:
+            input_dataframe: `DataFrame` holding the `group_by_column`.
+            group_by_column: Column, or columns, whose values define the groups.
+
+        Returns:
+            The `GroupCodes` of the `DataFrame`.
+        """
+        group_by_columns = (
+            [group_by_column] if isinstance(group_by_column, str) else group_by_column
+        )
+        column = input_dataframe[group_by_columns[0]]
+        if is_list_column(column):
+            rows, column = flatten_list_column(column)
+        else:
+            rows = np.arange(len(column))
+
+        level_codes, levels = [], []
+        for position, name in enumerate(group_by_columns):
+            values = column if position == 0 else input_dataframe[name].iloc[rows]
+            codes, uniques = pd.factorize(values, sort=True)
+            level_codes.append(codes)
+            levels.append(pd.Index(uniques, name=name))
+        valid = np.logical_and.reduce([codes >= 0 for codes in level_codes])
+        rows = rows[valid]
+
+        if len(group_by_columns) == 1:
+            return cls(level_codes[0][valid], rows, levels[0])
+
+        codes = level_codes[0][valid]
+        key_codes = [np.arange(len(levels[0]))]
+        for level, level_code in zip(levels[1:], level_codes[1:]):
+            composite = codes * len(level) + level_code[valid]
+            composite_keys, codes = np.unique(composite, return_inverse=True)
+            previous, current = np.divmod(composite_keys, len(level))
+            key_codes = [key_code[previous] for key_code in key_codes] + [current]
+        keys = pd.MultiIndex.from_arrays(
+            [level[key_code] for level, key_code in zip(levels, key_codes)],
+            names=group_by_columns,
+        )
+        return cls(codes.reshape(-1), rows, keys)
+
+    @property
+    def n_groups(self) -> int:
+        """Number of distinct groups."""
+        return len(self.keys)
+
+    def indices(self, index: pd.Index) -> List[list]:
+        """Original row labels of each group.
+
+        Args:
+            index: Index of the `DataFrame` the codes were computed from.
+
+        Returns:
+            One list of row labels per group, ordered like `keys`.
+        """
+        if self.n_groups == 0:
+            return []
+        order = np.argsort(self.codes, kind="stable")
+        sizes = np.bincount(self.codes, minlength=self.n_groups)
+        labels = index.to_numpy()[self.rows[order]]
+        return [chunk.tolist() for chunk in np.split(labels, np.cumsum(sizes)[:-1])]
@@ -0,0 +1,75 @@
+from typing import Optional
+import numpy as np
+from beartype import beartype
+
+
+VECTORISED_REDUCTIONS = ("count", "sum", "mean", "min", "max")
+WEIGHTED_REDUCTIONS = ("count", "sum", "mean")
+
+
+@beartype
+def grouped_reduce(
+    values: np.ndarray,
+    codes: np.ndarray,
+    n_groups: int,
+    reduction: str,
+    weights: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Reduce values per integer group code with `NumPy` primitives.
+
+    Missing values are skipped, as `pandas` does. Groups without any value get
+    `0` for "count" and "sum", `NaN` otherwise.
+
+    With `weights`, "count" sums the weights, "sum" sums the weighted values and
+    "mean" is the weighted mean.
+
+    Args:
+        values: Values to reduce, one per code. Ignored for "count".
+        codes: Group code of every value, in `[0, n_groups)`.
+        n_groups: Number of groups.
+        reduction: One of `VECTORISED_REDUCTIONS`.
+        weights: Weight of every value, for the `WEIGHTED_REDUCTIONS` (optional).
+
+    Returns:
+        One reduced value per group.
+
+    Raises:
+        ValueError: If `reduction` is not vectorised, or cannot be weighted.
+
+    Examples:
+        >>> grouped_reduce(np.array([1.0, 2.0, 5.0]), np.array([0, 0, 1]), 2, "mean")
+        array([1.5, 5. ])
+    """
+    if reduction not in VECTORISED_REDUCTIONS:
+        raise ValueError(
+            f"Reduction '{reduction}' is not vectorised. Available: {VECTORISED_REDUCTIONS}"
+        )
+    if weights is not None and reduction not in WEIGHTED_REDUCTIONS:
+        raise ValueError(
+            f"Reduction '{reduction}' cannot be weighted. Available: {WEIGHTED_REDUCTIONS}"
+        )
+    if reduction == "count":
+        return np.bincount(codes, weights=weights, minlength=n_groups)
+
+    values = values.astype(np.float64, copy=False)
+    present = ~np.isnan(values)
+    values, codes = values[present], codes[present]
+    if weights is not None:
+        weights = weights[present]
+    if reduction == "sum":
+        weighted = values if weights is None else values * weights
+        return np.bincount(codes, weights=weighted, minlength=n_groups)
+    if reduction == "mean":
+        weighted = values if weights is None else values * weights
+        sums = np.bincount(codes, weights=weighted, minlength=n_groups)
+        counts = np.bincount(codes, weights=weights, minlength=n_groups)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return sums / counts
+
+    ufunc, initial = (
+        (np.minimum, np.inf) if reduction == "min" else (np.maximum, -np.inf)
+    )
+    reduced = np.full(n_groups, initial)
+    ufunc.at(reduced, codes, values)
+    reduced[np.bincount(codes, minlength=n_groups) == 0] = np.nan
+    return reduced
@@ -0,0 +1,68 @@
+from typing import Tuple
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+from beartype import beartype
+
+
+@beartype
+def is_list_column(series: pd.Series) -> bool:
+    """Whether a column holds lists of group keys, as `Arrow` list arrays.
+
+    Decided from the dtype alone (`list<...>[pyarrow]`), as emitted by urban layer
+    mappings matching one record to several layer items, never from the values.
+
+    Args:
+        series: Column to check.
+
+    Returns:
+        True if the column is list-valued.
+    """
+    return isinstance(series.dtype, pd.ArrowDtype) and (
+        pa.types.is_list(series.dtype.pyarrow_dtype)
+        or pa.types.is_large_list(series.dtype.pyarrow_dtype)
+    )
+
+
+@beartype
+def flatten_list_column(series: pd.Series) -> Tuple[np.ndarray, pd.Series]:
+    """Flatten a list-valued column through its `CSR` offsets.
+
+    Args:
+        series: List-valued column, see `is_list_column`.
+
+    Returns:
+        The position of the row every flattened value belongs to (the offsets,
+        expanded as `np.repeat` would) and the flattened values. Missing lists
+        contribute nothing.
+
+    Examples:
+        >>> rows, values = flatten_list_column(column)  # [[3, 7], <NA>, [7]]
+        >>> rows, values.tolist()
+        (array([0, 0, 2]), [3, 7, 7])
+    """
+    list_array = pa.array(series)
+    rows = pc.list_parent_indices(list_array).to_numpy().astype(np.int64)
+    values = pc.list_flatten(list_array).to_pandas()
+    return rows, values
+
+
+@beartype
+def explode_list_column(input_dataframe: pd.DataFrame, column: str) -> pd.DataFrame:
+    """Repeat each row once per element of its list-valued `column`.
+
+    The `DataFrame.explode` equivalent for `Arrow` list columns, used only by
+    aggregators that have to hand whole row groups to a Python function.
+
+    Args:
+        input_dataframe: `DataFrame` holding the list-valued `column`.
+        column: List-valued column, see `is_list_column`.
+
+    Returns:
+        One row per list element, with the original row labels.
+    """
+    rows, values = flatten_list_column(input_dataframe[column])
+    exploded = input_dataframe.iloc[rows].copy()
+    exploded[column] = values.to_numpy()
+    return exploded
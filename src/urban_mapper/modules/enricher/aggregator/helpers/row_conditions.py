@@ -0,0 +1,63 @@
+import ast
+from typing import List, Optional
+import numpy as np
+import pandas as pd
+from beartype import beartype
+
+
+@beartype
+def where_mask(input_dataframe: pd.DataFrame, where: str) -> np.ndarray:
+    """Evaluate a `where` expression into a boolean mask over the rows.
+
+    The expression is evaluated once over whole columns with `DataFrame.eval`
+    (e.g., `"injuries > 0"`, `"fare > 10 and payment == 'card'"`), never per group.
+    Rows where the expression is missing do not match.
+
+    Args:
+        input_dataframe: DataFrame the expression refers to.
+        where: Boolean expression over the columns of `input_dataframe`.
+
+    Returns:
+        One boolean per row of `input_dataframe`.
+
+    Raises:
+        ValueError: If the expression does not evaluate to one boolean per row.
+
+    Examples:
+        >>> data = pd.DataFrame({"injuries": [0, 2, 1]})
+        >>> where_mask(data, "injuries > 0")
+        array([False,  True,  True])
+    """
+    mask = input_dataframe.eval(where)
+    if not isinstance(mask, pd.Series) or len(mask) != len(input_dataframe):
+        raise ValueError(
+            f"The where expression '{where}' must yield one value per row."
+        )
+    if not (pd.api.types.is_bool_dtype(mask) or mask.dtype == object):
+        raise ValueError(f"The where expression '{where}' must be boolean.")
+    return mask.fillna(False).to_numpy(dtype=bool)
+
+
+@beartype
+def expression_columns(expression: str) -> Optional[List[str]]:
+    """Names an expression may read, `None` if it cannot be parsed as Python.
+
+    Used to project the data on the columns an aggregation reads. Names that are
+    not columns (e.g., functions) are kept, callers filter them out.
+
+    Args:
+        expression: Expression, as given to `where_mask`.
+
+    Returns:
+        The distinct names of the expression, or `None`.
+
+    Examples:
+        >>> expression_columns("injuries > 0 and borough == 'QUEENS'")
+        ['injuries', 'borough']
+    """
+    try:
+        tree = ast.parse(expression, mode="eval")
+    except SyntaxError:
+        return None
+    names = [node.id for node in ast.walk(tree) if isinstance(node, ast.Name)]
+    return list(dict.fromkeys(names))
@@ -1,16 +1,29 @@
 from typing import Optional, Union
 from beartype import beartype
 from .abc_enricher import EnricherBase
-from .aggregator import SimpleAggregator, CountAggregator
+from .aggregator import (
+    BaseAggregator,
+    SimpleAggregator,
+    CountAggregator,
+    DistinctCountAggregator,
+    CategoricalAggregator,
+)
 from .factory.config import EnricherConfig
 from .factory.validation import (
     validate_group_by,
     validate_action,
+    STANDALONE_ACTIONS,
 )
 from .factory.registries import ENRICHER_REGISTRY, register_enricher
 from urban_mapper.modules.enricher.aggregator.aggregators.simple_aggregator import (
     AGGREGATION_FUNCTIONS,
 )
+from urban_mapper.modules.enricher.aggregator.aggregators.distinct_count_aggregator import (
+    DISTINCT_COUNT_METHODS,
+)
+from urban_mapper.modules.enricher.aggregator.aggregators.categorical_aggregator import (
+    CATEGORICAL_METHODS,
+)
 import importlib
 import inspect
 import pkgutil
@@ -113,6 +126,15 @@ class EnricherFactory:
             - [x] `median`
             - [x] `min`
             - [x] `max`
+            - [x] `distinct_count` (exact number of distinct values)
+            - [x] `approx_distinct_count` (`HyperLogLog` estimate, accepts `precision`)
+            - [x] `mode` (most frequent category)
+            - [x] `top_k` (`k` most frequent categories with their counts, accepts `k`)
+            - [x] `category_shares` (one `<output_column>_<category>` share column per category)
+
+        All methods accept `where`, an expression rows must match to be aggregated
+        (e.g., `"fare > 0"`); `sum`, `mean` and the categorical methods accept `weight`,
+        a column weighing every row (e.g., `"passenger_count"`).
 
         Args:
             *args: Positional args for EnricherConfig.aggregate_by.
@@ -138,7 +160,9 @@ class EnricherFactory:
 
         Args:
             *args: Positional args for EnricherConfig.count_by.
-            **kwargs: Keyword args like `group_by`, `output_column`.
+            **kwargs: Keyword args like `output_column`, `where` (an expression rows
+                must match, e.g. `"injuries > 0"`) or `weight` (a column summed
+                instead of counting rows).
 
         Returns:
             The EnricherFactory instance for chaining.
@@ -149,20 +173,233 @@ class EnricherFactory:
             >>> enricher = mapper.enricher\
             ...     .with_data(group_by="pickup")\
             ...     .count_by(output_column="pickup_count")
+            >>> enricher = mapper.enricher\
+            ...     .with_data(group_by="nearest_street")\
+            ...     .count_by(output_column="severe_crashes", where="injuries > 0")
         """
         self.config.count_by(*args, **kwargs)
         return self
 
+    def overlay_by(self, *args, **kwargs) -> "EnricherFactory":
+        """Set the enricher to measure another layer's geometries on every element.
+
+        Configures a `LayerOverlayEnricher`, pairing the elements of the `urban layer` with
+        the input geometries through one bulk spatial index query—great for counting
+        intersections per neighbourhood or summing sidewalk lengths per tract.
+
+        Args:
+            *args: Positional args for EnricherConfig.overlay_by.
+            **kwargs: Keyword args like `measure` ("count", "length" or "area"),
+                `output_column`, `predicate` or `metric_crs`.
+
+        Returns:
+            The EnricherFactory instance for chaining.
+
+        Examples:
+            >>> import urban_mapper as um
+            >>> mapper = um.UrbanMapper()
+            >>> enricher = mapper.enricher\
+            ...     .overlay_by(measure="count", output_column="intersection_count")\
+            ...     .build()
+            >>> neighborhoods = enricher.enrich(intersections, neighborhoods)
+        """
+        self.config.overlay_by(*args, **kwargs)
+        return self
+
+    def interpolate_by(self, *args, **kwargs) -> "EnricherFactory":
+        """Set the enricher to apportion polygon or line attributes onto every element.
+
+        Configures an `ArealInterpolationEnricher`, splitting `extensive` attributes and
+        averaging `intensive` ones between the elements every input geometry intersects,
+        in proportion to the shared area (or length)—great for PLUTO lots per neighbourhood.
+
+        Args:
+            *args: Positional args for EnricherConfig.interpolate_by.
+            **kwargs: Keyword args like `extensive`, `intensive`, `measure` ("area" or
+                "length"), `output_prefix`, `metric_crs` or `chunk_size`.
+
+        Returns:
+            The EnricherFactory instance for chaining.
+
+        Examples:
+            >>> import urban_mapper as um
+            >>> mapper = um.UrbanMapper()
+            >>> enricher = mapper.enricher\
+            ...     .interpolate_by(extensive=["UnitsRes", "LotArea"], intensive="BuiltFAR")\
+            ...     .build()
+            >>> neighborhoods = enricher.enrich(lots, neighborhoods)
+        """
+        self.config.interpolate_by(*args, **kwargs)
+        return self
+
+    def flows_between(self, *args, **kwargs) -> "EnricherFactory":
+        """Set the enricher to count origin–destination flows between elements.
+
+        Configures a `FlowMatrixEnricher`, building a sparse origin × destination matrix
+        from two mapped columns (e.g., pickup and dropoff streets) in one vectorised pass.
+
+        Args:
+            *args: Positional args for EnricherConfig.flows_between.
+            **kwargs: Keyword args like `origin`, `destination`, `output_column` or
+                `values_from` (a column summed instead of counting rows).
+
+        Returns:
+            The EnricherFactory instance for chaining.
+
+        Examples:
+            >>> import urban_mapper as um
+            >>> mapper = um.UrbanMapper()
+            >>> enricher = mapper.enricher\
+            ...     .flows_between(origin="pickup_street", destination="dropoff_street")\
+            ...     .build()
+            >>> streets = enricher.enrich(trips, streets)
+            >>> enricher.flows.top_k(10)
+        """
+        self.config.flows_between(*args, **kwargs)
+        return self
+
+    def zonal_statistics_from(self, *args, **kwargs) -> "EnricherFactory":
+        """Set the enricher to summarise a raster over every element.
+
+        Configures a `ZonalStatisticsEnricher`, computing zonal statistics of a local
+        GeoTIFF (e.g., land-surface temperatures) per element, reading the raster in
+        windows rather than whole. Requires `pip install urban-mapper[raster]`.
+
+        Args:
+            *args: Positional args for EnricherConfig.zonal_statistics_from.
+            **kwargs: Keyword args like `raster_path`, `statistics`, `output_column`,
+                `band`, `buffer` (metres), `strategy` ("window" or "blocks") or `n_jobs`.
+
+        Returns:
+            The EnricherFactory instance for chaining.
+
+        Examples:
+            >>> import urban_mapper as um
+            >>> mapper = um.UrbanMapper()
+            >>> enricher = mapper.enricher\
+            ...     .zonal_statistics_from("land_surface_temperature.tif", ["mean", "max"], "lst")\
+            ...     .build()
+            >>> neighborhoods = enricher.enrich(data, neighborhoods)
+        """
+        self.config.zonal_statistics_from(*args, **kwargs)
+        return self
+
+    def with_time_bins(self, *args, **kwargs) -> "EnricherFactory":
+        """Aggregate per time bin as well as per group.
+
+        Configures a `TemporalBinnedEnricher`, aggregating over (`group_by`, time bin)
+        pairs in one pass. The results are stored as an element × time bin cube on the
+        built enricher (`enricher.cube`) rather than as columns of the `urban layer`.
+
+        Args:
+            *args: Positional args for EnricherConfig.with_time_bins.
+            **kwargs: Keyword args like `time_column`, `frequency`, `bin_edges`, `sparse`.
+
+        Returns:
+            The EnricherFactory instance for chaining.
+
+        Examples:
+            >>> import urban_mapper as um
+            >>> mapper = um.UrbanMapper()
+            >>> enricher = mapper.enricher\
+            ...     .with_data(group_by="nearest_street", values_from="fare")\
+            ...     .aggregate_by(method="mean", output_column="avg_fare")\
+            ...     .with_time_bins(time_column="pickup_datetime", frequency="1D")\
+            ...     .build()
+        """
+        self.config.with_time_bins(*args, **kwargs)
+        return self
+
+    def with_breakdown(self, *args, **kwargs) -> "EnricherFactory":
+        """Choose how results grouped by several columns are laid out.
+
+        When `with_data` groups by several columns, the first is matched against the
+        `urban layer` and the others break its groups down (e.g., counts per street
+        per vehicle type).
+
+        Args:
+            *args: Positional args for EnricherConfig.with_breakdown.
+            **kwargs: Keyword args like `layout` ("columns" or "table").
+
+        Returns:
+            The EnricherFactory instance for chaining.
+
+        Examples:
+            >>> import urban_mapper as um
+            >>> mapper = um.UrbanMapper()
+            >>> enricher = mapper.enricher\
+            ...     .with_data(group_by=["nearest_street", "vehicle_type"])\
+            ...     .count_by(output_column="trips")\
+            ...     .with_breakdown("columns")\
+            ...     .build()
+        """
+        self.config.with_breakdown(*args, **kwargs)
+        return self
+
+    def with_spatial_lag(self, *args, **kwargs) -> "EnricherFactory":
+        """Smooth the aggregated values over neighbouring elements as well.
+
+        Configures a `SpatialLagEnricher`, adding a spatial lag of the aggregated column
+        computed as a sparse product with the (cached) adjacency of the `urban layer`.
+
+        Args:
+            *args: Positional args for EnricherConfig.with_spatial_lag.
+            **kwargs: Keyword args like `lag` ("mean" or "sum"), `hops`, `include_self`,
+                `lag_column` or `lag_output_column`.
+
+        Returns:
+            The EnricherFactory instance for chaining.
+
+        Examples:
+            >>> import urban_mapper as um
+            >>> mapper = um.UrbanMapper()
+            >>> enricher = mapper.enricher\
+            ...     .with_data(group_by="nearest_street")\
+            ...     .count_by(output_column="trip_count")\
+            ...     .with_spatial_lag(lag="sum", hops=2)\
+            ...     .build()
+        """
+        self.config.with_spatial_lag(*args, **kwargs)
+        return self
+
+    def with_datasets_combined(self) -> "EnricherFactory":
+        """Aggregate several datasets in a single pass.
+
+        With several loaders, aggregates the datasets selected by `with_data(data_id=...)`
+        (all by default) together, writing one `<output_column>_<data_id>` column per
+        dataset plus the combined `<output_column>`.
+
+        Returns:
+            The EnricherFactory instance for chaining.
+
+        Examples:
+            >>> import urban_mapper as um
+            >>> mapper = um.UrbanMapper()
+            >>> enricher = mapper.enricher\
+            ...     .with_data(group_by="nearest_street", data_id=["taxi", "bike"])\
+            ...     .count_by(output_column="trips")\
+            ...     .with_datasets_combined()\
+            ...     .build()
+        """
+        self.config.with_datasets_combined()
+        return self
+
     def with_type(self, primitive_type: str) -> "EnricherFactory":
         """Choose the enricher type to create.
 
         Sets the type of enricher, dictating the enrichment approach, from the registry.
 
-        !!! note "At the moment only one exists"
+        !!! note "Available Enricher Types"
 
             - [x] `SingleAggregatorEnricher` (default)
-
-            Hence, no need use `with_type` unless you want to use a different one in the future.
+            - [x] `TemporalBinnedEnricher` (see `with_time_bins`)
+            - [x] `SpatialLagEnricher` (see `with_spatial_lag`)
+            - [x] `LayerOverlayEnricher` (see `overlay_by`)
+            - [x] `ArealInterpolationEnricher` (see `interpolate_by`)
+            - [x] `FlowMatrixEnricher` (see `flows_between`)
+            - [x] `ZonalStatisticsEnricher` (see `zonal_statistics_from`)
+
+            Hence, no need use `with_type` as each type comes with its own configuration method.
             Furthermore, we kept it for compatibility with other modules.
 
         Args:
@@ -272,43 +509,96 @@ class EnricherFactory:
             ...     .count_by(output_column="pickup_count")\
             ...     .build()
         """
-        validate_group_by(self.config)
         validate_action(self.config)
+        enricher_class = ENRICHER_REGISTRY[self.config.enricher_type]
+        if self.config.action in STANDALONE_ACTIONS:
+            self._instance = enricher_class(
+                config=copy.deepcopy(self.config),
+                **self.config.enricher_config,
+            )
+        else:
+            self._instance = enricher_class(
+                aggregator=self._build_aggregator(),
+                config=copy.deepcopy(self.config),
+                **self.config.enricher_config,
+            )
+        if self._preview:
+            self.preview(format=self._preview["format"])
+        return self._instance
+
+    def _build_aggregator(self) -> BaseAggregator:
+        """Create the aggregator of the configured `aggregate_by` or `count_by` action.
+
+        Returns:
+            The aggregator the enricher groups the data with.
+
+        Raises:
+            ValueError: If `group_by` isn’t set or the action is unknown.
+        """
+        validate_group_by(self.config)
+        group_by_column = (
+            self.config.group_by[0]
+            if len(self.config.group_by) == 1
+            else self.config.group_by
+        )
+
+        conditions = {
+            key: self.config.aggregator_config[key]
+            for key in ("where", "weight")
+            if key in self.config.aggregator_config
+        }
 
         if self.config.action == "aggregate":
             method = self.config.aggregator_config["method"]
-            if isinstance(method, str):
-                if method not in AGGREGATION_FUNCTIONS:
-                    raise ValueError(f"Unknown aggregation method '{method}'")
-                aggregation_function = AGGREGATION_FUNCTIONS[method]
-            elif callable(method):
-                aggregation_function = method
-            else:
-                raise ValueError("Aggregation method must be a string or a callable")
-            aggregator = SimpleAggregator(
-                group_by_column=self.config.group_by[0],
-                value_column=self.config.values_from[0],
-                aggregation_function=aggregation_function,
+            method_parameters = self.config.aggregator_config.get(
+                "method_parameters", {}
             )
+            if isinstance(method, str) and method in DISTINCT_COUNT_METHODS:
+                if "weight" in conditions:
+                    raise ValueError("Weights do not apply to distinct counts.")
+                aggregator = DistinctCountAggregator(
+                    group_by_column=group_by_column,
+                    value_column=self.config.values_from[0],
+                    approximate=DISTINCT_COUNT_METHODS[method],
+                    **conditions,
+                    **method_parameters,
+                )
+            elif isinstance(method, str) and method in CATEGORICAL_METHODS:
+                aggregator = CategoricalAggregator(
+                    group_by_column=group_by_column,
+                    value_column=self.config.values_from[0],
+                    method=method,
+                    **conditions,
+                    **method_parameters,
+                )
+            else:
+                if isinstance(method, str):
+                    if method not in AGGREGATION_FUNCTIONS:
+                        raise ValueError(f"Unknown aggregation method '{method}'")
+                    aggregation_function = AGGREGATION_FUNCTIONS[method]
+                elif callable(method):
+                    aggregation_function = method
+                else:
+                    raise ValueError(
+                        "Aggregation method must be a string or a callable"
+                    )
+                aggregator = SimpleAggregator(
+                    group_by_column=group_by_column,
+                    value_column=self.config.values_from[0],
+                    aggregation_function=aggregation_function,
+                    **conditions,
+                )
         elif self.config.action == "count":
             aggregator = CountAggregator(
-                group_by_column=self.config.group_by[0],
+                group_by_column=group_by_column,
                 count_function=len,
+                **conditions,
             )
         else:
             raise ValueError(
                 "Unknown action. Please open an issue on GitHub to request such feature."
             )
-
-        enricher_class = ENRICHER_REGISTRY[self.config.enricher_type]
-        self._instance = enricher_class(
-            aggregator=aggregator,
-            output_column=self.config.enricher_config["output_column"],
-            config=copy.deepcopy(self.config),
-        )
-        if self._preview:
-            self.preview(format=self._preview["format"])
-        return self._instance
+        return aggregator
 
 
 def _initialise():
@@ -1,5 +1,17 @@
 from .single_aggregator_enricher import SingleAggregatorEnricher
+from .temporal_binned_enricher import TemporalBinnedEnricher
+from .spatial_lag_enricher import SpatialLagEnricher
+from .layer_overlay_enricher import LayerOverlayEnricher
+from .areal_interpolation_enricher import ArealInterpolationEnricher
+from .flow_matrix_enricher import FlowMatrixEnricher
+from .zonal_statistics_enricher import ZonalStatisticsEnricher
 
 __all__ = [
     "SingleAggregatorEnricher",
+    "TemporalBinnedEnricher",
+    "SpatialLagEnricher",
+    "LayerOverlayEnricher",
+    "ArealInterpolationEnricher",
+    "FlowMatrixEnricher",
+    "ZonalStatisticsEnricher",
 ]
@@ -0,0 +1,133 @@
+from typing import Any, List, Optional
+
+import geopandas as gpd
+from beartype import beartype
+
+from urban_mapper.modules.enricher.factory import PreviewBuilder, ENRICHER_REGISTRY
+from urban_mapper.modules.urban_layer.abc_urban_layer import UrbanLayerBase
+from urban_mapper.modules.enricher.abc_enricher import EnricherBase
+from urban_mapper.modules.enricher.factory.config import EnricherConfig
+from urban_mapper.modules.enricher.helpers import (
+    areal_interpolation,
+    INTERPOLATION_MEASURES,
+)
+
+
+@beartype
+class ArealInterpolationEnricher(EnricherBase):
+    """Enricher Apportioning Polygon Or Line Attributes Onto An `Urban Layer`.
+
+    Mapping polygons (e.g., PLUTO lots) or lines to the nearest element of a layer
+    attributes each of them, whole, to a single element. This enricher instead splits
+    their attributes between all the elements they intersect, in proportion to the
+    area (or length, for lines) of every intersection (see `areal_interpolation`).
+
+    !!! tip "Extensive And Intensive Variables"
+
+        - [x] `extensive` columns (counts, totals) are split, so that totals are
+          preserved, e.g. residential units per neighbourhood.
+        - [x] `intensive` columns (rates, densities) are averaged, weighted by the
+          shared area or length, e.g. the built floor area ratio per neighbourhood.
+
+    Sources are intersected in chunks of `chunk_size` rows, each through one bulk
+    spatial index query, so that large datasets stay in bounded memory.
+
+    Attributes:
+        config: Config object for the enricher.
+        extensive: Columns split between elements.
+        intensive: Columns averaged over elements.
+        measure: "area" or "length", one of `INTERPOLATION_MEASURES`.
+        output_prefix: Prefix of the output columns, named after the input columns.
+        metric_crs: CRS areas and lengths are measured in (optional).
+        chunk_size: Number of source rows intersected at once.
+
+    Examples:
+        >>> import urban_mapper as um
+        >>> mapper = um.UrbanMapper()
+        >>> lots = mapper.loader.from_file("MapPLUTO.shp").load()
+        >>> enricher = mapper.enricher\
+        ...     .interpolate_by(extensive="UnitsRes", intensive="BuiltFAR")\
+        ...     .build()
+        >>> neighborhoods = enricher.enrich(lots, neighborhoods)
+        >>> neighborhoods.layer[["UnitsRes", "BuiltFAR"]]
+    """
+
+    def __init__(
+        self,
+        extensive: Optional[List[str]] = None,
+        intensive: Optional[List[str]] = None,
+        measure: str = "area",
+        output_prefix: str = "",
+        metric_crs: Optional[str] = None,
+        chunk_size: int = 50_000,
+        config: EnricherConfig = None,
+    ) -> None:
+        if measure not in INTERPOLATION_MEASURES:
+            raise ValueError(
+                f"Unknown interpolation measure '{measure}'. Available: {INTERPOLATION_MEASURES}"
+            )
+        if not extensive and not intensive:
+            raise ValueError("Interpolation requires extensive or intensive columns.")
+        super().__init__(config)
+        self.extensive = extensive or []
+        self.intensive = intensive or []
+        self.measure = measure
+        self.output_prefix = output_prefix
+        self.metric_crs = metric_crs
+        self.chunk_size = chunk_size
+
+    @property
+    def required_columns(self) -> Optional[List[str]]:
+        """Columns of the input data the interpolation reads, besides its geometry."""
+        return self.extensive + self.intensive
+
+    def _enrich(
+        self,
+        input_geodataframe: gpd.GeoDataFrame,
+        urban_layer: UrbanLayerBase,
+        **kwargs,
+    ) -> UrbanLayerBase:
+        """Apportion the input attributes onto the elements of the urban layer.
+
+        Args:
+            input_geodataframe: Polygons or lines with the `extensive` and `intensive` columns.
+            urban_layer: Urban layer to enrich.
+            **kwargs: Extra params for customisation.
+
+        Returns:
+            Enriched urban layer with one `<output_prefix><column>` column per input column.
+
+        Raises:
+            ValueError: If input columns are missing.
+        """
+        missing = [
+            column
+            for column in self.required_columns
+            if column not in input_geodataframe.columns
+        ]
+        if missing:
+            raise ValueError(f"Columns {missing} are not in the input data.")
+        interpolated = areal_interpolation(
+            urban_layer.layer.geometry,
+            input_geodataframe,
+            extensive=self.extensive,
+            intensive=self.intensive,
+            measure=self.measure,
+            metric_crs=self.metric_crs,
+            chunk_size=self.chunk_size,
+        )
+        for column in interpolated.columns:
+            urban_layer.layer[f"{self.output_prefix}{column}"] = interpolated[column]
+        return self.set_layer_data_source(urban_layer, urban_layer.layer.index)
+
+    def preview(self, format: str = "ascii") -> Any:
+        """Generate a preview of this enricher.
+
+        Args:
+            format: Output format—"ascii" (text) or "json" (dict).
+
+        Returns:
+            Preview in the requested format.
+        """
+        preview_builder = PreviewBuilder(self.config, ENRICHER_REGISTRY)
+        return preview_builder.build_preview(format=format)
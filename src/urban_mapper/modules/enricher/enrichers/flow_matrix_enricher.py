@@ -0,0 +1,124 @@
+from typing import Any, List, Optional
+
+import geopandas as gpd
+import numpy as np
+from beartype import beartype
+from scipy import sparse
+
+from urban_mapper.modules.enricher.factory import PreviewBuilder, ENRICHER_REGISTRY
+from urban_mapper.modules.urban_layer.abc_urban_layer import UrbanLayerBase
+from urban_mapper.modules.enricher.abc_enricher import EnricherBase
+from urban_mapper.modules.enricher.factory.config import EnricherConfig
+from urban_mapper.modules.enricher.helpers import FlowMatrix
+
+
+@beartype
+class FlowMatrixEnricher(EnricherBase):
+    """Enricher Counting Origin–Destination Flows Between `Urban Layer` Elements.
+
+    Where the `SingleAggregatorEnricher` aggregates onto one mapped column, this enricher
+    reads two of them (e.g., the pickup and dropoff streets of taxi trips) and counts, or
+    sums `value_column` over, every (origin element, destination element) pair in one
+    vectorised pass into a sparse `FlowMatrix` (`flows` attribute).
+
+    !!! tip "Exporting To The Urban Layer"
+        The outflows and inflows of every element are written to the `urban layer` as
+        `<output_column>_out` and `<output_column>_in`. The pairs themselves stay in
+        `flows`, see `flows.top_k(...)`, `flows.to_long()` or `flows.save(...)`.
+
+    Rows whose origin or destination is missing, or not an element of the layer, are
+    ignored.
+
+    Attributes:
+        config: Config object for the enricher.
+        origin_column: Mapped column holding the origin element of every row.
+        destination_column: Mapped column holding the destination element of every row.
+        output_column: Name of the flows.
+        value_column: Column summed instead of counting rows (optional).
+        flows: `FlowMatrix` of the last enrichment.
+
+    Examples:
+        >>> import urban_mapper as um
+        >>> mapper = um.UrbanMapper()
+        >>> enricher = mapper.enricher\
+        ...     .flows_between(origin="pickup_street", destination="dropoff_street")\
+        ...     .build()
+        >>> streets = enricher.enrich(trips, streets)
+        >>> enricher.flows.top_k(10)
+    """
+
+    def __init__(
+        self,
+        origin_column: str,
+        destination_column: str,
+        output_column: str = "flows",
+        value_column: Optional[str] = None,
+        config: EnricherConfig = None,
+    ) -> None:
+        super().__init__(config)
+        self.origin_column = origin_column
+        self.destination_column = destination_column
+        self.output_column = output_column
+        self.value_column = value_column
+        self.flows: Optional[FlowMatrix] = None
+
+    @property
+    def required_columns(self) -> Optional[List[str]]:
+        """Columns of the input data the flows read."""
+        columns = [self.origin_column, self.destination_column]
+        return columns + ([self.value_column] if self.value_column else [])
+
+    def _enrich(
+        self,
+        input_geodataframe: gpd.GeoDataFrame,
+        urban_layer: UrbanLayerBase,
+        **kwargs,
+    ) -> UrbanLayerBase:
+        """Build the flow matrix and write its marginals to the urban layer.
+
+        Args:
+            input_geodataframe: `GeoDataFrame` with the origin and destination columns.
+            urban_layer: Urban layer whose elements the columns refer to.
+            **kwargs: Extra params for customisation.
+
+        Returns:
+            Enriched urban layer with the `<output_column>_out` and `_in` columns.
+
+        Raises:
+            ValueError: If input columns are missing.
+        """
+        missing = [
+            column
+            for column in self.required_columns
+            if column not in input_geodataframe.columns
+        ]
+        if missing:
+            raise ValueError(f"Columns {missing} are not in the input data.")
+        elements = urban_layer.layer.index
+        origins = elements.get_indexer(input_geodataframe[self.origin_column])
+        destinations = elements.get_indexer(input_geodataframe[self.destination_column])
+        kept = (origins >= 0) & (destinations >= 0)
+        values = (
+            input_geodataframe[self.value_column].to_numpy(dtype=np.float64)[kept]
+            if self.value_column
+            else np.ones(int(kept.sum()))
+        )
+        matrix = sparse.coo_matrix(
+            (values, (origins[kept], destinations[kept])),
+            shape=(len(elements), len(elements)),
+        ).tocsr()
+        self.flows = FlowMatrix(matrix, elements, name=self.output_column)
+        urban_layer = self.flows.to_layer(urban_layer)
+        return self.set_layer_data_source(urban_layer, elements)
+
+    def preview(self, format: str = "ascii") -> Any:
+        """Generate a preview of this enricher.
+
+        Args:
+            format: Output format—"ascii" (text) or "json" (dict).
+
+        Returns:
+            Preview in the requested format.
+        """
+        preview_builder = PreviewBuilder(self.config, ENRICHER_REGISTRY)
+        return preview_builder.build_preview(format=format)
@@ -1,13 +1,17 @@
-from typing import Any
+from pathlib import Path
+from typing import Any, List, Optional
 
 import geopandas as gpd
+import pandas as pd
 from beartype import beartype
 
 from urban_mapper.modules.enricher.factory import PreviewBuilder, ENRICHER_REGISTRY
 from urban_mapper.modules.urban_layer.abc_urban_layer import UrbanLayerBase
 from urban_mapper.modules.enricher.abc_enricher import EnricherBase
 from urban_mapper.modules.enricher.aggregator.abc_aggregator import BaseAggregator
+from urban_mapper.modules.enricher.aggregator.helpers import GroupCodes, AggregateState
 from urban_mapper.modules.enricher.factory.config import EnricherConfig
+from urban_mapper.modules.enricher.helpers import DATASET_COLUMN
 
 
 @beartype
@@ -17,11 +21,26 @@ class SingleAggregatorEnricher(EnricherBase):
     Uses one aggregator to enrich `urban layers`, adding `results as a new column`.
     The aggregator decides how input data is processed (e.g., `counted`, `averaged`).
 
+    !!! tip "Breakdowns"
+        When grouping by several columns (e.g., `["nearest_street", "vehicle_type"]`),
+        the first column is matched against the `urban layer` and the others break
+        its groups down. Results are then either pivoted into one
+        `<output_column>_<category>` column per category (`breakdown="columns"`), or
+        kept as a long-form `breakdown_table` keyed by the `urban layer` index
+        (`breakdown="table"`), leaving the layer untouched.
+
+    !!! tip "Several Datasets At Once"
+        Configured `with_datasets_combined()`, the enricher aggregates all selected
+        datasets in one pass over (`urban layer` element, dataset) pairs and writes one
+        `<output_column>_<data_id>` column per dataset plus the combined `<output_column>`.
+
     Attributes:
         config: Config object for the enricher.
         aggregator: Aggregator computing stats or counts.
         output_column: Column name for aggregated results.
         debug: Whether to include debug info.
+        breakdown: Layout of multi-column group results, "columns" or "table".
+        breakdown_table: Long-form results of the last enrichment, when `breakdown="table"`.
 
     Examples:
         >>> import urban_mapper as um
@@ -35,18 +54,29 @@ class SingleAggregatorEnricher(EnricherBase):
         ...     .count_by(output_column="trip_count")\
         ...     .build()
         >>> enriched_streets = enricher.enrich(trips, streets)
+        >>> # Counts per street and per vehicle type
+        >>> enricher = mapper.enricher\
+        ...     .with_data(group_by=["nearest_street", "vehicle_type"])\
+        ...     .count_by(output_column="trip_count")\
+        ...     .with_breakdown("table")\
+        ...     .build()
+        >>> enriched_streets = enricher.enrich(trips, streets)
+        >>> enricher.breakdown_table
     """
 
     def __init__(
         self,
         aggregator: BaseAggregator,
         output_column: str = "aggregated_value",
+        breakdown: str = "columns",
         config: EnricherConfig = None,
     ) -> None:
         super().__init__(config)
         self.aggregator = aggregator
         self.output_column = output_column
         self.debug = config.debug
+        self.breakdown = breakdown
+        self.breakdown_table: Optional[pd.DataFrame] = None
 
     def _enrich(
         self,
@@ -69,9 +99,26 @@ class SingleAggregatorEnricher(EnricherBase):
         Raises:
             ValueError: If aggregation fails.
         """
+        if not self.debug and not self.aggregator.breaks_down:
+            # Indices of every group are only needed for debugging, reduce the
+            # group codes straight into the layer column.
+            groups = GroupCodes.from_dataframe(
+                input_geodataframe, self.aggregator.group_by_column
+            )
+            values = pd.Series(
+                self.aggregator.reduce(input_geodataframe, groups), index=groups.keys
+            )
+            urban_layer = self.set_layer_data_source(urban_layer, groups.keys)
+            urban_layer.layer[self.output_column] = self._fill_missing(
+                values.reindex(urban_layer.layer.index)
+            )
+            return urban_layer
+
         aggregated_df = self.aggregator.aggregate(input_geodataframe)
-        enriched_values = (
-            aggregated_df["value"].reindex(urban_layer.layer.index).fillna(0)
+        if isinstance(aggregated_df.index, pd.MultiIndex):
+            return self._enrich_breakdown(aggregated_df, urban_layer)
+        enriched_values = self._fill_missing(
+            aggregated_df["value"].reindex(urban_layer.layer.index)
         )
         urban_layer = self.set_layer_data_source(urban_layer, aggregated_df.index)
         urban_layer.layer[self.output_column] = enriched_values
@@ -84,6 +131,168 @@ class SingleAggregatorEnricher(EnricherBase):
             urban_layer.layer[f"DEBUG_{self.output_column}"] = indices_values
         return urban_layer
 
+    def _enrich_datasets(
+        self,
+        input_geodataframe: gpd.GeoDataFrame,
+        urban_layer: UrbanLayerBase,
+        **kwargs,
+    ) -> UrbanLayerBase:
+        """Enrich an `urban layer` from several stacked datasets in a single pass.
+
+        The group column is factorised once, jointly with the `data_id` column. Per
+        dataset values are reduced over (element, dataset) codes, and combined values
+        over the element part of the same codes.
+
+        Args:
+            input_geodataframe: Stacked datasets, with a categorical `data_id` column.
+            urban_layer: Urban layer to enrich.
+            **kwargs: Extra params for customisation.
+
+        Returns:
+            Urban layer with one `<output_column>_<data_id>` column per dataset and
+            the combined `<output_column>`.
+
+        Raises:
+            ValueError: If the aggregator groups by several columns.
+        """
+        if self.aggregator.breaks_down:
+            raise ValueError(
+                "Combining datasets is not supported together with a breakdown."
+            )
+        layer_index = urban_layer.layer.index
+        pairs = GroupCodes.from_dataframe(
+            input_geodataframe, [self.aggregator.group_by_column, DATASET_COLUMN]
+        )
+        per_dataset = pd.Series(
+            self.aggregator.reduce(input_geodataframe, pairs), index=pairs.keys
+        ).unstack(DATASET_COLUMN)
+
+        element_codes, elements = pd.factorize(
+            pairs.keys.get_level_values(0), sort=True
+        )
+        groups = GroupCodes(element_codes[pairs.codes], pairs.rows, elements)
+        combined = pd.Series(
+            self.aggregator.reduce(input_geodataframe, groups), index=elements
+        )
+
+        datasets = input_geodataframe[DATASET_COLUMN].cat.categories
+        per_dataset = per_dataset.reindex(index=layer_index, columns=datasets)
+        columns = [f"{self.output_column}_{data_id}" for data_id in datasets]
+        urban_layer.layer[columns] = per_dataset.apply(self._fill_missing).to_numpy()
+        urban_layer.layer[self.output_column] = self._fill_missing(
+            combined.reindex(layer_index)
+        )
+        return urban_layer
+
+    def _enrich_incremental(
+        self,
+        batches: List[gpd.GeoDataFrame],
+        urban_layer: UrbanLayerBase,
+        state_path: Path,
+        **kwargs,
+    ) -> UrbanLayerBase:
+        """Merge new batches into the persisted `AggregateState` and write its values.
+
+        Args:
+            batches: New batches of data, mapped to the urban layer.
+            urban_layer: Urban layer to enrich.
+            state_path: File holding the aggregate state of the previous batches.
+            **kwargs: Extra params for customisation.
+
+        Returns:
+            Enriched urban layer, its `output_column` covering all batches so far.
+
+        Raises:
+            ValueError: If the aggregation cannot be merged across batches (see
+                `mergeable_reduction`), or the persisted state was computed by an
+                aggregation configured differently (see `state_fingerprint`).
+        """
+        state = AggregateState.load(state_path) if state_path.exists() else None
+        if state is not None and state.fingerprint != self.aggregator.state_fingerprint:
+            raise ValueError(
+                f"The aggregate state at '{state_path}' was computed by an aggregation "
+                "configured differently (group by, values, where, weight or method). "
+                "Use another state file for this enricher."
+            )
+        for batch in batches:
+            batch_state = AggregateState.from_batch(self.aggregator, batch)
+            state = batch_state if state is None else state.merge(batch_state)
+        if state is None:
+            return urban_layer
+        state.save(state_path)
+        layer_index = urban_layer.layer.index
+        urban_layer = self.set_layer_data_source(
+            urban_layer, state.keys.intersection(layer_index)
+        )
+        urban_layer.layer[self.output_column] = self._fill_missing(
+            pd.Series(state.values(), index=state.keys).reindex(layer_index)
+        )
+        return urban_layer
+
+    @staticmethod
+    def _fill_missing(values: pd.Series) -> pd.Series:
+        """Fill elements without any record with `0`, unless values are not numeric (e.g., modes)."""
+        if pd.api.types.is_numeric_dtype(values):
+            return values.fillna(0)
+        return values
+
+    @property
+    def required_columns(self) -> Optional[List[str]]:
+        """Columns of the input data the aggregator reads, `None` if unknown."""
+        return self.aggregator.required_columns
+
+    def _enrich_breakdown(
+        self, aggregated_df: pd.DataFrame, urban_layer: UrbanLayerBase
+    ) -> UrbanLayerBase:
+        """Enrich an `urban layer` with results grouped by several columns.
+
+        Args:
+            aggregated_df: Aggregator output, indexed by a `MultiIndex` whose first
+                level holds `urban layer` labels.
+            urban_layer: Urban layer to enrich.
+
+        Returns:
+            Urban layer with one column per category, or untouched with the results
+            in `breakdown_table`.
+        """
+        layer_index = urban_layer.layer.index
+        breakdown_levels = list(range(1, aggregated_df.index.nlevels))
+        aggregated_df = aggregated_df[
+            aggregated_df.index.get_level_values(0).isin(layer_index)
+        ]
+        urban_layer = self.set_layer_data_source(
+            urban_layer, aggregated_df.index.get_level_values(0).unique()
+        )
+
+        if self.breakdown == "table":
+            columns = ["value", "indices"] if self.debug else ["value"]
+            table = aggregated_df[columns].rename(
+                columns={
+                    "value": self.output_column,
+                    "indices": f"DEBUG_{self.output_column}",
+                }
+            )
+            table = table.reset_index(level=breakdown_levels)
+            table.index.name = layer_index.name
+            self.breakdown_table = table
+            return urban_layer
+
+        pivoted = aggregated_df["value"].unstack(level=breakdown_levels)
+        categories = [
+            "_".join(map(str, key)) if isinstance(key, tuple) else str(key)
+            for key in pivoted.columns
+        ]
+        columns = [f"{self.output_column}_{category}" for category in categories]
+        urban_layer.layer[columns] = pivoted.reindex(layer_index).fillna(0).to_numpy()
+        if self.debug:
+            indices = aggregated_df["indices"].unstack(level=breakdown_levels)
+            indices = indices.reindex(layer_index)
+            for column, category_indices in zip(columns, indices.columns):
+                urban_layer.layer[f"DEBUG_{column}"] = indices[category_indices].apply(
+                    lambda x: x if isinstance(x, list) else []
+                )
+        return urban_layer
+
     def preview(self, format: str = "ascii") -> Any:
         """Generate a preview of this enricher.
 
@@ -0,0 +1,177 @@
+from typing import Any, List, Optional, Sequence, Union
+
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+from beartype import beartype
+from scipy import sparse
+
+from urban_mapper.modules.enricher.factory import PreviewBuilder, ENRICHER_REGISTRY
+from urban_mapper.modules.urban_layer.abc_urban_layer import UrbanLayerBase
+from urban_mapper.modules.enricher.abc_enricher import EnricherBase
+from urban_mapper.modules.enricher.aggregator.abc_aggregator import BaseAggregator
+from urban_mapper.modules.enricher.aggregator.aggregators import (
+    CountAggregator,
+    DistinctCountAggregator,
+)
+from urban_mapper.modules.enricher.aggregator.helpers import GroupCodes
+from urban_mapper.modules.enricher.factory.config import EnricherConfig
+from urban_mapper.modules.enricher.helpers import TemporalCube, bin_timestamps
+
+
+@beartype
+class TemporalBinnedEnricher(EnricherBase):
+    """Enricher Aggregating Per `Urban Layer` Element And Per Time Bin.
+
+    Bins a timestamp column (e.g., per hour or per day) and aggregates the input data over
+    (`urban layer` element, time bin) pairs in a single vectorised pass. Results are stored
+    in a `TemporalCube` (`cube` attribute), a compact dense or sparse element × bin array,
+    rather than as one column per bin on the `urban layer`.
+
+    !!! tip "Exporting To The Urban Layer"
+        The `urban layer` itself is left untouched. Use `cube.to_layer(...)` to export a
+        time slice (one column per bin) or a collapsed summary of it.
+
+    Attributes:
+        config: Config object for the enricher.
+        aggregator: Aggregator reducing the values of every (element, time bin) cell.
+        output_column: Name of the aggregated value.
+        time_column: Column holding the timestamps of the input data.
+        frequency: Fixed-width frequency of the bins (e.g., "1h", "1D").
+        bin_edges: Explicit edges of the bins, overriding `frequency`.
+        sparse: Whether to store the cube as a sparse matrix.
+        cube: `TemporalCube` of the last enrichment.
+
+    Examples:
+        >>> import urban_mapper as um
+        >>> mapper = um.UrbanMapper()
+        >>> streets = mapper.urban_layer.OSMNXStreets().from_place("London, UK")
+        >>> trips = mapper.loader.from_file("trips.csv")\
+        ...     .with_columns(longitude_column="lng", latitude_column="lat")\
+        ...     .load()
+        >>> enricher = mapper.enricher\
+        ...     .with_data(group_by="nearest_street")\
+        ...     .count_by(output_column="trip_count")\
+        ...     .with_time_bins(time_column="pickup_datetime", frequency="1h", sparse=True)\
+        ...     .build()
+        >>> streets = enricher.enrich(trips, streets)
+        >>> hourly_trips = enricher.cube.to_frame()
+    """
+
+    def __init__(
+        self,
+        aggregator: BaseAggregator,
+        output_column: str = "aggregated_value",
+        time_column: str = "timestamp",
+        frequency: Optional[str] = "1h",
+        bin_edges: Optional[Union[Sequence, pd.Index]] = None,
+        sparse: bool = False,
+        config: EnricherConfig = None,
+    ) -> None:
+        super().__init__(config)
+        self.aggregator = aggregator
+        self.output_column = output_column
+        self.time_column = time_column
+        self.frequency = frequency
+        self.bin_edges = bin_edges
+        self.sparse = sparse
+        self.cube: Optional[TemporalCube] = None
+
+    def _enrich(
+        self,
+        input_geodataframe: gpd.GeoDataFrame,
+        urban_layer: UrbanLayerBase,
+        **kwargs,
+    ) -> UrbanLayerBase:
+        """Aggregate the input data per `urban layer` element and per time bin.
+
+        Args:
+            input_geodataframe: `GeoDataFrame` with enrichment data.
+            urban_layer: Urban layer whose elements are aggregated over.
+            **kwargs: Extra params for customisation.
+
+        Returns:
+            The urban layer, the aggregated values being available in `cube`.
+
+        Raises:
+            ValueError: If `time_column` is not in the input data.
+            ValueError: If the aggregator groups by several columns.
+            ValueError: If the aggregator does not produce numeric values.
+        """
+        if self.time_column not in input_geodataframe.columns:
+            raise ValueError(f"Missing required columns: {self.time_column}")
+        if self.aggregator.breaks_down:
+            raise ValueError(
+                "TemporalBinnedEnricher groups by a single column, the time bins "
+                "being its second dimension."
+            )
+
+        groups = GroupCodes.from_dataframe(
+            input_geodataframe, self.aggregator.group_by_column
+        )
+        elements = urban_layer.layer.index
+        element_codes = elements.get_indexer(groups.keys)[groups.codes]
+        bin_codes, bins = bin_timestamps(
+            input_geodataframe[self.time_column].iloc[groups.rows],
+            frequency=self.frequency,
+            bin_edges=self.bin_edges,
+        )
+
+        valid = (element_codes >= 0) & (bin_codes >= 0)
+        cell_ids, cell_codes = np.unique(
+            element_codes[valid] * len(bins) + bin_codes[valid], return_inverse=True
+        )
+        cells = GroupCodes(cell_codes, groups.rows[valid], pd.Index(cell_ids))
+        values = self.aggregator.reduce(input_geodataframe, cells)
+        if values.dtype == object:
+            raise ValueError("TemporalBinnedEnricher stores numeric aggregations only.")
+        values = values.astype(np.float64)
+        fill_value = 0.0 if self._is_additive() else np.nan
+        if fill_value == 0:
+            values = np.nan_to_num(values)
+
+        rows, columns = np.divmod(cell_ids, max(len(bins), 1))
+        if self.sparse:
+            cube_values = sparse.csr_matrix(
+                (values, (rows, columns)), shape=(len(elements), len(bins))
+            )
+        else:
+            cube_values = np.full((len(elements), len(bins)), fill_value)
+            cube_values[rows, columns] = values
+        self.cube = TemporalCube(
+            values=cube_values,
+            elements=elements,
+            bins=bins,
+            name=self.output_column,
+            fill_value=fill_value,
+        )
+
+        urban_layer = self.set_layer_data_source(urban_layer, elements[np.unique(rows)])
+        return urban_layer
+
+    def _is_additive(self) -> bool:
+        """Whether the aggregation of no rows is `0` (counts, sums), rather than undefined."""
+        return isinstance(
+            self.aggregator, (CountAggregator, DistinctCountAggregator)
+        ) or self.aggregator.mergeable_reduction in ("count", "sum")
+
+    @property
+    def required_columns(self) -> Optional[List[str]]:
+        """Columns of the input data the aggregator and the time binning read, `None` if unknown."""
+        if self.aggregator.required_columns is None:
+            return None
+        return self.aggregator.required_columns + [self.time_column]
+
+    def preview(self, format: str = "ascii") -> Any:
+        """Generate a preview of this enricher.
+
+        Creates a summary for quick inspection.
+
+        Args:
+            format: Output format—"ascii" (text) or "json" (dict).
+
+        Returns:
+            Preview in the requested format.
+        """
+        preview_builder = PreviewBuilder(self.config, ENRICHER_REGISTRY)
+        return preview_builder.build_preview(format=format)
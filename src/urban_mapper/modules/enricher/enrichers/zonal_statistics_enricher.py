@@ -0,0 +1,142 @@
+from pathlib import Path
+from typing import Any, List, Optional, Union
+
+import geopandas as gpd
+from beartype import beartype
+
+from urban_mapper.config import optional_dependency_required
+from urban_mapper.modules.enricher.factory import PreviewBuilder, ENRICHER_REGISTRY
+from urban_mapper.modules.urban_layer.abc_urban_layer import UrbanLayerBase
+from urban_mapper.modules.enricher.abc_enricher import EnricherBase
+from urban_mapper.modules.enricher.factory.config import EnricherConfig
+from urban_mapper.modules.enricher.helpers import (
+    zonal_statistics,
+    ZONAL_STATISTICS,
+    ZONAL_STRATEGIES,
+)
+from urban_mapper.modules.enricher.helpers.zonal_statistics import (
+    _RASTER_AVAILABLE,
+    _RASTER_IMPORT_ERROR,
+)
+
+
+@beartype
+class ZonalStatisticsEnricher(EnricherBase):
+    """Enricher Summarising A Raster Over Every `Urban Layer` Element.
+
+    Computes zonal statistics (mean, min, max, sum, count) of a local GeoTIFF band,
+    e.g. land-surface temperatures, per neighbourhood, or per street buffered by
+    `buffer` metres. The raster is read window by window, never whole (see
+    `zonal_statistics` for the `window` and `blocks` strategies), optionally by
+    `n_jobs` threads.
+
+    The raster is the data source: the input data handed to `enrich` is not read.
+
+    !!! warning "Optional Dependency"
+        Requires `rasterio`, installed with `pip install urban-mapper[raster]`.
+
+    Attributes:
+        config: Config object for the enricher.
+        raster_path: Path of the raster.
+        statistics: Statistics among `ZONAL_STATISTICS`.
+        output_column: Prefix of the output columns, named `<output_column>_<statistic>`.
+        band: Band to read, starting at 1.
+        buffer: Distance in metres to buffer the elements by, e.g. for streets (optional).
+        strategy: One of `ZONAL_STRATEGIES`.
+        n_jobs: Number of threads reading the raster.
+
+    Examples:
+        >>> import urban_mapper as um
+        >>> mapper = um.UrbanMapper()
+        >>> enricher = mapper.enricher\
+        ...     .zonal_statistics_from("land_surface_temperature.tif", ["mean", "max"], "lst")\
+        ...     .build()
+        >>> neighborhoods = enricher.enrich(data, neighborhoods)
+        >>> neighborhoods.layer[["lst_mean", "lst_max"]]
+    """
+
+    @optional_dependency_required(
+        "raster",
+        lambda: _RASTER_AVAILABLE,
+        lambda: _RASTER_IMPORT_ERROR,
+    )
+    def __init__(
+        self,
+        raster_path: Union[str, Path],
+        statistics: Optional[List[str]] = None,
+        output_column: str = "zonal",
+        band: int = 1,
+        buffer: Optional[float] = None,
+        strategy: str = "window",
+        n_jobs: int = 1,
+        config: EnricherConfig = None,
+    ) -> None:
+        statistics = statistics or ["mean"]
+        unknown = [
+            statistic for statistic in statistics if statistic not in ZONAL_STATISTICS
+        ]
+        if unknown:
+            raise ValueError(
+                f"Unknown zonal statistics {unknown}. Available: {ZONAL_STATISTICS}"
+            )
+        if strategy not in ZONAL_STRATEGIES:
+            raise ValueError(
+                f"Unknown zonal strategy '{strategy}'. Available: {ZONAL_STRATEGIES}"
+            )
+        super().__init__(config)
+        self.raster_path = raster_path
+        self.statistics = statistics
+        self.output_column = output_column
+        self.band = band
+        self.buffer = buffer
+        self.strategy = strategy
+        self.n_jobs = n_jobs
+
+    @property
+    def required_columns(self) -> Optional[List[str]]:
+        """No column of the input data is read, the raster being the data source."""
+        return []
+
+    def _enrich(
+        self,
+        input_geodataframe: gpd.GeoDataFrame,
+        urban_layer: UrbanLayerBase,
+        **kwargs,
+    ) -> UrbanLayerBase:
+        """Summarise the raster over every element of the urban layer.
+
+        Args:
+            input_geodataframe: Input data, not read.
+            urban_layer: Urban layer to enrich.
+            **kwargs: Extra params for customisation.
+
+        Returns:
+            Enriched urban layer with one `<output_column>_<statistic>` column per statistic.
+        """
+        zones = urban_layer.layer.geometry
+        if self.buffer is not None:
+            metric_crs = zones.estimate_utm_crs()
+            zones = zones.to_crs(metric_crs).buffer(self.buffer).to_crs(zones.crs)
+        summary = zonal_statistics(
+            zones,
+            self.raster_path,
+            statistics=self.statistics,
+            band=self.band,
+            strategy=self.strategy,
+            n_jobs=self.n_jobs,
+        )
+        for statistic in self.statistics:
+            urban_layer.layer[f"{self.output_column}_{statistic}"] = summary[statistic]
+        return self.set_layer_data_source(urban_layer, urban_layer.layer.index)
+
+    def preview(self, format: str = "ascii") -> Any:
+        """Generate a preview of this enricher.
+
+        Args:
+            format: Output format—"ascii" (text) or "json" (dict).
+
+        Returns:
+            Preview in the requested format.
+        """
+        preview_builder = PreviewBuilder(self.config, ENRICHER_REGISTRY)
+        return preview_builder.build_preview(format=format)
@@ -1,7 +1,16 @@
+from pathlib import Path
 from typing import Optional, List, Union, Dict, Any, Callable
 from beartype import beartype
 from urban_mapper import logger
 
+# Enricher types configured by a method of their own rather than by an aggregation.
+STANDALONE_ENRICHERS = (
+    "LayerOverlayEnricher",
+    "ArealInterpolationEnricher",
+    "FlowMatrixEnricher",
+    "ZonalStatisticsEnricher",
+)
+
 
 @beartype
 class EnricherConfig:
@@ -13,12 +22,14 @@ class EnricherConfig:
     Attributes:
         group_by: Columns to group by during enrichment.
         values_from: Columns to extract values from for aggregation.
-        action: Action type (e.g., "aggregate", "count").
+        action: Action type (e.g., "aggregate", "count", "overlay", "interpolate", "flows",
+            "zonal").
         aggregator_config: Params for the aggregator.
         enricher_type: Type of enricher to use.
         enricher_config: Params for the enricher.
         debug: Whether to include debug info.
-        data_id: ID of the dataset to be transformed
+        data_id: ID, or IDs, of the dataset(s) to be transformed
+        across_datasets: Whether to aggregate the selected datasets in a single pass.
 
     Examples:
         >>> import urban_mapper as um
@@ -36,7 +47,8 @@ class EnricherConfig:
         self.enricher_type: str = "SingleAggregatorEnricher"
         self.enricher_config: Dict[str, Any] = {}
         self.debug: bool = False
-        self.data_id: Optional[str] = None
+        self.data_id: Optional[Union[str, List[str]]] = None
+        self.across_datasets: bool = False
 
     def _reset(self):
         self.group_by = None
@@ -47,12 +59,13 @@ class EnricherConfig:
         self.enricher_config = {}
         self.debug = False
         self.data_id = None
+        self.across_datasets = False
 
     def with_data(
         self,
         group_by: Union[str, List[str]],
         values_from: Optional[Union[str, List[str]]] = None,
-        data_id: Optional[str] = None,
+        data_id: Optional[Union[str, List[str]]] = None,
     ) -> "EnricherConfig":
         """Set columns for grouping and value extraction.
 
@@ -65,9 +78,12 @@ class EnricherConfig:
             examples.
 
         Args:
-            group_by: Column(s) to group by—string or list.
+            group_by: Column(s) to group by—string or list. With a list, the first column
+                is matched against the urban layer and the others break its groups down,
+                see `with_breakdown`.
             values_from: Column(s) to aggregate—string or list, optional.
-            data_id: ID of the dataset to be transformed
+            data_id: ID of the dataset to be transformed, or list of IDs when
+                combining them, see `with_datasets_combined` (optional, all datasets by default).
 
         Returns:
             Self, for chaining.
@@ -91,7 +107,12 @@ class EnricherConfig:
         return self
 
     def aggregate_by(
-        self, method: Union[str, Callable], output_column: str = None
+        self,
+        method: Union[str, Callable],
+        output_column: str = None,
+        where: Optional[str] = None,
+        weight: Optional[str] = None,
+        **method_parameters: Any,
     ) -> "EnricherConfig":
         """Set up aggregation with a method.
 
@@ -104,8 +125,13 @@ class EnricherConfig:
             examples.
 
         Args:
-            method: Aggregation method—string (e.g., "mean") or callable.
+            method: Aggregation method—string (e.g., "mean", "distinct_count") or callable.
             output_column: Name for aggregated values (optional).
+            where: Expression rows must match to be aggregated, e.g. `"fare > 0"` (optional).
+            weight: Column weighing every row, for "sum", "mean" and the categorical
+                methods, e.g. `"passenger_count"` (optional).
+            **method_parameters: Extra parameters of the aggregator behind `method`
+                (e.g., `precision` for "approx_distinct_count").
 
         Returns:
             Self, for chaining.
@@ -119,11 +145,21 @@ class EnricherConfig:
             >>> config = mapper.enricher\
             ...     .with_data(group_by="street", values_from="fare")\
             ...     .aggregate_by("mean", "avg_fare")
+            >>> config = mapper.enricher\
+            ...     .with_data(group_by="street", values_from="vehicle_id")\
+            ...     .aggregate_by("approx_distinct_count", "distinct_vehicles", precision=14)
+            >>> config = mapper.enricher\
+            ...     .with_data(group_by="street", values_from="fare")\
+            ...     .aggregate_by("mean", "avg_fare", weight="passenger_count")
         """
         if not self.values_from:
             raise ValueError("Aggregation requires 'values_from'")
         self.action = "aggregate"
         self.aggregator_config = {"method": method}
+        self._leave_standalone_enricher()
+        self._set_conditions(where, weight)
+        if method_parameters:
+            self.aggregator_config["method_parameters"] = method_parameters
         if output_column:
             self.enricher_config["output_column"] = output_column
         else:
@@ -133,7 +169,12 @@ class EnricherConfig:
             )
         return self
 
-    def count_by(self, output_column: str = None) -> "EnricherConfig":
+    def count_by(
+        self,
+        output_column: str = None,
+        where: Optional[str] = None,
+        weight: Optional[str] = None,
+    ) -> "EnricherConfig":
         """Set up counting per group.
 
         Configures counting of occurrences per `group_by` column.
@@ -146,6 +187,8 @@ class EnricherConfig:
 
         Args:
             output_column: Name for count values (default: "counted_value").
+            where: Expression rows must match to be counted, e.g. `"injuries > 0"` (optional).
+            weight: Column summed instead of counting rows, e.g. `"passenger_count"` (optional).
 
         Returns:
             Self, for chaining.
@@ -159,18 +202,456 @@ class EnricherConfig:
             >>> config = mapper.enricher\
             ...     .with_data(group_by="street")\
             ...     .count_by("trip_count")
+            >>> config = mapper.enricher\
+            ...     .with_data(group_by="street")\
+            ...     .count_by("severe_crashes", where="injuries > 0")
         """
         if self.values_from:
             raise ValueError("Counting does not use 'values_from'")
         self.action = "count"
         self.aggregator_config = {}
-        self.enricher_config = {"output_column": output_column or "counted_value"}
+        self._leave_standalone_enricher()
+        self._set_conditions(where, weight)
+        self.enricher_config["output_column"] = output_column or "counted_value"
         logger.log(
             "DEBUG_LOW",
             f"COUNT_BY: Initialised EnricherConfig with output_column={output_column}",
         )
         return self
 
+    def overlay_by(
+        self,
+        measure: str = "count",
+        output_column: Optional[str] = None,
+        predicate: str = "intersects",
+        metric_crs: Optional[str] = None,
+    ) -> "EnricherConfig":
+        """Set up the overlay of another layer's geometries onto the urban layer.
+
+        Switches the enricher type to `LayerOverlayEnricher`, which measures the input
+        geometries falling on every element of the urban layer, e.g. the number of
+        intersections per neighbourhood. No `with_data` is needed, elements are paired
+        by `predicate` rather than by a mapped column.
+
+        !!! note "Read the following like"
+            ``Overlay by <measure> with the output being a new column with the name: <output_column>.''
+
+            Follow the other ``Read the following like`` notes for the continuity of the
+            examples.
+
+        Args:
+            measure: "count" (default), "length" or "area" of the input geometries.
+            output_column: Name for the measures (default: `<measure>_overlay`).
+            predicate: Spatial predicate pairing elements and input geometries
+                (default: "intersects").
+            metric_crs: CRS lengths and areas are measured in (default: the UTM zone
+                of the urban layer).
+
+        Returns:
+            Self, for chaining.
+
+        Examples:
+            >>> import urban_mapper as um
+            >>> mapper = um.UrbanMapper()
+            >>> config = mapper.enricher\
+            ...     .overlay_by("count", "intersection_count")
+            >>> config = mapper.enricher\
+            ...     .overlay_by("length", "sidewalk_length")
+        """
+        self.action = "overlay"
+        self.aggregator_config = {}
+        self.enricher_type = "LayerOverlayEnricher"
+        self.enricher_config = {
+            "output_column": output_column or f"{measure}_overlay",
+            "measure": measure,
+            "predicate": predicate,
+            "metric_crs": metric_crs,
+        }
+        logger.log(
+            "DEBUG_LOW",
+            f"OVERLAY_BY: Initialised EnricherConfig with measure={measure} "
+            f"and predicate={predicate}",
+        )
+        return self
+
+    def interpolate_by(
+        self,
+        extensive: Optional[Union[str, List[str]]] = None,
+        intensive: Optional[Union[str, List[str]]] = None,
+        measure: str = "area",
+        output_prefix: str = "",
+        metric_crs: Optional[str] = None,
+        chunk_size: int = 50_000,
+    ) -> "EnricherConfig":
+        """Set up the areal (or length) weighted interpolation of polygon or line attributes.
+
+        Switches the enricher type to `ArealInterpolationEnricher`, which splits the
+        `extensive` attributes and averages the `intensive` ones of every input geometry
+        between the elements it intersects, in proportion to the shared area (or length).
+
+        !!! note "Read the following like"
+            ``Interpolate by <measure> the extensive <extensive> and intensive <intensive> attributes.''
+
+            Follow the other ``Read the following like`` notes for the continuity of the
+            examples.
+
+        Args:
+            extensive: Column(s) split between elements, e.g. counts or totals (optional).
+            intensive: Column(s) averaged over elements, e.g. rates or ratios (optional).
+            measure: "area" (default) for polygons, "length" for lines.
+            output_prefix: Prefix of the output columns, named after the input ones.
+            metric_crs: CRS areas and lengths are measured in (default: the UTM zone
+                of the urban layer).
+            chunk_size: Number of input rows intersected at once (default: 50 000).
+
+        Returns:
+            Self, for chaining.
+
+        Raises:
+            ValueError: If neither `extensive` nor `intensive` is given.
+
+        Examples:
+            >>> import urban_mapper as um
+            >>> mapper = um.UrbanMapper()
+            >>> config = mapper.enricher\
+            ...     .interpolate_by(extensive="UnitsRes", intensive="BuiltFAR")
+        """
+        if not extensive and not intensive:
+            raise ValueError("Interpolation requires extensive or intensive columns.")
+        self.action = "interpolate"
+        self.aggregator_config = {}
+        self.enricher_type = "ArealInterpolationEnricher"
+        self.enricher_config = {
+            "extensive": [extensive] if isinstance(extensive, str) else extensive,
+            "intensive": [intensive] if isinstance(intensive, str) else intensive,
+            "measure": measure,
+            "output_prefix": output_prefix,
+            "metric_crs": metric_crs,
+            "chunk_size": chunk_size,
+        }
+        logger.log(
+            "DEBUG_LOW",
+            f"INTERPOLATE_BY: Initialised EnricherConfig with extensive={extensive}, "
+            f"intensive={intensive} and measure={measure}",
+        )
+        return self
+
+    def flows_between(
+        self,
+        origin: str,
+        destination: str,
+        output_column: str = "flows",
+        values_from: Optional[str] = None,
+    ) -> "EnricherConfig":
+        """Set up origin–destination flows between the elements of the urban layer.
+
+        Switches the enricher type to `FlowMatrixEnricher`, which counts (or sums
+        `values_from` over) every pair of origin and destination elements into a sparse
+        flow matrix, and writes outflows and inflows to the urban layer.
+
+        !!! note "Read the following like"
+            ``Flows between <origin> and <destination> with the output being new columns with the name: <output_column>_out and <output_column>_in.''
+
+            Follow the other ``Read the following like`` notes for the continuity of the
+            examples.
+
+        Args:
+            origin: Mapped column holding the origin element of every row.
+            destination: Mapped column holding the destination element of every row.
+            output_column: Name of the flows (default: "flows").
+            values_from: Column summed instead of counting rows (optional).
+
+        Returns:
+            Self, for chaining.
+
+        Examples:
+            >>> import urban_mapper as um
+            >>> mapper = um.UrbanMapper()
+            >>> config = mapper.enricher\
+            ...     .flows_between("pickup_street", "dropoff_street", "trips")
+            >>> config = mapper.enricher\
+            ...     .flows_between("pickup_street", "dropoff_street", "fares", values_from="fare")
+        """
+        self.action = "flows"
+        self.aggregator_config = {}
+        self.enricher_type = "FlowMatrixEnricher"
+        self.enricher_config = {
+            "origin_column": origin,
+            "destination_column": destination,
+            "output_column": output_column,
+            "value_column": values_from,
+        }
+        logger.log(
+            "DEBUG_LOW",
+            f"FLOWS_BETWEEN: Initialised EnricherConfig with origin={origin} "
+            f"and destination={destination}",
+        )
+        return self
+
+    def zonal_statistics_from(
+        self,
+        raster_path: Union[str, Path],
+        statistics: Optional[List[str]] = None,
+        output_column: str = "zonal",
+        band: int = 1,
+        buffer: Optional[float] = None,
+        strategy: str = "window",
+        n_jobs: int = 1,
+    ) -> "EnricherConfig":
+        """Set up zonal statistics of a raster over the elements of the urban layer.
+
+        Switches the enricher type to `ZonalStatisticsEnricher`, which summarises the pixels
+        of a local GeoTIFF within every element, reading the raster window by window.
+        Requires the optional `raster` dependencies.
+
+        !!! note "Read the following like"
+            ``Zonal statistics from <raster_path> with the output being new columns with the name: <output_column>_<statistic>.''
+
+            Follow the other ``Read the following like`` notes for the continuity of the
+            examples.
+
+        Args:
+            raster_path: Local GeoTIFF to summarise.
+            statistics: Among "mean", "min", "max", "sum" and "count" (default: `["mean"]`).
+            output_column: Prefix of the output columns (default: "zonal").
+            band: Band to read, starting at 1.
+            buffer: Distance in metres to buffer the elements by, e.g. for streets (optional).
+            strategy: "window" (default) to read one window per element, "blocks" to read
+                the raster tile by tile, better for many elements.
+            n_jobs: Number of threads reading the raster (default: 1).
+
+        Returns:
+            Self, for chaining.
+
+        Examples:
+            >>> import urban_mapper as um
+            >>> mapper = um.UrbanMapper()
+            >>> config = mapper.enricher\
+            ...     .zonal_statistics_from("land_surface_temperature.tif", ["mean", "max"], "lst")
+            >>> config = mapper.enricher\
+            ...     .zonal_statistics_from("heat.tif", buffer=20, strategy="blocks", n_jobs=4)
+        """
+        self.action = "zonal"
+        self.aggregator_config = {}
+        self.enricher_type = "ZonalStatisticsEnricher"
+        self.enricher_config = {
+            "raster_path": raster_path,
+            "statistics": statistics,
+            "output_column": output_column,
+            "band": band,
+            "buffer": buffer,
+            "strategy": strategy,
+            "n_jobs": n_jobs,
+        }
+        logger.log(
+            "DEBUG_LOW",
+            f"ZONAL_STATISTICS_FROM: Initialised EnricherConfig with raster_path={raster_path} "
+            f"and statistics={statistics}",
+        )
+        return self
+
+    def _leave_standalone_enricher(self) -> None:
+        """Go back to `SingleAggregatorEnricher` after a standalone enricher type.
+
+        Time bins, a spatial lag or a breakdown configured beforehand are kept; the
+        parameters of `overlay_by`, `interpolate_by`, `flows_between` and
+        `zonal_statistics_from` are dropped, as aggregating enrichers do not take them.
+        """
+        if self.enricher_type in STANDALONE_ENRICHERS:
+            self.enricher_type = "SingleAggregatorEnricher"
+            self.enricher_config = {}
+
+    def _set_conditions(self, where: Optional[str], weight: Optional[str]) -> None:
+        """Store the `where` expression and `weight` column of the aggregator, if any."""
+        if where is not None:
+            self.aggregator_config["where"] = where
+        if weight is not None:
+            self.aggregator_config["weight"] = weight
+        if where is not None or weight is not None:
+            logger.log(
+                "DEBUG_LOW",
+                f"CONDITIONS: Initialised EnricherConfig with where={where} and weight={weight}",
+            )
+
+    def with_breakdown(self, layout: str = "columns") -> "EnricherConfig":
+        """Set the layout of results grouped by several columns.
+
+        !!! note "Read the following like"
+            ``With a breakdown laid out as <layout>.''
+
+            Follow the other ``Read the following like`` notes for the continuity of the
+            examples.
+
+        Args:
+            layout: "columns" to pivot every category into a `<output_column>_<category>`
+                column of the `urban layer` (default), "table" to keep a long-form
+                `breakdown_table` on the enricher, keyed by the `urban layer` index.
+
+        Returns:
+            Self, for chaining.
+
+        Raises:
+            ValueError: If `layout` is neither "columns" nor "table".
+
+        Examples:
+            >>> import urban_mapper as um
+            >>> mapper = um.UrbanMapper()
+            >>> config = mapper.enricher\
+            ...     .with_data(group_by=["street", "vehicle_type"])\
+            ...     .count_by("trips")\
+            ...     .with_breakdown("table")
+        """
+        if layout not in ("columns", "table"):
+            raise ValueError(
+                f"Unknown breakdown layout '{layout}'. Available: columns, table"
+            )
+        self.enricher_config["breakdown"] = layout
+        logger.log(
+            "DEBUG_LOW",
+            f"WITH_BREAKDOWN: Initialised EnricherConfig with layout={layout}",
+        )
+        return self
+
+    def with_datasets_combined(self) -> "EnricherConfig":
+        """Aggregate several datasets in a single pass.
+
+        When the data is a dictionary of datasets (several loaders), the datasets
+        selected by `data_id` (all by default) are stacked with a categorical `data_id`
+        column and aggregated once over (`group_by`, dataset) pairs. The enricher then
+        writes one `<output_column>_<data_id>` column per dataset, plus the combined
+        `<output_column>`, instead of overwriting `<output_column>` dataset after dataset.
+
+        !!! note "Read the following like"
+            ``With the datasets combined.''
+
+            Follow the other ``Read the following like`` notes for the continuity of the
+            examples.
+
+        Returns:
+            Self, for chaining.
+
+        Examples:
+            >>> import urban_mapper as um
+            >>> mapper = um.UrbanMapper()
+            >>> config = mapper.enricher\
+            ...     .with_data(group_by="street", data_id=["taxi", "bike"])\
+            ...     .count_by("trip_count")\
+            ...     .with_datasets_combined()
+        """
+        self.across_datasets = True
+        logger.log(
+            "DEBUG_LOW",
+            f"WITH_DATASETS_COMBINED: Initialised EnricherConfig with data_id={self.data_id}",
+        )
+        return self
+
+    def with_time_bins(
+        self,
+        time_column: str,
+        frequency: Optional[str] = "1h",
+        bin_edges: Optional[List[Any]] = None,
+        sparse: bool = False,
+    ) -> "EnricherConfig":
+        """Aggregate per time bin as well as per group.
+
+        Switches the enricher type to `TemporalBinnedEnricher`, which aggregates over
+        (`group_by`, time bin) pairs into an element × time bin cube.
+
+        !!! note "Read the following like"
+            ``With time bins of <frequency> over <time_column>.''
+
+            Follow the other ``Read the following like`` notes for the continuity of the
+            examples.
+
+        Args:
+            time_column: Column holding the timestamps.
+            frequency: Fixed-width frequency of the bins (e.g., "15min", "1h", "1D").
+            bin_edges: Explicit edges of the bins, overriding `frequency` (optional).
+            sparse: Whether to store the cube as a sparse matrix (default: False).
+
+        Returns:
+            Self, for chaining.
+
+        Examples:
+            >>> import urban_mapper as um
+            >>> mapper = um.UrbanMapper()
+            >>> config = mapper.enricher\
+            ...     .with_data(group_by="street")\
+            ...     .count_by("trip_count")\
+            ...     .with_time_bins("pickup_datetime", frequency="1h")
+        """
+        self._leave_standalone_enricher()
+        self.enricher_type = "TemporalBinnedEnricher"
+        self.enricher_config.update(
+            {
+                "time_column": time_column,
+                "frequency": frequency,
+                "bin_edges": bin_edges,
+                "sparse": sparse,
+            }
+        )
+        logger.log(
+            "DEBUG_LOW",
+            f"WITH_TIME_BINS: Initialised EnricherConfig with time_column={time_column} "
+            f"and frequency={frequency}",
+        )
+        return self
+
+    def with_spatial_lag(
+        self,
+        lag: str = "mean",
+        hops: int = 1,
+        include_self: bool = False,
+        lag_column: Optional[str] = None,
+        lag_output_column: Optional[str] = None,
+    ) -> "EnricherConfig":
+        """Smooth the aggregated values over neighbouring elements as well.
+
+        Switches the enricher type to `SpatialLagEnricher`, which adds a spatial lag
+        of the aggregated column (e.g., the average over adjacent street segments).
+
+        !!! note "Read the following like"
+            ``With a <lag> spatial lag over <hops> hop(s).''
+
+            Follow the other ``Read the following like`` notes for the continuity of the
+            examples.
+
+        Args:
+            lag: "mean" for the average over neighbours (default), "sum" for the sum
+                over the elements reachable in at most `hops` hops.
+            hops: Number of hops (default: 1).
+            include_self: Whether every element counts as its own neighbour.
+            lag_column: Column of the urban layer to smooth (default: the output column).
+            lag_output_column: Column receiving the lag (default: `<lag_column>_lag`).
+
+        Returns:
+            Self, for chaining.
+
+        Examples:
+            >>> import urban_mapper as um
+            >>> mapper = um.UrbanMapper()
+            >>> config = mapper.enricher\
+            ...     .with_data(group_by="street")\
+            ...     .count_by("trip_count")\
+            ...     .with_spatial_lag(lag="mean", hops=2)
+        """
+        self._leave_standalone_enricher()
+        self.enricher_type = "SpatialLagEnricher"
+        self.enricher_config.update(
+            {
+                "lag": lag,
+                "hops": hops,
+                "include_self": include_self,
+                "lag_column": lag_column,
+                "lag_output_column": lag_output_column,
+            }
+        )
+        logger.log(
+            "DEBUG_LOW",
+            f"WITH_SPATIAL_LAG: Initialised EnricherConfig with lag={lag} and hops={hops}",
+        )
+        return self
+
     def with_type(self, primitive_type: str) -> "EnricherConfig":
         """Set the enricher type.
 
@@ -182,12 +663,15 @@ class EnricherConfig:
             Follow the other ``Read the following like`` notes for the continuity of the
             examples.
 
-        !!! tip "For The Time Being, Only One Enricher Type Is Supported"
+        !!! tip "Enricher Types Come With Their Own Configuration Methods"
 
-            ``SingleAggregatorEnricher`` is the only supported enricher type for now.
-            You have therefore no need to specify the type of enricher you want to use.
-            It'll become deprecated in the future, if more enricher types primitives are
-            implemented.
+            ``SingleAggregatorEnricher`` is the default enricher type, other types are
+            selected by their configuration method (e.g., `with_time_bins` for
+            ``TemporalBinnedEnricher``, `with_spatial_lag` for ``SpatialLagEnricher``,
+            `overlay_by` for ``LayerOverlayEnricher``, `interpolate_by` for
+            ``ArealInterpolationEnricher``, `flows_between` for ``FlowMatrixEnricher``,
+            `zonal_statistics_from` for ``ZonalStatisticsEnricher``). You therefore rarely need to specify the type
+            of enricher you want to use.
 
         Args:
             primitive_type: Enricher type name (e.g., "SingleAggregatorEnricher").
@@ -1,9 +1,16 @@
 from typing import Dict, Any
 from beartype import beartype
 from .config import EnricherConfig
+from .validation import STANDALONE_ACTIONS
 from urban_mapper.modules.enricher.aggregator.aggregators.simple_aggregator import (
     AGGREGATION_FUNCTIONS,
 )
+from urban_mapper.modules.enricher.aggregator.aggregators.distinct_count_aggregator import (
+    DISTINCT_COUNT_METHODS,
+)
+from urban_mapper.modules.enricher.aggregator.aggregators.categorical_aggregator import (
+    CATEGORICAL_METHODS,
+)
 
 
 @beartype
@@ -68,6 +75,8 @@ class PreviewBuilder:
         )
         if self.config.data_id:
             steps.append(f"│   └── Data ID: {self.config.data_id}")
+        if self.config.across_datasets:
+            steps.append("│   └── Datasets: combined")
         steps.append("├── Step 2: Action")
         if self.config.action == "aggregate":
             method = self.config.aggregator_config.get("method")
@@ -76,10 +85,16 @@ class PreviewBuilder:
                 if isinstance(method, str)
                 else (method.__name__ if hasattr(method, "__name__") else "custom")
             )
+            if method_display in DISTINCT_COUNT_METHODS:
+                aggregator_name = "DistinctCountAggregator"
+            elif method_display in CATEGORICAL_METHODS:
+                aggregator_name = "CategoricalAggregator"
+            else:
+                aggregator_name = "SimpleAggregator"
             steps.extend(
                 [
                     "│   ├── Type: Aggregate",
-                    "│   ├── Aggregator: SimpleAggregator",
+                    f"│   ├── Aggregator: {aggregator_name}",
                     f"│   ├── Method: {method_display}",
                     f"│   └── Output Column: {self.config.enricher_config.get('output_column', '<Not Set>')}",
                 ]
@@ -92,8 +107,66 @@ class PreviewBuilder:
                     f"│   └── Output Column: {self.config.enricher_config.get('output_column', 'count')}",
                 ]
             )
+        elif self.config.action == "overlay":
+            steps.extend(
+                [
+                    "│   ├── Type: Overlay",
+                    f"│   ├── Measure: {self.config.enricher_config.get('measure')}",
+                    f"│   ├── Predicate: {self.config.enricher_config.get('predicate')}",
+                    f"│   └── Output Column: {self.config.enricher_config.get('output_column', '<Not Set>')}",
+                ]
+            )
+        elif self.config.action == "interpolate":
+            enricher_config = self.config.enricher_config
+            steps.extend(
+                [
+                    "│   ├── Type: Interpolate",
+                    f"│   ├── Measure: {enricher_config.get('measure')}",
+                    f"│   ├── Extensive: {', '.join(enricher_config.get('extensive') or []) or '<Not Set>'}",
+                    f"│   └── Intensive: {', '.join(enricher_config.get('intensive') or []) or '<Not Set>'}",
+                ]
+            )
+        elif self.config.action == "flows":
+            enricher_config = self.config.enricher_config
+            steps.extend(
+                [
+                    "│   ├── Type: Flows",
+                    f"│   ├── Origin: {enricher_config.get('origin_column')}",
+                    f"│   ├── Destination: {enricher_config.get('destination_column')}",
+                    f"│   ├── Values From: {enricher_config.get('value_column') or '<Count>'}",
+                    f"│   └── Output Column: {enricher_config.get('output_column')}",
+                ]
+            )
+        elif self.config.action == "zonal":
+            enricher_config = self.config.enricher_config
+            steps.extend(
+                [
+                    "│   ├── Type: Zonal Statistics",
+                    f"│   ├── Raster: {enricher_config.get('raster_path')}",
+                    f"│   ├── Statistics: {', '.join(enricher_config.get('statistics') or ['mean'])}",
+                    f"│   └── Output Column: {enricher_config.get('output_column')}",
+                ]
+            )
         steps.append("└── Step 3: Enricher")
         steps.append(f"    ├── Type: {self.config.enricher_type}")
+        if "breakdown" in self.config.enricher_config:
+            steps.append(
+                f"    ├── Breakdown: {self.config.enricher_config['breakdown']}"
+            )
+        if "time_column" in self.config.enricher_config:
+            bins = (
+                "explicit edges"
+                if self.config.enricher_config.get("bin_edges") is not None
+                else self.config.enricher_config.get("frequency")
+            )
+            steps.append(
+                f"    ├── Time Bins: {bins} over {self.config.enricher_config['time_column']}"
+            )
+        if "lag" in self.config.enricher_config:
+            steps.append(
+                f"    ├── Spatial Lag: {self.config.enricher_config['lag']} over "
+                f"{self.config.enricher_config['hops']} hop(s)"
+            )
         status = "Ready" if self._is_config_complete() else "Incomplete"
         steps.append(f"    └── Status: {status}")
         return "\n".join(steps)
@@ -115,6 +188,7 @@ class PreviewBuilder:
                     "group_by": self.config.group_by,
                     "values_from": self.config.values_from,
                     "data_id": self.config.data_id,
+                    "across_datasets": self.config.across_datasets,
                 },
                 "action": {
                     "type": self.config.action,
@@ -125,6 +199,8 @@ class PreviewBuilder:
             },
             "metadata": {
                 "available_aggregation_methods": list(AGGREGATION_FUNCTIONS.keys())
+                + list(DISTINCT_COUNT_METHODS.keys())
+                + list(CATEGORICAL_METHODS.keys())
             },
         }
         return preview_data
@@ -134,13 +210,14 @@ class PreviewBuilder:
 
         This method validates that all required fields are set in the configuration,
         depending on the action type. For example, aggregate actions require
-        values_from to be set, while all actions require group_by.
+        values_from to be set, while all actions but standalone ones (overlays,
+        interpolations, flows, zonal statistics) require group_by.
 
         Returns:
             True if the configuration is complete, False otherwise.
         """
         return (
-            bool(self.config.group_by)
+            (bool(self.config.group_by) or self.config.action in STANDALONE_ACTIONS)
             and bool(self.config.action)
             and (self.config.action != "aggregate" or bool(self.config.values_from))
             and self.config.enricher_type in self.enricher_registry
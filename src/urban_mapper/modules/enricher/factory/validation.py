@@ -2,6 +2,17 @@ from .config import EnricherConfig
 from urban_mapper.modules.enricher.aggregator.aggregators.simple_aggregator import (
     AGGREGATION_FUNCTIONS,
 )
+from urban_mapper.modules.enricher.aggregator.aggregators.distinct_count_aggregator import (
+    DISTINCT_COUNT_METHODS,
+)
+from urban_mapper.modules.enricher.aggregator.aggregators.categorical_aggregator import (
+    CATEGORICAL_METHODS,
+)
+
+# Actions whose enrichers need neither a `group_by` column nor an aggregator: they
+# pair the elements of the urban layer with the input geometries themselves, read
+# their own mapped columns, or read a raster.
+STANDALONE_ACTIONS = ("overlay", "interpolate", "flows", "zonal")
 
 
 def validate_group_by(config: EnricherConfig) -> None:
@@ -27,7 +38,10 @@ def validate_action(config: EnricherConfig) -> None:
         ValueError: If no action is set.
     """
     if not config.action:
-        raise ValueError("No action specified. Use aggregate_with() or count_by().")
+        raise ValueError(
+            "No action specified. Use aggregate_by(), count_by(), overlay_by(), "
+            "interpolate_by(), flows_between() or zonal_statistics_from()."
+        )
 
 
 def validate_aggregation_method(method: str) -> None:
@@ -37,9 +51,15 @@ def validate_aggregation_method(method: str) -> None:
         method: Aggregation method name to validate.
 
     Raises:
-        ValueError: If method isn’t in AGGREGATION_FUNCTIONS.
+        ValueError: If method isn’t in AGGREGATION_FUNCTIONS, DISTINCT_COUNT_METHODS
+            nor CATEGORICAL_METHODS.
     """
-    if method not in AGGREGATION_FUNCTIONS:
+    available = (
+        list(AGGREGATION_FUNCTIONS.keys())
+        + list(DISTINCT_COUNT_METHODS.keys())
+        + list(CATEGORICAL_METHODS.keys())
+    )
+    if method not in available:
         raise ValueError(
-            f"Unknown aggregation method '{method}'. Available: {list(AGGREGATION_FUNCTIONS.keys())}"
+            f"Unknown aggregation method '{method}'. Available: {available}"
         )
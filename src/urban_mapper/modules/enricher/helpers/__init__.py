@@ -0,0 +1,29 @@
+from .time_bins import bin_timestamps
+from .temporal_cube import TemporalCube, CUBE_REDUCTIONS
+from .concat_datasets import concat_datasets, DATASET_COLUMN
+from .layer_adjacency import layer_adjacency
+from .spatial_lag import spatial_lag, SPATIAL_LAGS
+from .overlay import intersecting_pairs, overlay_measure, OVERLAY_MEASURES
+from .areal_interpolation import areal_interpolation, INTERPOLATION_MEASURES
+from .flow_matrix import FlowMatrix
+from .zonal_statistics import zonal_statistics, ZONAL_STATISTICS, ZONAL_STRATEGIES
+
+__all__ = [
+    "bin_timestamps",
+    "TemporalCube",
+    "CUBE_REDUCTIONS",
+    "concat_datasets",
+    "DATASET_COLUMN",
+    "layer_adjacency",
+    "spatial_lag",
+    "SPATIAL_LAGS",
+    "intersecting_pairs",
+    "overlay_measure",
+    "OVERLAY_MEASURES",
+    "areal_interpolation",
+    "INTERPOLATION_MEASURES",
+    "FlowMatrix",
+    "zonal_statistics",
+    "ZONAL_STATISTICS",
+    "ZONAL_STRATEGIES",
+]
@@ -0,0 +1,121 @@
+from typing import List, Optional
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+import shapely
+from beartype import beartype
+
+from .overlay import intersecting_pairs
+
+INTERPOLATION_MEASURES = ("area", "length")
+
+
+@beartype
+def areal_interpolation(
+    target: gpd.GeoSeries,
+    source: gpd.GeoDataFrame,
+    extensive: Optional[List[str]] = None,
+    intensive: Optional[List[str]] = None,
+    measure: str = "area",
+    metric_crs: Optional[str] = None,
+    chunk_size: int = 50_000,
+) -> pd.DataFrame:
+    """Apportion the attributes of source polygons or lines onto target geometries.
+
+    Every source geometry contributes to the targets it intersects in proportion to
+    the `measure` (area for polygons, length for lines) of the intersection:
+
+    - [x] `extensive` variables (counts, totals, e.g. residential units) are split,
+      a target receiving `value × |source ∩ target| / |source|`. Totals are preserved
+      when the targets cover the sources.
+    - [x] `intensive` variables (rates, densities, e.g. floor area ratio) are averaged,
+      weighted by `|source ∩ target|` over the sources intersecting the target.
+
+    Intersecting pairs come from one bulk query of the source spatial index per chunk
+    of `chunk_size` source rows, and intersections are computed for these pairs only,
+    in `metric_crs` (by default the UTM zone of the target). Every chunk is reprojected
+    on its own and its results summed into per-target accumulators, so memory stays
+    bounded by the chunk size.
+
+    Args:
+        target: Geometries receiving the attributes.
+        source: Polygons or lines holding the attributes. Reprojected chunk by chunk
+            if needed.
+        extensive: Columns split between targets (optional).
+        intensive: Columns averaged over targets (optional).
+        measure: "area" (default) or "length", one of `INTERPOLATION_MEASURES`.
+        metric_crs: CRS to measure areas and lengths in (optional).
+        chunk_size: Number of source rows intersected at once.
+
+    Returns:
+        One row per target geometry, indexed like `target`, with one column per
+        `extensive` and `intensive` column. Targets without any source get `0` for
+        extensive columns and `NaN` for intensive ones.
+
+    Raises:
+        ValueError: If `measure` is unknown, no column is given, or `chunk_size` is not positive.
+        ValueError: If `target` has a CRS and `source` does not.
+
+    Examples:
+        >>> lots = gpd.read_file("MapPLUTO.shp")
+        >>> units = areal_interpolation(
+        ...     neighborhoods.layer.geometry, lots, extensive=["UnitsRes"], intensive=["BuiltFAR"]
+        ... )
+    """
+    if measure not in INTERPOLATION_MEASURES:
+        raise ValueError(
+            f"Unknown interpolation measure '{measure}'. Available: {INTERPOLATION_MEASURES}"
+        )
+    extensive, intensive = extensive or [], intensive or []
+    if not extensive and not intensive:
+        raise ValueError("Interpolation requires extensive or intensive columns.")
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer.")
+
+    if target.crs is not None:
+        if source.crs is None:
+            raise ValueError(
+                "The source geometries have no CRS while the target ones have one. "
+                "Set it with source.set_crs(...) before interpolating."
+            )
+        target = target.to_crs(metric_crs or target.estimate_utm_crs())
+    size = shapely.area if measure == "area" else shapely.length
+    columns = extensive + intensive
+    totals = np.zeros((len(target), len(columns)))
+    weights = np.zeros((len(target), len(intensive)))
+    target_geometries = target.to_numpy()
+
+    for start in range(0, len(source), chunk_size):
+        chunk = source.iloc[start : start + chunk_size]
+        geometries = chunk.geometry
+        if target.crs is not None and geometries.crs != target.crs:
+            geometries = geometries.to_crs(target.crs)
+        target_positions, source_positions = intersecting_pairs(target, geometries)
+        source_geometries = geometries.to_numpy()
+        shared = size(
+            shapely.intersection(
+                target_geometries[target_positions],
+                source_geometries[source_positions],
+            )
+        )
+        values = chunk[columns].to_numpy(dtype=np.float64)[source_positions]
+        present = ~np.isnan(values)
+        values = np.where(present, values, 0.0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            shares = np.nan_to_num(shared / size(source_geometries)[source_positions])
+        contributions = np.hstack(
+            [
+                values[:, : len(extensive)] * shares[:, None],
+                values[:, len(extensive) :] * shared[:, None],
+            ]
+        )
+        np.add.at(totals, target_positions, contributions)
+        np.add.at(
+            weights,
+            target_positions,
+            present[:, len(extensive) :] * shared[:, None],
+        )
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        totals[:, len(extensive) :] /= np.where(weights > 0, weights, np.nan)
+    return pd.DataFrame(totals, index=target.index, columns=columns)
@@ -0,0 +1,151 @@
+from pathlib import Path
+from typing import Tuple, Union
+import numpy as np
+import pandas as pd
+from beartype import beartype
+from scipy import sparse
+
+from urban_mapper.modules.urban_layer.abc_urban_layer import UrbanLayerBase
+
+
+@beartype
+class FlowMatrix:
+    """Origin–Destination Flows Between The Elements Of An `Urban Layer`.
+
+    Produced by the `FlowMatrixEnricher`, a flow matrix holds one row per origin and
+    one column per destination element of the `urban layer`, as a `SciPy` CSR sparse
+    matrix: only the (origin, destination) pairs actually travelled are stored, where
+    a dense street × street matrix would not fit in memory.
+
+    Attributes:
+        values: `(n_elements, n_elements)` CSR sparse matrix of counts or summed values.
+        elements: Index of the `urban layer` elements, one per row and per column.
+        name: Name of the flows, used to name exported columns.
+
+    Examples:
+        >>> flows = enricher.flows
+        >>> flows.top_k(10)
+        >>> outflows, inflows = flows.marginals()
+        >>> flows.save("trips.npz")
+        >>> flows = FlowMatrix.load("trips.npz")
+    """
+
+    def __init__(
+        self,
+        values: sparse.csr_matrix,
+        elements: pd.Index,
+        name: str = "flows",
+    ) -> None:
+        if values.shape != (len(elements), len(elements)):
+            raise ValueError(
+                f"Flow values of shape {values.shape} do not match {len(elements)} elements."
+            )
+        self.values = values
+        self.elements = elements
+        self.name = name
+
+    @property
+    def shape(self) -> tuple:
+        """`(n_elements, n_elements)`."""
+        return self.values.shape
+
+    def marginals(self) -> Tuple[pd.Series, pd.Series]:
+        """Total flows leaving and entering every element.
+
+        Returns:
+            Outflows (row sums) and inflows (column sums), indexed by element.
+        """
+        outflows = np.asarray(self.values.sum(axis=1)).reshape(-1)
+        inflows = np.asarray(self.values.sum(axis=0)).reshape(-1)
+        return (
+            pd.Series(outflows, index=self.elements, name=f"{self.name}_out"),
+            pd.Series(inflows, index=self.elements, name=f"{self.name}_in"),
+        )
+
+    def to_long(self) -> pd.DataFrame:
+        """Non-empty pairs as a tidy `DataFrame` with origin, destination and value columns."""
+        cells = self.values.tocoo()
+        return pd.DataFrame(
+            {
+                "origin": self.elements[cells.row],
+                "destination": self.elements[cells.col],
+                self.name: cells.data,
+            }
+        )
+
+    def top_k(self, k: int = 10) -> pd.DataFrame:
+        """The `k` largest flows, in decreasing order.
+
+        Only the stored pairs are ranked, with a partial sort of their values.
+
+        Args:
+            k: Number of flows to return.
+
+        Returns:
+            A `DataFrame` with origin, destination and value columns.
+        """
+        if k < 1:
+            raise ValueError("k must be a positive integer.")
+        cells = self.values.tocoo()
+        k = min(k, cells.nnz)
+        largest = np.argpartition(-cells.data, k - 1)[:k] if k else np.array([], int)
+        largest = largest[np.argsort(-cells.data[largest], kind="stable")]
+        return pd.DataFrame(
+            {
+                "origin": self.elements[cells.row[largest]],
+                "destination": self.elements[cells.col[largest]],
+                self.name: cells.data[largest],
+            }
+        )
+
+    def to_layer(self, urban_layer: UrbanLayerBase) -> UrbanLayerBase:
+        """Export the marginals to `<name>_out` and `<name>_in` columns of an `urban layer`.
+
+        Args:
+            urban_layer: Urban layer whose elements the flows were computed for.
+
+        Returns:
+            The urban layer with the new columns.
+        """
+        for marginal in self.marginals():
+            urban_layer.layer[marginal.name] = marginal.reindex(urban_layer.layer.index)
+        return urban_layer
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Save the flows to a compressed `.npz` file.
+
+        Only the CSR arrays of the stored pairs are written. Element labels of object
+        dtype are saved as strings.
+
+        Args:
+            path: Destination file.
+        """
+        elements = self.elements.to_numpy()
+        if elements.dtype == object:
+            elements = elements.astype(str)
+        np.savez_compressed(
+            path,
+            data=self.values.data,
+            indices=self.values.indices,
+            indptr=self.values.indptr,
+            shape=np.asarray(self.values.shape),
+            elements=elements,
+            name=np.asarray(self.name),
+        )
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "FlowMatrix":
+        """Load flows saved with `save`.
+
+        Args:
+            path: File written by `save`.
+
+        Returns:
+            The saved `FlowMatrix`.
+        """
+        with np.load(path, allow_pickle=False) as saved:
+            values = sparse.csr_matrix(
+                (saved["data"], saved["indices"], saved["indptr"]),
+                shape=tuple(saved["shape"]),
+            )
+            return cls(values, pd.Index(saved["elements"]), name=str(saved["name"]))
@@ -0,0 +1,101 @@
+import weakref
+import numpy as np
+import pandas as pd
+from beartype import beartype
+from scipy import sparse
+
+from urban_mapper.modules.urban_layer.abc_urban_layer import UrbanLayerBase
+
+_ADJACENCY_CACHE: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def _node_ids(layer: pd.DataFrame, name: str) -> np.ndarray:
+    """Values of a column, or of an index level, of the layer."""
+    if name in layer.columns:
+        return layer[name].to_numpy()
+    return layer.index.get_level_values(name).to_numpy()
+
+
+def _symmetric(rows: np.ndarray, columns: np.ndarray, size: int) -> sparse.csr_matrix:
+    """Binary, symmetric adjacency from pairs of positions, without self loops."""
+    keep = rows != columns
+    rows, columns = rows[keep], columns[keep]
+    adjacency = sparse.csr_matrix(
+        (
+            np.ones(2 * len(rows)),
+            (np.r_[rows, columns], np.r_[columns, rows]),
+        ),
+        shape=(size, size),
+    )
+    adjacency.data[:] = 1.0
+    return adjacency
+
+
+@beartype
+def layer_adjacency(urban_layer: UrbanLayerBase) -> sparse.csr_matrix:
+    """Binary adjacency of the elements of an `urban layer`, as a sparse matrix.
+
+    Row and column `i` stand for the `i`-th element of `urban_layer.layer`. Two
+    elements are adjacent when:
+
+    - [x] street segments (`u`/`v` node columns or index levels) share a node, through
+      the sparse segment × node incidence matrix `B` (`B @ B.T`);
+    - [x] intersections (point layers backed by a street `network`) are joined by a
+      segment of that network;
+    - [x] any other geometries touch, found in one bulk spatial index query
+      (`sindex.query(..., predicate="touches")`).
+
+    The matrix is built once per layer and cached; it is rebuilt whenever
+    `urban_layer.layer` is replaced by another `GeoDataFrame`, whatever its size.
+
+    Args:
+        urban_layer: Urban layer whose elements are related.
+
+    Returns:
+        A symmetric `(n_elements, n_elements)` CSR matrix of ones, without self loops.
+
+    Raises:
+        ValueError: If the layer is not built.
+
+    Examples:
+        >>> adjacency = layer_adjacency(neighborhoods)
+        >>> n_neighbours = np.asarray(adjacency.sum(axis=1)).ravel()
+    """
+    layer = urban_layer.layer
+    if layer is None:
+        raise ValueError(
+            "Urban layer not built. Please call from_place() or from_file() first."
+        )
+    cached = _ADJACENCY_CACHE.get(urban_layer)
+    if cached is not None and cached[0]() is layer:
+        return cached[1]
+
+    names = set(layer.columns) | set(layer.index.names)
+    network = getattr(urban_layer, "network", None)
+    if {"u", "v"} <= names:
+        node_codes, _ = pd.factorize(
+            np.r_[_node_ids(layer, "u"), _node_ids(layer, "v")]
+        )
+        segments = np.tile(np.arange(len(layer)), 2)
+        incidence = sparse.csr_matrix(
+            (np.ones(len(segments)), (segments, node_codes)),
+            shape=(len(layer), node_codes.max() + 1 if len(node_codes) else 0),
+        )
+        shared = (incidence @ incidence.T).tocoo()
+        adjacency = _symmetric(shared.row, shared.col, len(layer))
+    elif network is not None and (layer.geom_type == "Point").all():
+        node_ids = pd.Index(
+            _node_ids(layer, "osmid") if "osmid" in names else layer.index
+        )
+        edges = np.array(list(network.graph.edges()), dtype=object).reshape(-1, 2)
+        rows = node_ids.get_indexer(edges[:, 0])
+        columns = node_ids.get_indexer(edges[:, 1])
+        known = (rows >= 0) & (columns >= 0)
+        adjacency = _symmetric(rows[known], columns[known], len(layer))
+    else:
+        geometries = layer.geometry
+        rows, columns = geometries.sindex.query(geometries, predicate="touches")
+        adjacency = _symmetric(rows, columns, len(layer))
+
+    _ADJACENCY_CACHE[urban_layer] = (weakref.ref(layer), adjacency)
+    return adjacency
@@ -0,0 +1,190 @@
+import warnings
+from typing import Any, Optional, Union
+import numpy as np
+import pandas as pd
+from beartype import beartype
+from scipy import sparse
+
+from urban_mapper.modules.urban_layer.abc_urban_layer import UrbanLayerBase
+
+CUBE_REDUCTIONS = {
+    "sum": np.nansum,
+    "mean": np.nanmean,
+    "min": np.nanmin,
+    "max": np.nanmax,
+}
+
+
+@beartype
+class TemporalCube:
+    """Aggregated Values Of An `Urban Layer`, Per Element And Per Time Bin.
+
+    Produced by the `TemporalBinnedEnricher`, a cube holds one row per `urban layer`
+    element and one column per time bin, either as a dense `NumPy` array or as a
+    `SciPy` CSR sparse matrix (only non-empty cells stored), instead of hundreds of
+    wide columns on the `urban layer`. Empty cells read as `fill_value`: `0` for counts
+    and sums, `NaN` for other aggregations (e.g., means), so that collapsing bins with
+    "mean" or "min" skips them rather than counting them as zeros.
+
+    !!! tip "Dense or Sparse?"
+        Prefer `sparse` when most (element, bin) cells are empty, e.g. counts per street
+        per hour over a year of data; prefer dense for small layers or coarse bins.
+
+    Attributes:
+        values: `(n_elements, n_bins)` dense array or CSR sparse matrix.
+        elements: Index of the `urban layer` elements, one per row.
+        bins: Start of every time bin, one per column.
+        name: Name of the aggregated value, used to name exported columns.
+        fill_value: Value of the empty cells, `0` or `NaN`. A sparse cube with `NaN`
+            empty cells stores every non-empty cell explicitly, zeros included.
+
+    Examples:
+        >>> cube = enricher.cube
+        >>> cube.select(start="2024-01-01", end="2024-01-02").to_frame()
+        >>> streets = cube.to_layer(streets, collapse="sum")
+    """
+
+    def __init__(
+        self,
+        values: Union[np.ndarray, sparse.csr_matrix],
+        elements: pd.Index,
+        bins: pd.DatetimeIndex,
+        name: str = "aggregated_value",
+        fill_value: float = 0.0,
+    ) -> None:
+        if values.shape != (len(elements), len(bins)):
+            raise ValueError(
+                f"Cube values of shape {values.shape} do not match "
+                f"{len(elements)} elements and {len(bins)} bins."
+            )
+        self.values = values
+        self.elements = elements
+        self.bins = bins
+        self.name = name
+        self.fill_value = fill_value
+
+    @property
+    def is_sparse(self) -> bool:
+        """Whether the values are stored as a sparse matrix."""
+        return sparse.issparse(self.values)
+
+    @property
+    def shape(self) -> tuple:
+        """`(n_elements, n_bins)`."""
+        return self.values.shape
+
+    def to_dense(self) -> np.ndarray:
+        """Values as a dense `(n_elements, n_bins)` array, empty cells as `fill_value`."""
+        if not self.is_sparse:
+            return self.values
+        if self.fill_value == 0:
+            return self.values.toarray()
+        cells = self.values.tocoo()
+        dense = np.full(self.shape, self.fill_value)
+        dense[cells.row, cells.col] = cells.data
+        return dense
+
+    def to_frame(self) -> pd.DataFrame:
+        """Values as a `DataFrame`, indexed by element, one column per bin."""
+        return pd.DataFrame(self.to_dense(), index=self.elements, columns=self.bins)
+
+    def to_long(self) -> pd.DataFrame:
+        """Non-empty cells as a tidy `DataFrame` with element, `time_bin` and value columns."""
+        if self.is_sparse:
+            cells = self.values.tocoo()
+            rows, columns, values = cells.row, cells.col, cells.data
+        else:
+            rows, columns = np.nonzero(
+                self.values != 0 if self.fill_value == 0 else ~np.isnan(self.values)
+            )
+            values = self.values[rows, columns]
+        return pd.DataFrame(
+            {
+                self.elements.name or "element": self.elements[rows],
+                "time_bin": self.bins[columns],
+                self.name: values,
+            }
+        )
+
+    def select(
+        self,
+        start: Optional[Any] = None,
+        end: Optional[Any] = None,
+        elements: Optional[Any] = None,
+    ) -> "TemporalCube":
+        """Slice the cube by time and/or elements.
+
+        Args:
+            start: Keep bins starting at or after this timestamp (optional).
+            end: Keep bins starting strictly before this timestamp (optional).
+            elements: Keep these element labels only, in this order (optional).
+
+        Returns:
+            A new `TemporalCube` holding the selection, in the same storage.
+
+        Raises:
+            KeyError: If one of `elements` is not in the cube.
+        """
+        keep_bins = np.ones(len(self.bins), dtype=bool)
+        if start is not None:
+            keep_bins &= self.bins >= pd.Timestamp(start)
+        if end is not None:
+            keep_bins &= self.bins < pd.Timestamp(end)
+        rows = np.arange(len(self.elements))
+        if elements is not None:
+            rows = self.elements.get_indexer(pd.Index(elements))
+            if (rows < 0).any():
+                raise KeyError("Some elements are not in the cube.")
+        values = self.values[rows][:, np.flatnonzero(keep_bins)]
+        return TemporalCube(
+            values=values.tocsr() if self.is_sparse else values,
+            elements=self.elements[rows],
+            bins=self.bins[keep_bins],
+            name=self.name,
+            fill_value=self.fill_value,
+        )
+
+    def to_layer(
+        self,
+        urban_layer: UrbanLayerBase,
+        start: Optional[Any] = None,
+        end: Optional[Any] = None,
+        collapse: Optional[str] = None,
+    ) -> UrbanLayerBase:
+        """Export (a time slice of) the cube to columns of an `urban layer`.
+
+        Args:
+            urban_layer: Urban layer whose elements the cube was computed for.
+            start: First bin to export (optional).
+            end: Bins starting at or after this timestamp are not exported (optional).
+            collapse: Reduce the selected bins to a single `name` column with
+                "sum", "mean", "min" or "max", instead of one `<name>_<bin start>`
+                column per bin (optional).
+
+        Returns:
+            The urban layer with the new column(s).
+
+        Raises:
+            ValueError: If `collapse` is not supported.
+        """
+        selection = self.select(start=start, end=end)
+        if collapse is not None:
+            if collapse not in CUBE_REDUCTIONS:
+                raise ValueError(
+                    f"Unknown collapse '{collapse}'. Available: {list(CUBE_REDUCTIONS.keys())}"
+                )
+            with warnings.catch_warnings():
+                # Elements without any value over the selected bins collapse to NaN.
+                warnings.simplefilter("ignore", RuntimeWarning)
+                values = CUBE_REDUCTIONS[collapse](selection.to_dense(), axis=1)
+            urban_layer.layer[self.name] = pd.Series(
+                values, index=selection.elements
+            ).reindex(urban_layer.layer.index)
+            return urban_layer
+
+        columns = [f"{self.name}_{time_bin.isoformat()}" for time_bin in selection.bins]
+        frame = pd.DataFrame(
+            selection.to_dense(), index=selection.elements, columns=columns
+        ).reindex(urban_layer.layer.index)
+        urban_layer.layer[columns] = frame.to_numpy()
+        return urban_layer
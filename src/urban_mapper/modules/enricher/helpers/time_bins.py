@@ -0,0 +1,64 @@
+from typing import Optional, Sequence, Tuple, Union
+import numpy as np
+import pandas as pd
+from beartype import beartype
+
+
+@beartype
+def bin_timestamps(
+    timestamps: pd.Series,
+    frequency: Optional[str] = "1h",
+    bin_edges: Optional[Union[Sequence, pd.Index]] = None,
+) -> Tuple[np.ndarray, pd.DatetimeIndex]:
+    """Assign every timestamp to a time bin.
+
+    Bins are either regular, of width `frequency`, starting at the floored earliest
+    timestamp, or delimited by explicit `bin_edges` (left-closed, right-open).
+
+    Args:
+        timestamps: Timestamps (or values `pd.to_datetime` can parse) to bin.
+        frequency: Fixed-width frequency of the bins (e.g., "15min", "1h", "1D").
+            Ignored when `bin_edges` is given.
+        bin_edges: Sorted edges of the bins, `n + 1` edges delimiting `n` bins.
+
+    Returns:
+        The bin code of every timestamp (`-1` for missing or out-of-range timestamps)
+        and the start of every bin.
+
+    Raises:
+        ValueError: If neither `frequency` nor `bin_edges` is given, or if
+            `frequency` is not a fixed-width frequency.
+
+    Examples:
+        >>> codes, bins = bin_timestamps(
+        ...     pd.Series(pd.to_datetime(["2024-01-01 00:10", "2024-01-01 02:40"])),
+        ...     frequency="1h",
+        ... )
+        >>> codes
+        array([0, 2])
+    """
+    timestamps = pd.DatetimeIndex(pd.to_datetime(timestamps, errors="coerce"))
+    missing = timestamps.isna()
+
+    if bin_edges is not None:
+        edges = pd.DatetimeIndex([pd.Timestamp(edge) for edge in bin_edges])
+        codes = edges.searchsorted(timestamps, side="right") - 1
+        codes[missing | (codes >= len(edges) - 1)] = -1
+        return codes.astype(np.int64), edges[:-1]
+
+    if frequency is None:
+        raise ValueError("Either 'frequency' or 'bin_edges' must be given.")
+    try:
+        width = pd.Timedelta(frequency)
+    except ValueError as error:
+        raise ValueError(
+            f"Frequency '{frequency}' is not fixed-width, use 'bin_edges' instead."
+        ) from error
+
+    if missing.all():
+        return np.full(len(timestamps), -1, dtype=np.int64), pd.DatetimeIndex([])
+    start = timestamps.min().floor(width)
+    codes = np.full(len(timestamps), -1, dtype=np.int64)
+    codes[~missing] = (timestamps[~missing] - start) // width
+    bins = pd.date_range(start=start, periods=int(codes.max()) + 1, freq=width)
+    return codes, bins
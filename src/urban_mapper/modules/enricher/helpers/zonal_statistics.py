@@ -0,0 +1,247 @@
+from concurrent.futures import ThreadPoolExecutor
+import functools
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+import shapely
+from beartype import beartype
+
+from urban_mapper.config import optional_dependency_required
+
+try:  # pragma: no cover
+    import rasterio
+    from rasterio import features, windows
+except ImportError as error:  # pragma: no cover
+    _RASTER_AVAILABLE = False
+    _RASTER_IMPORT_ERROR = error
+else:  # pragma: no cover
+    _RASTER_AVAILABLE = True
+    _RASTER_IMPORT_ERROR = None
+
+ZONAL_STATISTICS = ("mean", "min", "max", "sum", "count")
+ZONAL_STRATEGIES = ("window", "blocks")
+
+
+@optional_dependency_required(
+    "raster", lambda: _RASTER_AVAILABLE, lambda: _RASTER_IMPORT_ERROR
+)
+@beartype
+def zonal_statistics(
+    geometries: gpd.GeoSeries,
+    raster_path: Union[str, Path],
+    statistics: Optional[List[str]] = None,
+    band: int = 1,
+    strategy: str = "window",
+    n_jobs: int = 1,
+) -> pd.DataFrame:
+    """Summarise the pixels of a GeoTIFF band falling within every geometry.
+
+    The raster is never loaded whole, only read window by window:
+
+    - [x] `window` (default): one window per geometry, aligned to its bounding box.
+      Best for few or small geometries, e.g. neighbourhoods over a city-wide raster.
+    - [x] `blocks`: the internal tiles of the raster, geometries being rasterised into
+      every tile they cover and the pixels reduced per geometry with `np.bincount`.
+      Best for many geometries, e.g. street buffers. Overlapping geometries (such as
+      buffers meeting at intersections) are rasterised in separate passes, so that a
+      pixel they share counts for each of them, as with `window`.
+
+    Pixels are within a geometry when their centre is. Nodata pixels are ignored.
+    Windows (or blocks) are processed by `n_jobs` threads, each with its own handle
+    on the raster, `rasterio` releasing the GIL while reading.
+
+    Args:
+        geometries: Zones to summarise. Reprojected to the raster CRS.
+        raster_path: Local GeoTIFF (or any raster `rasterio` opens).
+        statistics: Statistics among `ZONAL_STATISTICS` (default: `["mean"]`).
+        band: Band to read, starting at 1.
+        strategy: One of `ZONAL_STRATEGIES`.
+        n_jobs: Number of threads reading the raster.
+
+    Returns:
+        One row per geometry, indexed like `geometries`, one column per statistic.
+        Geometries without any valid pixel get `NaN`, and a `0` count.
+
+    Raises:
+        ValueError: If a statistic or the strategy is unknown.
+        ModuleNotFoundError: If `rasterio` is not installed.
+
+    Examples:
+        >>> temperatures = zonal_statistics(
+        ...     neighborhoods.layer.geometry, "land_surface_temperature.tif", ["mean", "max"]
+        ... )
+    """
+    statistics = statistics or ["mean"]
+    unknown = [
+        statistic for statistic in statistics if statistic not in ZONAL_STATISTICS
+    ]
+    if unknown:
+        raise ValueError(
+            f"Unknown zonal statistics {unknown}. Available: {ZONAL_STATISTICS}"
+        )
+    if strategy not in ZONAL_STRATEGIES:
+        raise ValueError(
+            f"Unknown zonal strategy '{strategy}'. Available: {ZONAL_STRATEGIES}"
+        )
+    with rasterio.open(raster_path) as raster:
+        if geometries.crs is not None and raster.crs is not None:
+            geometries = geometries.to_crs(raster.crs)
+        if strategy == "window":
+            tasks = np.array_split(np.arange(len(geometries)), max(n_jobs, 1))
+            reduce_task = _window_statistics
+        else:
+            tasks = [window for _, window in raster.block_windows(band)]
+            reduce_task = functools.partial(
+                _block_statistics, passes=_rasterisation_passes(geometries)
+            )
+
+    accumulators = _empty_accumulators(len(geometries))
+    with ThreadPoolExecutor(max_workers=max(n_jobs, 1)) as executor:
+        for partial in executor.map(
+            lambda task: reduce_task(raster_path, geometries, band, task), tasks
+        ):
+            _merge(accumulators, partial)
+
+    count = accumulators["count"]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        results = {
+            "mean": accumulators["sum"] / np.where(count > 0, count, np.nan),
+            "min": np.where(count > 0, accumulators["min"], np.nan),
+            "max": np.where(count > 0, accumulators["max"], np.nan),
+            "sum": np.where(count > 0, accumulators["sum"], np.nan),
+            "count": count,
+        }
+    return pd.DataFrame(
+        {statistic: results[statistic] for statistic in statistics},
+        index=geometries.index,
+    )
+
+
+def _empty_accumulators(n_geometries: int) -> Dict[str, np.ndarray]:
+    """Per-geometry running sums, counts and extrema."""
+    return {
+        "sum": np.zeros(n_geometries),
+        "count": np.zeros(n_geometries, dtype=np.int64),
+        "min": np.full(n_geometries, np.inf),
+        "max": np.full(n_geometries, -np.inf),
+    }
+
+
+def _merge(accumulators: Dict[str, np.ndarray], partial: Dict[str, np.ndarray]) -> None:
+    """Fold the accumulators of one task into the running ones."""
+    accumulators["sum"] += partial["sum"]
+    accumulators["count"] += partial["count"]
+    np.minimum(accumulators["min"], partial["min"], out=accumulators["min"])
+    np.maximum(accumulators["max"], partial["max"], out=accumulators["max"])
+
+
+def _window_statistics(
+    raster_path: Union[str, Path],
+    geometries: gpd.GeoSeries,
+    band: int,
+    positions: np.ndarray,
+) -> Dict[str, np.ndarray]:
+    """Reduce the pixels of the given geometries, one bounding-box window each."""
+    accumulators = _empty_accumulators(len(geometries))
+    with rasterio.open(raster_path) as raster:
+        extent = windows.Window(0, 0, raster.width, raster.height)
+        for position in positions:
+            geometry = geometries.iloc[position]
+            if geometry is None or geometry.is_empty:
+                continue
+            window = windows.from_bounds(*geometry.bounds, transform=raster.transform)
+            col_off, row_off = (
+                int(np.floor(window.col_off)),
+                int(np.floor(window.row_off)),
+            )
+            window = windows.Window(
+                col_off,
+                row_off,
+                int(np.ceil(window.col_off + window.width)) - col_off,
+                int(np.ceil(window.row_off + window.height)) - row_off,
+            )
+            try:
+                window = window.intersection(extent)
+            except windows.WindowError:
+                continue
+            if window.width < 1 or window.height < 1:
+                continue
+            pixels = raster.read(band, window=window, masked=True)
+            inside = features.geometry_mask(
+                [geometry],
+                out_shape=pixels.shape,
+                transform=raster.window_transform(window),
+                invert=True,
+            )
+            values = pixels.data[inside & ~np.ma.getmaskarray(pixels)]
+            if values.size:
+                accumulators["sum"][position] = values.sum(dtype=np.float64)
+                accumulators["count"][position] = values.size
+                accumulators["min"][position] = values.min()
+                accumulators["max"][position] = values.max()
+    return accumulators
+
+
+def _rasterisation_passes(geometries: gpd.GeoSeries) -> np.ndarray:
+    """Pass of every geometry, overlapping geometries never sharing a pass.
+
+    A greedy colouring of the graph of geometries whose interiors intersect: the
+    geometries of a pass are rasterised into a single label array, which holds one
+    geometry per pixel. Builds the spatial index the block tasks query.
+    """
+    first, second = geometries.sindex.query(geometries, predicate="intersects")
+    distinct = first < second
+    first, second = first[distinct], second[distinct]
+    shapes = geometries.to_numpy()
+    overlapping = ~shapely.touches(shapes[first], shapes[second])
+    first, second = first[overlapping], second[overlapping]
+
+    passes = np.zeros(len(geometries), dtype=np.int64)
+    order = np.argsort(second, kind="stable")
+    first, second = first[order], second[order]
+    bounds = np.searchsorted(second, np.arange(len(geometries) + 1))
+    for position in np.unique(second):
+        neighbours = first[bounds[position] : bounds[position + 1]]
+        taken = np.bincount(passes[neighbours], minlength=len(neighbours) + 1)
+        passes[position] = np.flatnonzero(taken == 0)[0]
+    return passes
+
+
+def _block_statistics(
+    raster_path: Union[str, Path],
+    geometries: gpd.GeoSeries,
+    band: int,
+    block: "windows.Window",
+    passes: np.ndarray,
+) -> Dict[str, np.ndarray]:
+    """Reduce the pixels of one raster block over the geometries it covers."""
+    accumulators = _empty_accumulators(len(geometries))
+    with rasterio.open(raster_path) as raster:
+        bounds = shapely.box(*windows.bounds(block, raster.transform))
+        covered = geometries.sindex.query(bounds, predicate="intersects")
+        if not len(covered):
+            return accumulators
+        pixels = raster.read(band, window=block, masked=True)
+        transform = raster.window_transform(block)
+    present = ~np.ma.getmaskarray(pixels)
+    n_geometries = len(geometries)
+    for rasterisation_pass in np.unique(passes[covered]):
+        burnt = covered[passes[covered] == rasterisation_pass]
+        labels = features.rasterize(
+            zip(geometries.iloc[burnt], burnt + 1),
+            out_shape=pixels.shape,
+            transform=transform,
+            fill=0,
+            dtype="int64",
+        )
+        valid = (labels > 0) & present
+        codes, values = labels[valid] - 1, pixels.data[valid].astype(np.float64)
+        accumulators["sum"] += np.bincount(
+            codes, weights=values, minlength=n_geometries
+        )
+        accumulators["count"] += np.bincount(codes, minlength=n_geometries)
+        np.minimum.at(accumulators["min"], codes, values)
+        np.maximum.at(accumulators["max"], codes, values)
+    return accumulators
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, Optional, Union, Dict
+from typing import Any, Optional, Union, Dict, List, Tuple
 
 import geopandas as gpd
 from beartype import beartype
@@ -27,6 +27,31 @@ class GeoFilterBase(ABC):
     ) -> None:
         self.data_id = data_id
 
+    @property
+    def required_columns(self) -> Optional[List[str]]:
+        """Columns of the input data the filter reads besides its geometry, `None` if unknown.
+
+        When every step of a pipeline knows its columns, the pipeline can ask its
+        loaders to read only those (see `UrbanPipeline(project_columns=True)`).
+        """
+        return None
+
+    def pushdown_bounds(
+        self, urban_layer: UrbanLayerBase
+    ) -> Optional[Tuple[float, float, float, float]]:
+        """Bounding box outside which the filter drops every row, `None` if it has none.
+
+        A pipeline pushes it down into its loaders (see `LoaderBase.restrict_to_bounds`),
+        so that rows the filter would drop are not even loaded.
+
+        Args:
+            urban_layer: The `urban layer` providing spatial filtering criteria.
+
+        Returns:
+            The (`min_x`, `min_y`, `max_x`, `max_y`) bounding box, or `None`.
+        """
+        return None
+
     @abstractmethod
     def _transform(
         self, input_geodataframe: gpd.GeoDataFrame, urban_layer: UrbanLayerBase
@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, List, Optional, Tuple
 
 import geopandas as gpd
 from beartype import beartype
@@ -18,6 +18,11 @@ class BoundingBoxFilter(GeoFilterBase):
     !!! note
         The bounding box may include areas outside the `urban layer`’s actual features.
 
+    !!! tip "Pushdown"
+        Within an `UrbanPipeline`, the bounding box is also pushed down into the `CSV`
+        and `Parquet` loaders reading latitude/longitude columns, which then skip the rows
+        (and `Parquet` row groups) outside of it while reading. The result is unchanged.
+
     Examples:
         >>> from urban_mapper.modules.filter import BoundingBoxFilter
         >>> from urban_mapper.modules.urban_layer import OSMNXStreets
@@ -27,6 +32,19 @@ class BoundingBoxFilter(GeoFilterBase):
         >>> filtered_data = bbox_filter.transform(taxi_trips, streets)
     """
 
+    @property
+    def required_columns(self) -> Optional[List[str]]:
+        """None besides the geometry."""
+        return []
+
+    def pushdown_bounds(
+        self, urban_layer: UrbanLayerBase
+    ) -> Optional[Tuple[float, float, float, float]]:
+        """The bounding box of the `urban layer`, if it has one."""
+        if not hasattr(urban_layer, "get_layer_bounding_box"):
+            return None
+        return tuple(float(value) for value in urban_layer.get_layer_bounding_box())
+
     def _transform(
         self, input_geodataframe: gpd.GeoDataFrame, urban_layer: UrbanLayerBase
     ) -> gpd.GeoDataFrame:
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional, Union, Dict, Any
+from typing import Optional, Union, Dict, Any, List
 import geopandas as gpd
 from beartype import beartype
 
@@ -19,6 +19,9 @@ class GeoImputerBase(ABC):
         latitude_column (Optional[str]): Column name for latitude values post-imputation.
         longitude_column (Optional[str]): Column name for longitude values post-imputation.
         data_id (Optional[str]): Column name for processing specific values post-imputation.
+        imputes_coordinates (bool): Whether the imputer may fill missing coordinates, in which
+            case a pipeline does not push bounding boxes down into loaders, since rows without
+            coordinates may end up within them.
         **extra_params: Any other argument used by a child class.
 
     !!! note
@@ -26,6 +29,8 @@ class GeoImputerBase(ABC):
         implementations like `SimpleGeoImputer` or `AddressGeoImputer`.
     """
 
+    imputes_coordinates: bool = True
+
     def __init__(
         self,
         latitude_column: Optional[str] = None,
@@ -39,6 +44,27 @@ class GeoImputerBase(ABC):
         self.longitude_column = longitude_column
         self.geometry_column = geometry_column
 
+    @property
+    def required_columns(self) -> Optional[List[str]]:
+        """Columns of the input data the imputation reads, `None` if unknown.
+
+        When every step of a pipeline knows its columns, the pipeline can ask its
+        loaders to read only those (see `UrbanPipeline(project_columns=True)`).
+        """
+        return None
+
+    def _coordinate_columns(self) -> List[str]:
+        """The latitude, longitude and geometry columns that are set."""
+        return [
+            column
+            for column in (
+                self.latitude_column,
+                self.longitude_column,
+                self.geometry_column,
+            )
+            if column is not None
+        ]
+
     @abstractmethod
     def _transform(
         self, input_geodataframe: gpd.GeoDataFrame, urban_layer: UrbanLayerBase
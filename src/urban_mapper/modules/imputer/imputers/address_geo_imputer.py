@@ -1,4 +1,4 @@
-from typing import Any, Optional
+from typing import Any, List, Optional
 
 import geopandas as gpd
 import osmnx
@@ -60,6 +60,13 @@ class AddressGeoImputer(GeoImputerBase):
         super().__init__(latitude_column, longitude_column, geometry_column, data_id)
         self.address_column = address_column
 
+    @property
+    def required_columns(self) -> Optional[List[str]]:
+        """The coordinate or geometry columns to fill, and the address column."""
+        return self._coordinate_columns() + [
+            column for column in (self.address_column,) if column is not None
+        ]
+
     def _transform(
         self, input_geodataframe: gpd.GeoDataFrame, urban_layer: UrbanLayerBase
     ) -> gpd.GeoDataFrame:
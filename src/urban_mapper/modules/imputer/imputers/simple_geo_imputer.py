@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, List, Optional
 
 import geopandas as gpd
 from beartype import beartype
@@ -26,6 +26,13 @@ class SimpleGeoImputer(GeoImputerBase):
         This imputer does not add coordinates; it only removes incomplete rows.
     """
 
+    imputes_coordinates = False
+
+    @property
+    def required_columns(self) -> Optional[List[str]]:
+        """The coordinate or geometry columns checked for missing values."""
+        return self._coordinate_columns()
+
     def _transform(
         self, input_geodataframe: gpd.GeoDataFrame, urban_layer: UrbanLayerBase
     ) -> gpd.GeoDataFrame:
@@ -6,6 +6,7 @@ from .loaders import (
     ParquetLoader,
     DataFrameLoader,
     HuggingFaceLoader,
+    PartitionedLoader,
 )
 from .loader_factory import LoaderFactory
 
@@ -17,5 +18,6 @@ __all__ = [
     "ParquetLoader",
     "DataFrameLoader",
     "HuggingFaceLoader",
+    "PartitionedLoader",
     "LoaderFactory",
 ]
@@ -1,8 +1,13 @@
 from abc import ABC, abstractmethod
-from typing import Union, Optional, Any, Dict, Tuple
+from typing import Union, Optional, Any, Dict, Tuple, List
 import geopandas as gpd
+import pandas as pd
 from beartype import beartype
-from urban_mapper.modules.loader.helpers import ensure_coordinate_reference_system
+from urban_mapper import logger
+from urban_mapper.modules.loader.helpers import (
+    ensure_coordinate_reference_system,
+    optimise_dtypes,
+)
 from urban_mapper.config import DEFAULT_CRS
 
 
@@ -22,6 +27,14 @@ class LoaderBase(ABC):
             If a string, it specifies the coordinate reference system to use (default: 'EPSG:4326').
             If a tuple (source_crs, target_crs), it defines a conversion from the source CRS to the target CRS (default target CRS: 'EPSG:4326').
         additional_loader_parameters (Dict[str, Any]): Additional parameters specific to the loader implementation. Consider this as `kwargs`.
+        dtype_savings (Optional[pd.DataFrame]): Bytes saved per column by the last `load()`,
+            with a `dtype_optimisation` parameter (see `optimise_dtypes`).
+
+    !!! tip "Dtype optimisation"
+        With a `dtype_optimisation` parameter (a dictionary of `optimise_dtypes` options,
+        set by `LoaderFactory.with_dtype_optimisation()`), `load()` stores the loaded
+        columns in the smallest dtypes holding their values, e.g. `int8` ids or
+        categorical complaint types.
     """
 
     def __init__(
@@ -39,6 +52,7 @@ class LoaderBase(ABC):
             coordinate_reference_system
         )
         self.additional_loader_parameters: Dict[str, Any] = additional_loader_parameters
+        self.dtype_savings: Optional[pd.DataFrame] = None
 
     @abstractmethod
     def _load(self) -> gpd.GeoDataFrame:
@@ -76,23 +90,128 @@ class LoaderBase(ABC):
 
         Examples:
         """
-        loaded_data = self._load()
+        return self._optimise_dtypes(self._map_columns(self._load()))
 
+    def _map_columns(self, loaded_data: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
+        """Rename the columns of the loaded data as configured by `map_columns`."""
         if self.additional_loader_parameters.get("map_columns") is not None:
-            map_columns = self.additional_loader_parameters.get("map_columns")
+            map_columns = dict(self.additional_loader_parameters.get("map_columns"))
 
-            if (
-                loaded_data.active_geometry_name is not None
-                and loaded_data.active_geometry_name in map_columns.keys()
-            ):
-                source = loaded_data.active_geometry_name
-                loaded_data = loaded_data.rename_geometry(map_columns[source])
-                del map_columns[source]
+            # Renaming shares the columns rather than copying them
+            with pd.option_context("mode.copy_on_write", True):
+                if (
+                    loaded_data.active_geometry_name is not None
+                    and loaded_data.active_geometry_name in map_columns.keys()
+                ):
+                    source = loaded_data.active_geometry_name
+                    loaded_data = loaded_data.rename_geometry(map_columns[source])
+                    del map_columns[source]
 
-            loaded_data = loaded_data.rename(columns=map_columns)
+                loaded_data = loaded_data.rename(columns=map_columns)
 
         return loaded_data
 
+    def _optimise_dtypes(self, loaded_data: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
+        """Shrink the dtypes of the loaded data as configured by `dtype_optimisation`."""
+        options = self.additional_loader_parameters.get("dtype_optimisation")
+        if options is None:
+            return loaded_data
+        loaded_data, self.dtype_savings = optimise_dtypes(
+            loaded_data,
+            coordinate_columns=[
+                column
+                for column in (self.latitude_column, self.longitude_column)
+                if column != ""
+            ],
+            **options,
+        )
+        logger.log(
+            "DEBUG_LOW",
+            f"DTYPE_OPTIMISATION: Saved {self.dtype_savings['bytes_saved'].sum()} bytes "
+            f"over {len(self.dtype_savings)} columns.",
+        )
+        return loaded_data
+
+    def keep_dtypes(self, columns: Optional[List[str]]) -> None:
+        """Leave `columns` out of the dtype optimisation, if any.
+
+        Called by an `UrbanPipeline` with the columns its enrichers read (group by,
+        aggregate, filter or weight with), which keep the dtypes they are loaded with, so
+        that grouping and aggregating them gives the same results as without the
+        optimisation.
+
+        Args:
+            columns: Columns to keep as loaded, as named once loaded. `None`, for columns
+                that are not known, disables the optimisation.
+        """
+        options = self.additional_loader_parameters.get("dtype_optimisation")
+        if options is None:
+            return
+        if columns is None:
+            self.additional_loader_parameters["dtype_optimisation"] = None
+            return
+        self.additional_loader_parameters["dtype_optimisation"] = {
+            **options,
+            "keep": list(dict.fromkeys((options.get("keep") or []) + columns)),
+        }
+
+    def project_columns(self, columns: List[str]) -> int:
+        """Restrict the loader to the columns a pipeline reads.
+
+        Called by an `UrbanPipeline` composed with `project_columns=True`, before loading,
+        with the columns its imputers, filters, urban layer mappings and enrichers read.
+        Loaders able to skip columns (`CSV`, `Parquet`, Hugging Face) then only read those,
+        besides their coordinate or geometry columns.
+
+        Args:
+            columns: Columns to read, as named once loaded (i.e., after `map_columns`).
+                Columns the source lacks (e.g., produced by a mapping) are ignored.
+
+        Returns:
+            Estimated number of bytes the projection avoids reading, `0` for loaders
+            reading their source whole (e.g., shapefiles, in-memory dataframes).
+        """
+        return 0
+
+    def restrict_to_bounds(
+        self, bounds: Optional[Tuple[float, float, float, float]]
+    ) -> bool:
+        """Skip the rows whose coordinates fall outside `bounds` while loading.
+
+        Called by an `UrbanPipeline` holding a `BoundingBoxFilter`, before loading, with
+        the bounding box of its urban layer, so that rows the filter would drop are never
+        materialised. The filter still runs afterwards, the pushdown only saves work.
+        The pipeline restores the previous bounds once loaded.
+
+        Args:
+            bounds: Bounding box (`min_x`, `min_y`, `max_x`, `max_y`) of the rows to keep,
+                in the coordinate reference system of the loaded data, replacing any
+                previous one. `None` lifts the restriction.
+
+        Returns:
+            Whether the loader skips the rows outside `bounds`, `False` for loaders reading
+            their source whole (e.g., shapefiles, in-memory dataframes).
+        """
+        return False
+
+    def _source_columns(self, columns: List[str]) -> List[str]:
+        """`columns` named as in the source, undoing `map_columns`."""
+        map_columns = self.additional_loader_parameters.get("map_columns") or {}
+        sources = {target: source for source, target in map_columns.items()}
+        return [sources.get(column, column) for column in columns]
+
+    def _spatial_columns(self) -> List[str]:
+        """The latitude, longitude and geometry columns that are set."""
+        return [
+            column
+            for column in (
+                self.latitude_column,
+                self.longitude_column,
+                self.geometry_column,
+            )
+            if column != ""
+        ]
+
     @abstractmethod
     def preview(self, format: str = "ascii") -> Any:
         """Generate a preview of the instance's `loader`.
@@ -1,7 +1,25 @@
 from .ensure_coordinate_reference_system import (
     ensure_coordinate_reference_system,
 )
+from .read_csv_arrow import read_csv_arrow
+from .estimate_csv_column_bytes import estimate_csv_column_bytes
+from .parse_geometries import parse_geometries
+from .optimise_dtypes import optimise_dtypes
+from .transform_coordinates import (
+    get_transformer,
+    points_from_coordinates,
+    transform_coordinates,
+    transform_geometries,
+)
 
 __all__ = [
     "ensure_coordinate_reference_system",
+    "read_csv_arrow",
+    "estimate_csv_column_bytes",
+    "parse_geometries",
+    "optimise_dtypes",
+    "get_transformer",
+    "points_from_coordinates",
+    "transform_coordinates",
+    "transform_geometries",
 ]
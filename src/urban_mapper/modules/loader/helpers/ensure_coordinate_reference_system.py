@@ -1,8 +1,10 @@
 from typing import Callable, Union, Tuple
 import geopandas as gpd
+import pandas as pd
 from beartype import beartype
 
 from urban_mapper.config import DEFAULT_CRS
+from .transform_coordinates import transform_geometries
 
 
 @beartype
@@ -26,9 +28,13 @@ def ensure_coordinate_reference_system(
                 target_coordinate_reference_system, inplace=True
             )
         elif loaded_geodataframe.crs.to_string() != target_coordinate_reference_system:
-            loaded_geodataframe = loaded_geodataframe.to_crs(
-                target_coordinate_reference_system
-            )
+            # Only the geometry column is replaced, the other columns are not copied
+            geometry_name = loaded_geodataframe.geometry.name
+            with pd.option_context("mode.copy_on_write", True):
+                loaded_geodataframe = loaded_geodataframe.copy(deep=False)
+                loaded_geodataframe[geometry_name] = transform_geometries(
+                    loaded_geodataframe.geometry, target_coordinate_reference_system
+                )
 
         return loaded_geodataframe
 
@@ -0,0 +1,122 @@
+from typing import List, Optional, Tuple
+import numpy as np
+import pandas as pd
+from beartype import beartype
+
+
+@beartype
+def optimise_dtypes(
+    dataframe: pd.DataFrame,
+    keep: Optional[List[str]] = None,
+    coordinate_columns: Optional[List[str]] = None,
+    float32_coordinates: bool = False,
+    max_category_ratio: float = 0.5,
+    arrow_strings: bool = True,
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Store the columns of a `DataFrame` in the smallest dtypes holding their values.
+
+    Every column is converted at once by a vectorised `pandas` call:
+
+    - [x] Integers are downcast to the smallest signed integer type holding them.
+    - [x] Floats become `float32` only when every value survives the round trip.
+    - [x] Strings with at most `max_category_ratio` distinct values per value become
+      categoricals, the others `Arrow` strings (if `arrow_strings`).
+    - [x] `coordinate_columns` become `float32` if `float32_coordinates`, losing digits
+      past about `1e-5` degrees (a metre or so) but not the geometries built from them.
+
+    Columns in `keep`, the geometry, and columns of any other dtype are left as they
+    are. Converted columns replace the original ones, the others are shared.
+
+    Args:
+        dataframe: Data to optimise.
+        keep: Columns to leave untouched (optional).
+        coordinate_columns: Latitude and longitude columns (optional).
+        float32_coordinates: Whether to store `coordinate_columns` as `float32`.
+        max_category_ratio: Maximum number of distinct values per non-missing value for
+            strings to become categoricals, between `0` and `1`.
+        arrow_strings: Whether to store the other strings as `Arrow` strings.
+
+    Returns:
+        The optimised data, and one row per converted column with its `before` and
+        `after` dtypes, `bytes_before`, `bytes_after` and `bytes_saved`.
+
+    Raises:
+        ValueError: If `max_category_ratio` is not between `0` and `1`.
+
+    Examples:
+        >>> optimised, savings = optimise_dtypes(trips, keep=["vendor_id"])
+        >>> savings["bytes_saved"].sum()
+    """
+    if not 0 <= max_category_ratio <= 1:
+        raise ValueError("max_category_ratio must be between 0 and 1.")
+    keep = set(keep or [])
+    coordinate_columns = set(coordinate_columns or [])
+    geometry_name = getattr(dataframe, "_geometry_column_name", None)
+
+    with pd.option_context("mode.copy_on_write", True):
+        optimised = dataframe.copy(deep=False)
+        rows = []
+        for column in dataframe.columns:
+            if column in keep or column == geometry_name:
+                continue
+            values = dataframe[column]
+            if column in coordinate_columns:
+                converted = (
+                    values.astype(np.float32)
+                    if float32_coordinates and values.dtype == np.float64
+                    else None
+                )
+            else:
+                converted = _convert(values, max_category_ratio, arrow_strings)
+            if converted is None:
+                continue
+            before = values.memory_usage(index=False, deep=True)
+            after = converted.memory_usage(index=False, deep=True)
+            if after >= before:
+                continue
+            optimised[column] = converted
+            rows.append(
+                {
+                    "column": column,
+                    "before": str(values.dtype),
+                    "after": str(converted.dtype),
+                    "bytes_before": before,
+                    "bytes_after": after,
+                    "bytes_saved": before - after,
+                }
+            )
+
+    savings = pd.DataFrame(
+        rows,
+        columns=[
+            "column",
+            "before",
+            "after",
+            "bytes_before",
+            "bytes_after",
+            "bytes_saved",
+        ],
+    )
+    return optimised, savings
+
+
+def _convert(
+    values: pd.Series, max_category_ratio: float, arrow_strings: bool
+) -> Optional[pd.Series]:
+    """Smaller representation of a column with the same values, `None` if there is none."""
+    if values.dtype == np.int64 or values.dtype == np.int32:
+        return pd.to_numeric(values, downcast="integer")
+    if values.dtype == np.float64:
+        narrowed = values.to_numpy().astype(np.float32)
+        if np.array_equal(
+            narrowed.astype(np.float64), values.to_numpy(), equal_nan=True
+        ):
+            return pd.Series(narrowed, index=values.index, name=values.name)
+        return None
+    if values.dtype == object and pd.api.types.infer_dtype(values) == "string":
+        present = values.count()
+        if present and values.nunique() <= max_category_ratio * present:
+            return values.astype("category")
+        if arrow_strings:
+            return values.astype(pd.StringDtype("pyarrow"))
+    return None
@@ -0,0 +1,73 @@
+import re
+from typing import Union
+import numpy as np
+import pandas as pd
+import shapely
+from beartype import beartype
+from shapely.geometry.base import BaseGeometry
+
+# Hexadecimal WKB starts with its byte order, 00 (big endian) or 01 (little endian).
+HEX_WKB_PATTERN = re.compile(r"^0[01]([0-9A-Fa-f]{2})+$")
+
+
+@beartype
+def parse_geometries(values: Union[pd.Series, np.ndarray]) -> np.ndarray:
+    """Parse a column of encoded geometries into `shapely` geometries, all at once.
+
+    The encoding is detected from the first value present, then the whole column is
+    parsed by a single vectorised `shapely` call rather than row by row:
+
+    - [x] `bytes`: `WKB`, as stored by `GeoParquet` or `PostGIS`.
+    - [x] `str`: hexadecimal `WKB` (e.g., `"0101000000..."`), or `WKT` (e.g., `"POINT (1 2)"`).
+    - [x] `dict` with `x` and `y`: `GeoArrow` native points, as read from `Arrow` structs.
+    - [x] `shapely` geometries: kept as they are.
+
+    Missing values (`None`, `NaN`) stay missing.
+
+    Args:
+        values: Column of encoded geometries.
+
+    Returns:
+        One `shapely` geometry (or `None`) per value.
+
+    Raises:
+        ValueError: If the encoding is not recognised, or a value cannot be parsed.
+
+    Examples:
+        >>> parse_geometries(pd.Series(["POINT (1 2)", None]))
+        array([<POINT (1 2)>, None], dtype=object)
+    """
+    array = values.to_numpy(dtype=object) if isinstance(values, pd.Series) else values
+    array = array.astype(object, copy=False)
+    geometries = np.full(len(array), None, dtype=object)
+    present = np.asarray(pd.notna(array), dtype=bool)
+    if not present.any():
+        return geometries
+
+    encoded = array[present]
+    first = encoded[0]
+    try:
+        if isinstance(first, BaseGeometry):
+            parsed = encoded
+        elif isinstance(first, (bytes, bytearray, memoryview)):
+            parsed = shapely.from_wkb([bytes(value) for value in encoded])
+        elif isinstance(first, str):
+            if HEX_WKB_PATTERN.match(first):
+                parsed = shapely.from_wkb(encoded)
+            else:
+                parsed = shapely.from_wkt(encoded)
+        elif isinstance(first, dict) and {"x", "y"} <= first.keys():
+            frame = pd.DataFrame.from_records(encoded)
+            parsed = shapely.points(
+                frame["x"].to_numpy(dtype=float), frame["y"].to_numpy(dtype=float)
+            )
+        else:
+            raise ValueError(
+                f"Unrecognised geometry encoding '{type(first).__name__}'. "
+                "Expected WKB bytes, WKT or hexadecimal WKB strings, or GeoArrow points."
+            )
+    except shapely.errors.GEOSException as error:
+        raise ValueError(f"Invalid geometry: {error}") from error
+
+    geometries[present] = parsed
+    return geometries
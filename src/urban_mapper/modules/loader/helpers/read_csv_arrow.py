@@ -0,0 +1,124 @@
+from pathlib import Path
+from typing import List, Optional, Union
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+from beartype import beartype
+
+# Decimal numbers, optionally signed or in scientific notation, as Arrow parses them.
+NUMBER_PATTERN = r"^\s*[-+]?(\d+\.?\d*|\.\d+)([eE][-+]?\d+)?\s*$"
+
+# Fields read as missing values by `pd.read_csv`, in any column type.
+PANDAS_NA_VALUES = [
+    "",
+    "#N/A",
+    "#N/A N/A",
+    "#NA",
+    "-1.#IND",
+    "-1.#QNAN",
+    "-NaN",
+    "-nan",
+    "1.#IND",
+    "1.#QNAN",
+    "<NA>",
+    "N/A",
+    "NA",
+    "NULL",
+    "NaN",
+    "None",
+    "n/a",
+    "nan",
+    "null",
+]
+
+
+@beartype
+def read_csv_arrow(
+    file_path: Union[str, Path],
+    separator: str = ",",
+    encoding: str = "utf-8",
+    columns: Optional[List[str]] = None,
+    float_columns: Optional[List[str]] = None,
+) -> pd.DataFrame:
+    """Read a `CSV` file with the multithreaded `pyarrow` reader.
+
+    Only `columns` are parsed, and `float_columns` (e.g., coordinates) are declared
+    `float64` up front rather than inferred, then coerced afterwards. Should one of them
+    hold malformed values (e.g. `"n/a"`, `"unknown"`), they are read as strings once more
+    and turned into nulls by a vectorised `Arrow` kernel, without any Python-level loop.
+
+    Missing values are read as `pd.read_csv` reads them: the same fields (empty ones,
+    `"NA"`, `"null"`, ...) are nulls in string columns too, and end up as `NaN`, columns
+    without any value as `float64`.
+
+    The table is handed to `pandas` block by block, releasing `Arrow` buffers as they
+    are converted, so that numeric columns are not held twice in memory. The reader
+    still buffers the raw file while parsing it in parallel: for files larger than
+    memory, prefer the chunked `load_chunks` of the `CSVLoader`.
+
+    Args:
+        file_path: Path to the `CSV` file.
+        separator: Single-character delimiter of the file.
+        encoding: Character encoding of the file.
+        columns: Columns to read, in file order, all of them if `None`. Columns the file lacks
+            are skipped.
+        float_columns: Columns to parse as `float64`, malformed values becoming `NaN`.
+
+    Returns:
+        The file as a `DataFrame`, with a range index.
+
+    Examples:
+        >>> read_csv_arrow("trips.csv", columns=["lat", "lon", "fare"], float_columns=["lat", "lon"])
+    """
+    if columns is not None:
+        header = pd.read_csv(
+            file_path, sep=separator, encoding=encoding, nrows=0
+        ).columns
+        columns = [column for column in header if column in columns]
+    float_columns = float_columns or []
+
+    def read(column_type: pa.DataType) -> pa.Table:
+        return pacsv.read_csv(
+            file_path,
+            read_options=pacsv.ReadOptions(use_threads=True, encoding=encoding),
+            parse_options=pacsv.ParseOptions(delimiter=separator),
+            convert_options=pacsv.ConvertOptions(
+                include_columns=columns,
+                column_types={column: column_type for column in float_columns},
+                timestamp_parsers=[],
+                null_values=PANDAS_NA_VALUES,
+                strings_can_be_null=True,
+                quoted_strings_can_be_null=True,
+            ),
+        )
+
+    try:
+        table = read(pa.float64())
+    except pa.ArrowInvalid:
+        table = read(pa.string())
+        for column in float_columns:
+            if column not in table.column_names:
+                continue
+            values = table[column]
+            numbers = pc.if_else(
+                pc.match_substring_regex(values, NUMBER_PATTERN), values, None
+            )
+            table = table.set_column(
+                table.schema.get_field_index(column),
+                column,
+                pc.cast(pc.utf8_trim_whitespace(numbers), pa.float64()),
+            )
+    for index, field in enumerate(table.schema):
+        if pa.types.is_null(field.type):
+            table = table.set_column(
+                index, field.name, table[field.name].cast(pa.float64())
+            )
+    dataframe = table.to_pandas(split_blocks=True, self_destruct=True)
+    # Nulls of string and boolean columns come back as None, rather than NaN
+    for column in dataframe.columns[dataframe.dtypes == object]:
+        missing = dataframe[column].isna()
+        if missing.any():
+            dataframe[column] = dataframe[column].mask(missing, np.nan)
+    return dataframe
@@ -0,0 +1,165 @@
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Tuple, Union
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+import pyproj
+import shapely
+from beartype import beartype
+from geopandas.array import GeometryArray
+
+# Points below which an array is transformed in a single call, on the calling thread.
+THREADED_TRANSFORM_MIN_POINTS = 1_000_000
+
+# Threads transforming the chunks of larger arrays; PROJ runs without the GIL.
+MAX_TRANSFORM_WORKERS = 4
+
+
+@lru_cache(maxsize=32)
+def get_transformer(source_crs: Any, target_crs: Any) -> pyproj.Transformer:
+    """Transformer between two coordinate reference systems, built once per pair.
+
+    Building a `Transformer` looks the operation up in the `PROJ` database, which
+    costs more than transforming a few thousand points: every loader (and every chunk
+    of a streamed file) sharing a pair of coordinate reference systems reuses the same
+    one. Coordinates are in `x`, `y` (longitude, latitude) order, as in `GeoPandas`.
+
+    Args:
+        source_crs: Coordinate reference system of the coordinates (e.g., `"EPSG:2263"`).
+        target_crs: Coordinate reference system to transform them to.
+
+    Returns:
+        A thread-safe `pyproj.Transformer`.
+    """
+    return pyproj.Transformer.from_crs(source_crs, target_crs, always_xy=True)
+
+
+@beartype
+def transform_coordinates(
+    x: np.ndarray,
+    y: np.ndarray,
+    source_crs: Any,
+    target_crs: Any,
+    max_workers: int = MAX_TRANSFORM_WORKERS,
+    chunk_size: int = THREADED_TRANSFORM_MIN_POINTS,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Transform raw coordinate arrays from one coordinate reference system to another.
+
+    Transforming the coordinates before building geometries from them skips the
+    round trip through `shapely` objects of `GeoDataFrame.to_crs`. Arrays longer than
+    `chunk_size` are split into chunks transformed concurrently by up to
+    `max_workers` threads, each chunk written in place into the output arrays.
+
+    Missing coordinates (`NaN`) stay missing.
+
+    Args:
+        x: Longitudes or eastings.
+        y: Latitudes or northings.
+        source_crs: Coordinate reference system of `x` and `y`.
+        target_crs: Coordinate reference system to transform them to.
+        max_workers: Maximum number of threads. Default: `4`
+        chunk_size: Number of points per chunk, and below which the arrays are
+            transformed in a single call. Default: `1_000_000`
+
+    Returns:
+        The transformed `x` and `y`, as new `float64` arrays.
+
+    Raises:
+        ValueError: If `x` and `y` differ in length, or `max_workers` or `chunk_size`
+            is not positive.
+
+    Examples:
+        >>> longitudes, latitudes = transform_coordinates(
+        ...     trips["x_coord"].to_numpy(), trips["y_coord"].to_numpy(), "EPSG:2263", "EPSG:4326"
+        ... )
+    """
+    if len(x) != len(y):
+        raise ValueError("x and y must have the same length.")
+    if max_workers < 1 or chunk_size < 1:
+        raise ValueError("max_workers and chunk_size must be positive integers.")
+    transformer = get_transformer(source_crs, target_crs)
+    x_out = np.array(x, dtype=np.float64)
+    y_out = np.array(y, dtype=np.float64)
+    if len(x_out) <= chunk_size or max_workers == 1:
+        transformer.transform(x_out, y_out, inplace=True)
+        return x_out, y_out
+
+    def transform_chunk(start: int) -> None:
+        transformer.transform(
+            x_out[start : start + chunk_size],
+            y_out[start : start + chunk_size],
+            inplace=True,
+        )
+
+    starts = range(0, len(x_out), chunk_size)
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(starts))) as executor:
+        list(executor.map(transform_chunk, starts))
+    return x_out, y_out
+
+
+@beartype
+def points_from_coordinates(
+    x: Union[pd.Series, np.ndarray],
+    y: Union[pd.Series, np.ndarray],
+    source_crs: Any,
+    target_crs: Any,
+) -> GeometryArray:
+    """Points in `target_crs` from coordinates in `source_crs`.
+
+    When the coordinate reference systems differ, the raw coordinates are transformed
+    by `transform_coordinates` before the points are built, rather than the points
+    transformed afterwards: a single pass over two `float64` arrays instead of a
+    second set of `shapely` geometries.
+
+    Args:
+        x: Longitudes or eastings, numeric, missing values as `NaN` or `NA`.
+        y: Latitudes or northings, numeric, missing values as `NaN` or `NA`.
+        source_crs: Coordinate reference system of `x` and `y`.
+        target_crs: Coordinate reference system of the points.
+
+    Returns:
+        The points, with their coordinate reference system set.
+    """
+    if pyproj.CRS.from_user_input(source_crs) == pyproj.CRS.from_user_input(target_crs):
+        return gpd.points_from_xy(x, y, crs=source_crs)
+    x, y = transform_coordinates(
+        pd.Series(x).to_numpy(dtype=np.float64, na_value=np.nan),
+        pd.Series(y).to_numpy(dtype=np.float64, na_value=np.nan),
+        source_crs,
+        target_crs,
+    )
+    return gpd.points_from_xy(x, y, crs=target_crs)
+
+
+@beartype
+def transform_geometries(geometries: gpd.GeoSeries, target_crs: Any) -> gpd.GeoSeries:
+    """Transform geometries to another coordinate reference system, like `to_crs`.
+
+    The coordinates of all geometries are transformed at once by
+    `transform_coordinates`, with a cached transformer, then written into copies of
+    the geometries. Geometries with `z` coordinates go through `GeoSeries.to_crs`.
+
+    Args:
+        geometries: Geometries, with their coordinate reference system set.
+        target_crs: Coordinate reference system to transform them to.
+
+    Returns:
+        The transformed geometries; `geometries` is left untouched.
+    """
+    if shapely.has_z(geometries.array).any():
+        return geometries.to_crs(target_crs)
+    source_crs = geometries.crs
+
+    def transform(coordinates: np.ndarray) -> np.ndarray:
+        x, y = transform_coordinates(
+            coordinates[:, 0], coordinates[:, 1], source_crs, target_crs
+        )
+        return np.column_stack([x, y])
+
+    return gpd.GeoSeries(
+        shapely.transform(geometries.to_numpy(), transform),
+        index=geometries.index,
+        crs=target_crs,
+        name=geometries.name,
+    )
@@ -1,7 +1,7 @@
 import json
 from collections import defaultdict
 from pathlib import Path
-from typing import Optional, Union, Dict, Tuple
+from typing import Any, Optional, Union, Dict, Tuple, Iterator, List
 
 import geopandas as gpd
 import huggingface_hub
@@ -11,11 +11,16 @@ from beartype import beartype
 from urban_mapper import logger
 from urban_mapper.config import DEFAULT_CRS
 from urban_mapper.modules.loader.abc_loader import LoaderBase
+from urban_mapper.modules.loader.loaders.file_loader import FileLoaderBase
 from urban_mapper.modules.loader.loaders.csv_loader import CSVLoader
 from urban_mapper.modules.loader.loaders.parquet_loader import ParquetLoader
 from urban_mapper.modules.loader.loaders.shapefile_loader import ShapefileLoader
 from urban_mapper.modules.loader.loaders.dataframe_loader import DataFrameLoader
 from urban_mapper.modules.loader.loaders.huggingface_loader import HuggingFaceLoader
+from urban_mapper.modules.loader.loaders.partitioned_loader import (
+    PartitionedLoader,
+    MAX_LOAD_WORKERS,
+)
 from urban_mapper.utils import require_attributes
 
 LOADER_FACTORY = {
@@ -24,6 +29,7 @@ LOADER_FACTORY = {
     ".parquet": {"class": ParquetLoader, "requires_columns": True},
     "dataframe": {"class": DataFrameLoader, "requires_columns": True},
     "huggingface": {"class": HuggingFaceLoader, "requires_columns": True},
+    "files": {"class": PartitionedLoader, "requires_columns": True},
 }
 
 
@@ -90,6 +96,10 @@ class LoaderFactory:
         self.number_of_row = None
         self.streaming = False
         self.debug_limit_list_datasets = None
+        self.partition_filter = None
+        self.max_workers = MAX_LOAD_WORKERS
+        self.copy_dataframe = True
+        self.dtype_optimisation = None
         self._instance = None
         self._preview = None
         self._columns_configured = False
@@ -120,8 +130,47 @@ class LoaderFactory:
         )
         return self
 
+    def from_files(
+        self,
+        glob_or_dir: str,
+        partition_filter: Optional[Dict[str, Any]] = None,
+        max_workers: int = MAX_LOAD_WORKERS,
+    ) -> "LoaderFactory":
+        """Configure the factory to load data split into many files.
+
+        This method sets up the factory to load every `CSV`, `Parquet` or shapefile
+        matching a glob pattern, or below a directory, several of them at once, into a
+        single `GeoDataFrame` (see `PartitionedLoader`). Directories named `key=value`
+        (hive partitions) become `key` columns, and `partition_filter` skips the files
+        of the partitions it does not accept without reading them.
+
+        Args:
+            glob_or_dir: Glob pattern (e.g. `"trips/2025-*.parquet"`) or directory of the files.
+            partition_filter: Value, list of values or predicate to keep per partition key (optional).
+            max_workers: Maximum number of files read at once. Default: `8`
+
+        Returns:
+            The LoaderFactory instance for method chaining.
+
+        Examples:
+            >>> gdf = mapper.loader.from_files("trips/", partition_filter={"date": ["2025-01-01", "2025-01-02"]})\
+            ...     .with_columns(longitude_column="lon", latitude_column="lat")\
+            ...     .load()
+        """
+        self._reset()
+        self.source_type = "files"
+        self.source_data = glob_or_dir
+        self.partition_filter = partition_filter
+        self.max_workers = max_workers
+        logger.log(
+            "DEBUG_LOW",
+            f"FROM_FILES: Initialised LoaderFactory with glob_or_dir={glob_or_dir} "
+            f"and partition_filter={partition_filter}",
+        )
+        return self
+
     def from_dataframe(
-        self, dataframe: Union[pd.DataFrame, gpd.GeoDataFrame]
+        self, dataframe: Union[pd.DataFrame, gpd.GeoDataFrame], copy: bool = True
     ) -> "LoaderFactory":
         """Configure the factory to load data from an existing dataframe.
 
@@ -131,6 +180,9 @@ class LoaderFactory:
 
         Args:
             dataframe: The pandas DataFrame or geopandas GeoDataFrame to load.
+            copy: Whether to load a copy of `dataframe`. With `False`, the loaded data
+                shares its columns with `dataframe`, allocating only the geometry and
+                coerced coordinates (see `DataFrameLoader`). Default: `True`
 
         Returns:
             The LoaderFactory instance for method chaining.
@@ -141,10 +193,14 @@ class LoaderFactory:
             >>> loader = mapper.loader.from_dataframe(df)
             >>> # For regular DataFrames, you must specify coordinate columns:
             >>> loader.with_columns(longitude_column="lon", latitude_column="lat")
+            >>> # Large frames, with pandas copy-on-write enabled:
+            >>> pd.options.mode.copy_on_write = True
+            >>> loader = mapper.loader.from_dataframe(df, copy=False)
         """
         self._reset()
         self.source_type = "dataframe"
         self.source_data = dataframe
+        self.copy_dataframe = copy
         logger.log(
             "DEBUG_LOW",
             f"FROM_DATAFRAME: Initialised LoaderFactory with dataframe={dataframe}",
@@ -296,6 +352,57 @@ class LoaderFactory:
         )
         return self
 
+    def with_dtype_optimisation(
+        self,
+        float32_coordinates: bool = False,
+        max_category_ratio: float = 0.5,
+        arrow_strings: bool = True,
+        keep: Optional[List[str]] = None,
+    ) -> "LoaderFactory":
+        """Store the loaded columns in the smallest dtypes holding their values.
+
+        This method configures the loader to optimise the dtypes of the loaded data:
+        integers are downcast, floats become `float32` when no value changes, and
+        strings become categoricals when they take few distinct values, `Arrow` strings
+        otherwise. Savings per column are kept in the `dtype_savings` of the loader.
+
+        !!! note "Enrichers keep their semantics"
+            Within an `UrbanPipeline`, the columns enrichers read (`group_by`,
+            `values_from`, `where`, `weight`) keep the dtypes they are loaded with, so
+            that enrichments are unchanged. Pipelines with enrichers reading unknown
+            columns skip the optimisation altogether.
+
+        Args:
+            float32_coordinates: Whether to store latitude and longitude as `float32`,
+                within about a metre. Geometries keep full precision. Default: `False`
+            max_category_ratio: Maximum number of distinct values per value for strings
+                to become categoricals. Default: `0.5`
+            arrow_strings: Whether to store other strings as `Arrow` strings. Default: `True`
+            keep: Columns to leave as loaded (optional).
+
+        Returns:
+            The LoaderFactory instance for method chaining.
+
+        Examples:
+            >>> loader = mapper.loader.from_file("data/taxi_trips.parquet")\
+            ...     .with_columns(longitude_column="lon", latitude_column="lat")\
+            ...     .with_dtype_optimisation(float32_coordinates=True)\
+            ...     .build()
+            >>> gdf = loader.load()
+            >>> loader.dtype_savings
+        """
+        self.dtype_optimisation = {
+            "float32_coordinates": float32_coordinates,
+            "max_category_ratio": max_category_ratio,
+            "arrow_strings": arrow_strings,
+            "keep": keep,
+        }
+        logger.log(
+            "DEBUG_LOW",
+            f"WITH_DTYPE_OPTIMISATION: Initialised LoaderFactory with {self.dtype_optimisation}",
+        )
+        return self
+
     @require_attributes(["source_type", "source_data"])
     def load(self) -> gpd.GeoDataFrame:
         """Load the data and return it as a `GeoDataFrame`.
@@ -323,6 +430,38 @@ class LoaderFactory:
         self.build()
         return self._instance.load()
 
+    @require_attributes(["source_type", "source_data"])
+    def load_chunks(self, chunk_size: int = 100_000) -> Iterator[gpd.GeoDataFrame]:
+        """Load the file as a stream of `GeoDataFrames` of at most `chunk_size` rows.
+
+        Like `load()`, but yields the data chunk by chunk (`CSV` chunks, `Parquet` or
+        Hugging Face record batches), each one renamed and projected like the whole
+        source would be, so that sources larger than memory can be processed.
+
+        Args:
+            chunk_size: Maximum number of rows per chunk. Default: `100_000`
+
+        Returns:
+            An iterator over the chunks.
+
+        Raises:
+            ValueError: If the source is not a file or dataset that can be streamed, or the
+                configuration is invalid.
+
+        Examples:
+            >>> for chunk in mapper.loader.from_file("data/points.csv")\
+            ...     .with_columns(longitude_column="lon", latitude_column="lat")\
+            ...     .load_chunks(chunk_size=500_000):
+            ...     process(chunk)
+        """
+        self.build()
+        if not isinstance(self._instance, (FileLoaderBase, HuggingFaceLoader)):
+            raise ValueError(
+                "Chunked loading requires a file or Hugging Face source. "
+                "Use from_file(), from_files() or from_huggingface()."
+            )
+        return self._instance.load_chunks(chunk_size)
+
     def build(self) -> LoaderBase:
         """Build and return a `loader` instance without loading the data.
         
@@ -364,7 +503,17 @@ class LoaderFactory:
         loader_class = None
         input_data = None
 
-        if self.source_type == "file":
+        if self.source_type == "files":
+            if (has_geometry and has_lat_or_long) or (
+                not has_geometry and not has_lat_and_long
+            ):
+                raise ValueError(
+                    "Loading several files requires latitude and longitude columns or only geometry column. "
+                    "Call with_columns() with valid column names."
+                )
+            file_path = self.source_data
+            loader_class = LOADER_FACTORY[self.source_type]["class"]
+        elif self.source_type == "file":
             file_path = self.source_data
             file_ext = Path(self.source_data).suffix.lower()
             if file_ext not in LOADER_FACTORY:
@@ -386,7 +535,7 @@ class LoaderFactory:
                     "DataFrame loading requires latitude and longitude columns or only geometry column. Call with_columns() with valid column names."
                 )
             loader_class = LOADER_FACTORY[self.source_type]["class"]
-            input_data = self.source_data.copy()
+            input_data = self.source_data
         elif self.source_type == "huggingface":
             if (has_geometry and has_lat_or_long) or (
                 not has_geometry and not has_lat_and_long
@@ -405,6 +554,7 @@ class LoaderFactory:
             geometry_column=self.geometry_column,
             coordinate_reference_system=self.crs,
             map_columns=self.map_columns,
+            dtype_optimisation=self.dtype_optimisation,
             ## specific to FileLoaders (CSVLoader, ParquetLoader, and ShapefileLoader)
             file_path=file_path,
             ## specific to DataFrameLoader
@@ -414,6 +564,19 @@ class LoaderFactory:
             number_of_rows=self.number_of_row,
             streaming=self.streaming,
             debug_limit_list_datasets=self.debug_limit_list_datasets,
+            ## specific to PartitionedLoader
+            **(
+                {
+                    "partition_filter": self.partition_filter,
+                    "max_workers": self.max_workers,
+                }
+                if self.source_type == "files"
+                else {}
+            ),
+            ## specific to DataFrameLoader
+            **(
+                {"copy": self.copy_dataframe} if self.source_type == "dataframe" else {}
+            ),
         )
         if self._preview is not None:
             self.preview(format=self._preview["format"])
@@ -4,6 +4,7 @@ from .shapefile_loader import ShapefileLoader
 from .parquet_loader import ParquetLoader
 from .dataframe_loader import DataFrameLoader
 from .huggingface_loader import HuggingFaceLoader
+from .partitioned_loader import PartitionedLoader
 
 __all__ = [
     "FileLoaderBase",
@@ -12,4 +13,5 @@ __all__ = [
     "ParquetLoader",
     "DataFrameLoader",
     "HuggingFaceLoader",
+    "PartitionedLoader",
 ]
@@ -1,11 +1,17 @@
 import pandas as pd
 import geopandas as gpd
-from shapely import wkt
 from beartype import beartype
 from pathlib import Path
-from typing import Union, Optional, Any, Tuple
+from typing import Union, Optional, Any, Tuple, Iterator, List
 
-from urban_mapper.modules.loader.loaders.file_loader import FileLoaderBase
+from urban_mapper.modules.loader.loaders.file_loader import (
+    FileLoaderBase,
+    BOUNDED_CHUNK_SIZE,
+)
+from urban_mapper.modules.loader.helpers import (
+    read_csv_arrow,
+    estimate_csv_column_bytes,
+)
 from urban_mapper.config import DEFAULT_CRS
 from urban_mapper.utils.helpers import require_either_or_attributes
 
@@ -28,6 +34,19 @@ class CSVLoader(FileLoaderBase):
             If a tuple (source_crs, target_crs), it defines a conversion from the source CRS to the target CRS (default target CRS: 'EPSG:4326').
         separator (str): The delimiter character used in the CSV file. Default: `","`
         encoding (str): The character encoding of the CSV file. Default: `"utf-8"`
+        engine (str): `"pyarrow"` for the multithreaded `Arrow` reader, or a `pandas.read_csv`
+            engine (`"c"`, `"python"`). Default: `"pyarrow"`
+        columns (Optional[list[str]]): Columns to read from the CSV file, the coordinate or
+            geometry columns being always read. Default: `None`, which reads all columns.
+
+    !!! tip "Arrow Reader"
+        With the `pyarrow` engine, only `columns` are parsed, and the latitude and longitude
+        columns are declared `float64` rather than inferred, malformed values becoming
+        nulls. Multi-character separators fall back to `pandas`.
+
+    !!! tip "Streaming"
+        `load_chunks(chunk_size=...)` reads the file `chunk_size` rows at a time, rather
+        than all at once.
 
     Examples:
         >>> from urban_mapper.modules.loader import CSVLoader
@@ -56,6 +75,15 @@ class CSVLoader(FileLoaderBase):
         ... )
         >>> gdf = loader.load()
         >>>
+        >>> # Only reading the columns used
+        >>> loader = CSVLoader(
+        ...     file_path="taxi_trips.csv",
+        ...     latitude_column="pickup_lat",
+        ...     longitude_column="pickup_lng",
+        ...     columns=["fare_amount", "passenger_count"]
+        ... )
+        >>> gdf = loader.load()
+        >>>
         >>> # With CRS
         >>> loader = CSVLoader(
         ...     file_path="custom_data.csv",
@@ -84,6 +112,8 @@ class CSVLoader(FileLoaderBase):
         coordinate_reference_system: Union[str, Tuple[str, str]] = DEFAULT_CRS,
         separator: str = ",",
         encoding: str = "utf-8",
+        engine: str = "pyarrow",
+        columns: Optional[list[str]] = None,
         **additional_loader_parameters: Any,
     ) -> None:
         super().__init__(
@@ -96,6 +126,8 @@ class CSVLoader(FileLoaderBase):
         )
         self.separator = separator
         self.encoding = encoding
+        self.engine = engine
+        self.columns = columns
 
     @require_either_or_attributes(
         [["latitude_column", "longitude_column"], ["geometry_column"]],
@@ -104,9 +136,13 @@ class CSVLoader(FileLoaderBase):
     def _load(self) -> gpd.GeoDataFrame:
         """Load data from a CSV file and convert it to a `GeoDataFrame`.
 
-        This method reads a `CSV` file using pandas, validates the latitude and
-        longitude columns, and converts the data to a `GeoDataFrame` with point
-        geometries using the specified coordinate reference system.
+        This method reads a `CSV` file with the `Arrow` reader (see `read_csv_arrow`) or
+        `pandas`, validates the latitude and longitude columns, and converts the data to a
+        `GeoDataFrame` with point geometries using the specified coordinate reference system.
+
+        With `bounds` (see `restrict_to_bounds`), the file is read in chunks, each one
+        dropping its rows outside the bounds before the next is read, so that only the
+        rows within them are held and converted.
 
         Returns:
             A `GeoDataFrame` containing the loaded data with point geometries
@@ -119,51 +155,109 @@ class CSVLoader(FileLoaderBase):
             pd.errors.ParserError: If the CSV file cannot be parsed.
             UnicodeDecodeError: If the file encoding is incorrect.
         """
-        dataframe = pd.read_csv(
-            self.file_path, sep=self.separator, encoding=self.encoding
-        )
-
-        if self.latitude_column != "" and self.longitude_column != "":
-            if self.latitude_column not in dataframe.columns:
-                raise ValueError(
-                    f"Column '{self.latitude_column}' not found in the CSV file."
-                )
-            if self.longitude_column not in dataframe.columns:
-                raise ValueError(
-                    f"Column '{self.longitude_column}' not found in the CSV file."
-                )
-
-            # Ensure latitude and longitude columns are numeric
-            dataframe[self.latitude_column] = pd.to_numeric(
-                dataframe[self.latitude_column], errors="coerce"
-            )
-            dataframe[self.longitude_column] = pd.to_numeric(
-                dataframe[self.longitude_column], errors="coerce"
-            )
-            geometry = gpd.points_from_xy(
-                dataframe[self.longitude_column],
-                dataframe[self.latitude_column],
+        if self.bounds is not None:
+            dataframe = pd.concat(self._read_chunks(BOUNDED_CHUNK_SIZE))
+        elif self.engine == "pyarrow" and len(self.separator) == 1:
+            dataframe = read_csv_arrow(
+                self.file_path,
+                separator=self.separator,
+                encoding=self.encoding,
+                columns=self._read_columns(),
+                float_columns=[
+                    column
+                    for column in (self.latitude_column, self.longitude_column)
+                    if column != ""
+                ],
             )
         else:
-            if self.geometry_column not in dataframe.columns:
-                raise ValueError(
-                    f"Column '{self.geometry_column}' not found in the CSV file."
-                )
-
-            filter_not_na = dataframe[self.geometry_column].notna()
-            dataframe.loc[filter_not_na, self.geometry_column] = dataframe.loc[
-                filter_not_na, self.geometry_column
-            ].apply(wkt.loads)
-            geometry = self.geometry_column
-
-        geodataframe = gpd.GeoDataFrame(
-            dataframe,
-            geometry=geometry,
-            crs=self.coordinate_reference_system[0]
-            if isinstance(self.coordinate_reference_system, tuple)
-            else self.coordinate_reference_system,
+            dataframe = pd.read_csv(
+                self.file_path,
+                sep=self.separator,
+                encoding=self.encoding,
+                engine=None if self.engine == "pyarrow" else self.engine,
+                usecols=self._usecols(),
+            )
+
+        return self._to_geodataframe(dataframe, "CSV")
+
+    def _read_columns(self) -> Optional[list[str]]:
+        """Columns to read, `columns` plus the coordinate or geometry ones, `None` for all."""
+        if self.columns is None:
+            return None
+        return list(dict.fromkeys(self.columns + self._spatial_columns()))
+
+    def project_columns(self, columns: List[str]) -> int:
+        """Only read `columns` (and those already selected), besides the coordinates.
+
+        Args:
+            columns: Columns to read, as named once loaded.
+
+        Returns:
+            Estimated bytes of the file held by the columns no longer read
+            (see `estimate_csv_column_bytes`).
+        """
+        self.columns = list(
+            dict.fromkeys((self.columns or []) + self._source_columns(columns))
+        )
+        read_columns = set(self._read_columns())
+        column_bytes = estimate_csv_column_bytes(
+            self.file_path, separator=self.separator, encoding=self.encoding
+        )
+        return sum(
+            size for column, size in column_bytes.items() if column not in read_columns
         )
-        return geodataframe
+
+    def _usecols(self) -> Any:
+        """`usecols` for `pandas.read_csv`, skipping columns the file lacks."""
+        columns = self._read_columns()
+        return None if columns is None else (lambda column: column in columns)
+
+    @require_either_or_attributes(
+        [["latitude_column", "longitude_column"], ["geometry_column"]],
+        error_msg="Either both 'latitude_column' and 'longitude_column' must be set, or 'geometry_column' must be set.",
+    )
+    def _load_chunks(self, chunk_size: int) -> Iterator[gpd.GeoDataFrame]:
+        """Read the `CSV` file `chunk_size` rows at a time.
+
+        Args:
+            chunk_size: Maximum number of rows per chunk.
+
+        Yields:
+            `GeoDataFrames` of at most `chunk_size` rows, indexed by row number in the file.
+            With `bounds`, only the rows within them.
+        """
+        for dataframe in self._read_chunks(chunk_size):
+            yield self._to_geodataframe(dataframe, "CSV")
+
+    def _read_chunks(self, chunk_size: int) -> Iterator[pd.DataFrame]:
+        """Read the `CSV` file with `pandas`, `chunk_size` rows at a time, within `bounds` if set."""
+        with pd.read_csv(
+            self.file_path,
+            sep=self.separator,
+            encoding=self.encoding,
+            engine=None if self.engine == "pyarrow" else self.engine,
+            usecols=self._usecols(),
+            chunksize=chunk_size,
+        ) as reader:
+            for dataframe in reader:
+                if self.bounds is not None:
+                    dataframe = dataframe[self._within_bounds(dataframe)]
+                yield dataframe
+
+    def restrict_to_bounds(
+        self, bounds: Optional[Tuple[float, float, float, float]]
+    ) -> bool:
+        """Drop the rows outside `bounds` chunk by chunk while reading the file.
+
+        Args:
+            bounds: Bounding box (`min_x`, `min_y`, `max_x`, `max_y`) of the rows to keep,
+                replacing any previous one. `None` reads every row again.
+
+        Returns:
+            Whether rows are tested against `bounds`: only with latitude and longitude
+            columns, and no reprojection.
+        """
+        return self._set_bounds(bounds)
 
     def preview(self, format: str = "ascii") -> Any:
         """Generate a preview of this `CSV` loader.
@@ -191,6 +285,8 @@ class CSVLoader(FileLoaderBase):
                 f"  Geometry Column: {self.geometry_column}\n"
                 f"  Separator: {self.separator}\n"
                 f"  Encoding: {self.encoding}\n"
+                f"  Engine: {self.engine}\n"
+                f"  Columns: {self.columns if self.columns else 'All columns'}\n"
                 f"  CRS: {self.coordinate_reference_system}\n"
                 f"  Additional params: {self.additional_loader_parameters}\n"
             )
@@ -203,6 +299,8 @@ class CSVLoader(FileLoaderBase):
                 "geometry_column": self.geometry_column,
                 "separator": self.separator,
                 "encoding": self.encoding,
+                "engine": self.engine,
+                "columns": self.columns if self.columns else "All columns",
                 "crs": self.coordinate_reference_system,
                 "additional_params": self.additional_loader_parameters,
             }
@@ -1,10 +1,14 @@
 import pandas as pd
 import geopandas as gpd
-from shapely import wkt
 from beartype import beartype
 from typing import Union, Optional, Any, Tuple
 
 from urban_mapper.modules.loader.abc_loader import LoaderBase
+from urban_mapper.modules.loader.helpers import (
+    parse_geometries,
+    points_from_coordinates,
+    transform_geometries,
+)
 from urban_mapper.config import DEFAULT_CRS
 
 
@@ -21,6 +25,17 @@ class DataFrameLoader(LoaderBase):
         latitude_column (str): Name of the column containing latitude values.
         longitude_column (str): Name of the column containing longitude values.
         geometry_column (str): Name of the column containing geometry data in WKT format.
+        copy (bool): Whether to copy `input_dataframe` up front. Default: `True`
+
+    !!! tip "Zero-copy loading"
+        With `copy=False`, the loaded `GeoDataFrame` shares every column of
+        `input_dataframe` under `pandas` copy-on-write semantics: only the geometry and
+        the coerced coordinates are allocated, so loading a frame takes little more
+        memory than the frame itself. `input_dataframe` is never written to.
+
+        Without `pd.options.mode.copy_on_write = True` though, later in-place edits of
+        the loaded data (e.g. `gdf.loc[mask, "fare"] = 0`) write through to
+        `input_dataframe` as well, hence the copy by default.
         coordinate_reference_system (Union[str, Tuple[str, str]]):
             If a string, it specifies the coordinate reference system to use (default: 'EPSG:4326').
             If a tuple (source_crs, target_crs), it defines a conversion from the source CRS to the target CRS (default target CRS: 'EPSG:4326').
@@ -80,6 +95,7 @@ class DataFrameLoader(LoaderBase):
         longitude_column: Optional[str] = None,
         geometry_column: Optional[str] = None,
         coordinate_reference_system: Union[str, Tuple[str, str]] = DEFAULT_CRS,
+        copy: bool = True,
         **additional_loader_parameters: Any,
     ) -> None:
         super().__init__(
@@ -89,7 +105,8 @@ class DataFrameLoader(LoaderBase):
             coordinate_reference_system=coordinate_reference_system,
             **additional_loader_parameters,
         )
-        self.dataframe = input_dataframe.copy()
+        self.copy = copy
+        self.dataframe = input_dataframe.copy() if copy else input_dataframe
 
     def _load(self) -> gpd.GeoDataFrame:
         """Load spatial data from a dataframe.
@@ -110,48 +127,59 @@ class DataFrameLoader(LoaderBase):
             >>> loader = DataFrameLoader(dataframe, latitude_column="pickup_lat", longitude_column="pickup_lng")
             >>> gdf = loader.load()
         """
-        if isinstance(self.dataframe, gpd.GeoDataFrame):
-            geo_dataframe: gpd.GeoDataFrame = self.dataframe
-        else:
-            if self.latitude_column != "" and self.longitude_column != "":
-                # Ensure latitude and longitude columns are numeric
-                self.dataframe[self.latitude_column] = pd.to_numeric(
-                    self.dataframe[self.latitude_column], errors="coerce"
-                )
-                self.dataframe[self.longitude_column] = pd.to_numeric(
-                    self.dataframe[self.longitude_column], errors="coerce"
-                )
-                geometry = gpd.points_from_xy(
-                    self.dataframe[self.longitude_column],
-                    self.dataframe[self.latitude_column],
+        with pd.option_context("mode.copy_on_write", True):
+            # Columns are only ever replaced, never written to, so they stay shared
+            dataframe = self.dataframe.copy(deep=False)
+            source_coordinate_reference_system, target_coordinate_reference_system = (
+                self.coordinate_reference_system
+                if isinstance(self.coordinate_reference_system, tuple)
+                else (
+                    self.coordinate_reference_system,
+                    self.coordinate_reference_system,
                 )
+            )
+            if isinstance(dataframe, gpd.GeoDataFrame):
+                geo_dataframe: gpd.GeoDataFrame = dataframe
             else:
-                filter_not_na = self.dataframe[self.geometry_column].notna()
-                self.dataframe.loc[filter_not_na, self.geometry_column] = (
-                    self.dataframe.loc[filter_not_na, self.geometry_column].apply(
-                        wkt.loads
+                if self.latitude_column != "" and self.longitude_column != "":
+                    # Ensure latitude and longitude columns are numeric
+                    dataframe[self.latitude_column] = pd.to_numeric(
+                        dataframe[self.latitude_column], errors="coerce"
                     )
-                )
-                geometry = self.geometry_column
-
-            geo_dataframe = gpd.GeoDataFrame(
-                self.dataframe,
-                geometry=geometry,
-                crs=self.coordinate_reference_system[0]
-                if isinstance(self.coordinate_reference_system, tuple)
-                else self.coordinate_reference_system,
-            )
+                    dataframe[self.longitude_column] = pd.to_numeric(
+                        dataframe[self.longitude_column], errors="coerce"
+                    )
+                    # Points are built in the target coordinate reference system
+                    geometry = points_from_coordinates(
+                        dataframe[self.longitude_column],
+                        dataframe[self.latitude_column],
+                        source_coordinate_reference_system,
+                        target_coordinate_reference_system,
+                    )
+                    crs = None
+                else:
+                    dataframe[self.geometry_column] = gpd.GeoSeries(
+                        parse_geometries(dataframe[self.geometry_column]),
+                        index=dataframe.index,
+                    )
+                    geometry = self.geometry_column
+                    crs = source_coordinate_reference_system
 
-        target_coordinate_reference_system = (
-            self.coordinate_reference_system[1]
-            if isinstance(self.coordinate_reference_system, tuple)
-            else self.coordinate_reference_system
-        )
+                geo_dataframe = gpd.GeoDataFrame(
+                    dataframe, geometry=geometry, crs=crs, copy=False
+                )
 
-        if geo_dataframe.crs is None:
-            geo_dataframe.set_crs(target_coordinate_reference_system, inplace=True)
-        elif geo_dataframe.crs.to_string() != target_coordinate_reference_system:
-            geo_dataframe = geo_dataframe.to_crs(target_coordinate_reference_system)
+            # Replace the geometry column rather than the frame, or its CRS in place,
+            # which the geometries of `input_dataframe` would share
+            geometry_name = geo_dataframe.geometry.name
+            if geo_dataframe.crs is None:
+                geo_dataframe[geometry_name] = geo_dataframe.geometry.set_crs(
+                    target_coordinate_reference_system
+                )
+            elif geo_dataframe.crs.to_string() != target_coordinate_reference_system:
+                geo_dataframe[geometry_name] = transform_geometries(
+                    geo_dataframe.geometry, target_coordinate_reference_system
+                )
 
         return geo_dataframe
 
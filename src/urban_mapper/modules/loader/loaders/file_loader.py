@@ -1,8 +1,19 @@
 from pathlib import Path
-from typing import Union, Optional, Any, Tuple
+from typing import Union, Optional, Any, Tuple, Iterator
+import geopandas as gpd
+import numpy as np
+import pandas as pd
 from beartype import beartype
 from urban_mapper.config import DEFAULT_CRS
 from urban_mapper.modules.loader.abc_loader import LoaderBase
+from urban_mapper.modules.loader.helpers import (
+    ensure_coordinate_reference_system,
+    parse_geometries,
+    points_from_coordinates,
+)
+
+# Rows read at once when dropping those outside bounds while loading a file.
+BOUNDED_CHUNK_SIZE = 1_000_000
 
 
 @beartype
@@ -14,6 +25,10 @@ class FileLoaderBase(LoaderBase):
     file formats and converting them to `GeoDataFrames` data structure. They handle coordinate system
     transformations and validation of required spatial columns.
 
+    File loaders reading tables (`CSV`, `Parquet`) can also stream them with
+    `load_chunks`, yielding `GeoDataFrames` of bounded size rather than the whole file,
+    and skip the rows outside a bounding box while reading them (see `restrict_to_bounds`).
+
     Attributes:
         file_path (Path): Path to the file to load.
         latitude_column (str): Name of the column containing latitude values.
@@ -41,3 +56,168 @@ class FileLoaderBase(LoaderBase):
             **additional_loader_parameters,
         )
         self.file_path: Path = Path(file_path)
+        self.bounds: Optional[Tuple[float, float, float, float]] = None
+
+    def load_chunks(self, chunk_size: int = 100_000) -> Iterator[gpd.GeoDataFrame]:
+        """Load the file as a stream of `GeoDataFrames` of at most `chunk_size` rows.
+
+        Each chunk is converted, renamed (`map_columns`) and projected to the target
+        coordinate reference system like the `GeoDataFrame` returned by `load()`, so
+        that concatenating the chunks gives the same data, while no more than one
+        chunk is held in memory.
+
+        !!! tip "Streaming"
+            Downstream steps working per row (e.g. filters, mappings, incremental
+            enrichments) can consume the chunks one by one, for files larger than memory.
+
+        Args:
+            chunk_size: Maximum number of rows per chunk. Default: `100_000`
+
+        Yields:
+            `GeoDataFrames` of at most `chunk_size` rows, in file order, indexed
+            contiguously across chunks.
+
+        Raises:
+            ValueError: If `chunk_size` is not positive, or the loader cannot stream its file.
+
+        Examples:
+            >>> loader = CSVLoader("taxi_trips.csv", latitude_column="lat", longitude_column="lon")
+            >>> for chunk in loader.load_chunks(chunk_size=500_000):
+            ...     process(chunk)
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer.")
+        for chunk in self._load_chunks(chunk_size):
+            yield self._finalise_chunk(chunk)
+
+    def _load_chunks(self, chunk_size: int) -> Iterator[gpd.GeoDataFrame]:
+        """Read the file chunk by chunk, each converted to a `GeoDataFrame`.
+
+        Args:
+            chunk_size: Maximum number of rows per chunk.
+
+        Yields:
+            `GeoDataFrames` of at most `chunk_size` rows.
+
+        Raises:
+            ValueError: If the loader cannot stream its file.
+        """
+        raise ValueError(f"{type(self).__name__} does not support chunked loading.")
+
+    @ensure_coordinate_reference_system
+    def _finalise_chunk(self, chunk: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
+        """Rename and project a chunk like `load()` does for the whole file."""
+        return self._map_columns(chunk)
+
+    def _set_bounds(self, bounds: Optional[Tuple[float, float, float, float]]) -> bool:
+        """Keep `bounds`, replacing previous ones, if rows can be tested against them.
+
+        Only latitude/longitude loaders not reprojecting their data can test the raw
+        coordinates against bounds given in the coordinate reference system of the
+        loaded data. `None` lifts the restriction.
+        """
+        if bounds is None:
+            self.bounds = None
+            return True
+        if self.latitude_column == "" or self.longitude_column == "":
+            return False
+        if isinstance(self.coordinate_reference_system, tuple) and (
+            self.coordinate_reference_system[0] != self.coordinate_reference_system[1]
+        ):
+            return False
+        self.bounds = bounds
+        return True
+
+    def _within_bounds(self, dataframe: pd.DataFrame) -> np.ndarray:
+        """Whether the coordinates of every row fall within `bounds`, edges included.
+
+        Matches the `.cx` selection of the `BoundingBoxFilter` on the points built from
+        them: rows with missing or malformed coordinates are outside.
+        """
+        if (
+            self.longitude_column not in dataframe.columns
+            or self.latitude_column not in dataframe.columns
+        ):
+            return np.ones(len(dataframe), dtype=bool)
+        min_x, min_y, max_x, max_y = self.bounds
+        longitudes = pd.to_numeric(
+            dataframe[self.longitude_column], errors="coerce"
+        ).to_numpy(dtype=float)
+        latitudes = pd.to_numeric(
+            dataframe[self.latitude_column], errors="coerce"
+        ).to_numpy(dtype=float)
+        return (
+            (longitudes >= min_x)
+            & (longitudes <= max_x)
+            & (latitudes >= min_y)
+            & (latitudes <= max_y)
+        )
+
+    def _to_geodataframe(
+        self, dataframe: pd.DataFrame, file_format: str, crs: Any = None
+    ) -> gpd.GeoDataFrame:
+        """Convert a table read from the file to a `GeoDataFrame`.
+
+        Builds point geometries from the latitude and longitude columns, coerced to
+        numbers and transformed to the target coordinate reference system beforehand
+        (see `points_from_coordinates`), or parses the geometry column at once, whether
+        `WKT`, `WKB` or `GeoArrow` encoded (see `parse_geometries`).
+
+        Args:
+            dataframe: Table read from the file (or a chunk of it).
+            file_format: Name of the file format, for error messages.
+            crs: Coordinate reference system recorded in the file, overriding the
+                source one of `coordinate_reference_system` (optional).
+
+        Returns:
+            A `GeoDataFrame` of points in the target coordinate reference system, or of
+            parsed geometries in the source one.
+
+        Raises:
+            ValueError: If the specified columns are not found in the table.
+        """
+        if crs is None:
+            crs = (
+                self.coordinate_reference_system[0]
+                if isinstance(self.coordinate_reference_system, tuple)
+                else self.coordinate_reference_system
+            )
+        if self.latitude_column != "" and self.longitude_column != "":
+            if self.latitude_column not in dataframe.columns:
+                raise ValueError(
+                    f"Column '{self.latitude_column}' not found in the {file_format} file."
+                )
+            if self.longitude_column not in dataframe.columns:
+                raise ValueError(
+                    f"Column '{self.longitude_column}' not found in the {file_format} file."
+                )
+
+            # Ensure latitude and longitude columns are numeric
+            dataframe[self.latitude_column] = pd.to_numeric(
+                dataframe[self.latitude_column], errors="coerce"
+            )
+            dataframe[self.longitude_column] = pd.to_numeric(
+                dataframe[self.longitude_column], errors="coerce"
+            )
+            geometry = points_from_coordinates(
+                dataframe[self.longitude_column],
+                dataframe[self.latitude_column],
+                crs,
+                self.coordinate_reference_system[1]
+                if isinstance(self.coordinate_reference_system, tuple)
+                else self.coordinate_reference_system,
+            )
+            crs = None
+        else:
+            if self.geometry_column not in dataframe.columns:
+                raise ValueError(
+                    f"Column '{self.geometry_column}' not found in the {file_format} file."
+                )
+
+            dataframe[self.geometry_column] = gpd.GeoSeries(
+                parse_geometries(dataframe[self.geometry_column]),
+                index=dataframe.index,
+            )
+            geometry = self.geometry_column
+
+        return gpd.GeoDataFrame(dataframe, geometry=geometry, crs=crs, copy=False)
@@ -1,8 +1,8 @@
 import pandas as pd
 import geopandas as gpd
+import pyarrow as pa
 from beartype import beartype
-from typing import Union, Optional, Any, Tuple
-from itertools import islice
+from typing import Union, Optional, Any, Tuple, List, Iterator
 import datasets
 from thefuzz import process
 
@@ -49,6 +49,12 @@ class HuggingFaceLoader(LoaderBase):
 
         Dive deeper at [oscur.org](https://oscur.org/) for other open-source initiatives and tools.
 
+    !!! tip "Arrow All The Way"
+        Datasets are converted to `pandas` from their underlying `Arrow` table, column by
+        column, never row by row through Python dictionaries. In streaming mode, rows are
+        fetched as `Arrow` record batches until `number_of_rows` are read, and
+        `load_chunks` yields them as `GeoDataFrames` one batch at a time.
+
     !!! warning "Potential Errors Explained"
         Mistakes happen—here’s what might go wrong and how we help:
 
@@ -143,63 +149,164 @@ class HuggingFaceLoader(LoaderBase):
         self.streaming = streaming
         self.debug_limit_list_datasets = debug_limit_list_datasets
         self.source_data = None
+        self.columns: Optional[List[str]] = None
 
     def _load(self) -> gpd.GeoDataFrame:
         try:
-            if self.number_of_rows:
-                if self.streaming:
-                    # Use streaming mode to fetch only the required rows
-                    dataset = datasets.load_dataset(
-                        self.repo_id, split="train", streaming=True
-                    )
-                    limited_rows = list(islice(dataset, self.number_of_rows))
-                    self.source_data = pd.DataFrame(limited_rows)
-                    logger.log(
-                        "DEBUG_LOW",
-                        f"Loaded {self.number_of_rows} rows in streaming mode from {self.repo_id}.",
-                    )
-                else:
-                    # Use slicing with split for non-streaming mode
-                    dataset = datasets.load_dataset(
-                        self.repo_id, split=f"train[:{self.number_of_rows}]"
-                    )
-                    self.source_data = pd.DataFrame(dataset)
-                    logger.log(
-                        "DEBUG_LOW",
-                        f"Loaded {self.number_of_rows} rows from {self.repo_id}.",
-                    )
+            if self.streaming:
+                # Streamed datasets are only read through their record batches, up to
+                # `number_of_rows` rows if set
+                table = pa.concat_tables(self._stream_batches(self._dataset()))
+                logger.log(
+                    "DEBUG_LOW",
+                    f"Loaded {table.num_rows} rows in streaming mode from {self.repo_id}.",
+                )
             else:
-                dataset = datasets.load_dataset(self.repo_id, split="train")
-                self.source_data = pd.DataFrame(dataset)
-                logger.log("DEBUG_LOW", f"Loaded dataset {self.repo_id}.")
-
-            self.additional_loader_parameters.pop("input_dataframe", None)
-            dataframe_loader = DataFrameLoader(
-                input_dataframe=self.source_data,
-                latitude_column=self.latitude_column,
-                longitude_column=self.longitude_column,
-                geometry_column=self.geometry_column,
-                coordinate_reference_system=self.coordinate_reference_system,
-                **self.additional_loader_parameters,
-            )
+                # Slice the memory-mapped Arrow table, without going through rows
+                table = self._dataset().with_format("arrow")[:]
+                logger.log(
+                    "DEBUG_LOW",
+                    f"Loaded {'all' if self.number_of_rows is None else self.number_of_rows} "
+                    f"rows from {self.repo_id}.",
+                )
 
-            return dataframe_loader.load()
+            self.source_data = self._to_pandas(table)
+            return self._convert(self.source_data)
 
         except datasets.exceptions.DatasetNotFoundError as e:
-            dataset_dict = self._build_dataset_dict(
-                limit=self.debug_limit_list_datasets
+            self._raise_not_found(e)
+
+        except Exception as e:
+            raise ValueError(f"Error loading dataset '{self.repo_id}': {str(e)}") from e
+
+    def load_chunks(self, chunk_size: int = 100_000) -> Iterator[gpd.GeoDataFrame]:
+        """Load the dataset as a stream of `GeoDataFrames` of at most `chunk_size` rows.
+
+        Every chunk is an `Arrow` record batch of the dataset (streamed in streaming
+        mode, sliced from the memory-mapped table otherwise), converted, renamed and
+        projected like the `GeoDataFrame` returned by `load()`, so that no more than one
+        chunk is held in memory.
+
+        Args:
+            chunk_size: Maximum number of rows per chunk. Default: `100_000`
+
+        Yields:
+            `GeoDataFrames` of at most `chunk_size` rows, up to `number_of_rows` rows,
+            indexed contiguously across chunks.
+
+        Raises:
+            ValueError: If `chunk_size` is not positive, or the dataset cannot be loaded.
+
+        Examples:
+            >>> loader = HuggingFaceLoader("oscur/taxisvis1M", streaming=True, latitude_column="pickup_latitude", longitude_column="pickup_longitude")
+            >>> for chunk in loader.load_chunks(chunk_size=50_000):
+            ...     process(chunk)
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer.")
+        try:
+            dataset = self._dataset()
+        except datasets.exceptions.DatasetNotFoundError as e:
+            self._raise_not_found(e)
+        offset = 0
+        for batch in self._stream_batches(dataset, chunk_size):
+            dataframe = self._to_pandas(batch)
+            dataframe.index = pd.RangeIndex(offset, offset + len(dataframe))
+            offset += len(dataframe)
+            yield self._convert(dataframe)
+
+    def _dataset(self) -> Union[datasets.Dataset, datasets.IterableDataset]:
+        """The `train` split, up to `number_of_rows` rows unless streamed, with the projected columns."""
+        if self.streaming:
+            dataset = datasets.load_dataset(self.repo_id, split="train", streaming=True)
+        elif self.number_of_rows:
+            dataset = datasets.load_dataset(
+                self.repo_id, split=f"train[:{self.number_of_rows}]"
             )
-            if "/" not in self.repo_id:
-                all_datasets = [
-                    f"{repo}/{ds}"
-                    for repo, ds_list in dataset_dict.items()
-                    for ds in ds_list
-                ]
-                matches = process.extract(
-                    self.repo_id,
-                    all_datasets,
-                    processor=lambda x: x.split("/")[-1] if "/" in x else x,
-                )
+        else:
+            dataset = datasets.load_dataset(self.repo_id, split="train")
+        return self._select_columns(dataset)
+
+    def _stream_batches(
+        self,
+        dataset: Union[datasets.Dataset, datasets.IterableDataset],
+        batch_size: int = 10_000,
+    ) -> Iterator[pa.Table]:
+        """Iterate over the dataset as `Arrow` record batches, stopping at `number_of_rows` rows."""
+        remaining = self.number_of_rows
+        read_any = False
+        for batch in dataset.with_format("arrow").iter(batch_size=batch_size):
+            if remaining is not None:
+                if remaining <= 0:
+                    break
+                batch = batch.slice(0, remaining)
+                remaining -= batch.num_rows
+            read_any = True
+            yield batch
+        if not read_any:
+            yield dataset.with_format("arrow").features.arrow_schema.empty_table()
+
+    @staticmethod
+    def _to_pandas(table: pa.Table) -> pd.DataFrame:
+        """Convert an `Arrow` table block by block, releasing its buffers as it goes."""
+        return table.to_pandas(split_blocks=True, self_destruct=True)
+
+    def _convert(self, dataframe: pd.DataFrame) -> gpd.GeoDataFrame:
+        """Build the `GeoDataFrame` of a dataframe read from the dataset, without copying it.
+
+        Dtypes are optimised by `load()` once, on the whole dataset.
+        """
+        self.additional_loader_parameters.pop("input_dataframe", None)
+        parameters = {
+            key: value
+            for key, value in self.additional_loader_parameters.items()
+            if key != "dtype_optimisation"
+        }
+        return DataFrameLoader(
+            input_dataframe=dataframe,
+            latitude_column=self.latitude_column,
+            longitude_column=self.longitude_column,
+            geometry_column=self.geometry_column,
+            coordinate_reference_system=self.coordinate_reference_system,
+            copy=False,
+            **parameters,
+        ).load()
+
+    def _raise_not_found(self, e: Exception) -> None:
+        """Raise a `ValueError` suggesting the closest datasets to a `repo_id` not found."""
+        dataset_dict = self._build_dataset_dict(limit=self.debug_limit_list_datasets)
+        if "/" not in self.repo_id:
+            all_datasets = [
+                f"{repo}/{ds}"
+                for repo, ds_list in dataset_dict.items()
+                for ds in ds_list
+            ]
+            matches = process.extract(
+                self.repo_id,
+                all_datasets,
+                processor=lambda x: x.split("/")[-1] if "/" in x else x,
+            )
+            filtered_matches = [
+                (match, score) for match, score in matches if score > 80
+            ]
+            top_matches = filtered_matches[:10]
+            suggestions = [
+                f"{match} (similarity: {score}%)" for match, score in top_matches
+            ]
+            suggestion_text = (
+                " Maybe you meant one of these:\n" + "\n".join(suggestions)
+                if suggestions
+                else ""
+            )
+            raise ValueError(
+                f"The dataset '{self.repo_id}' does not exist on Hugging Face. "
+                f"Please verify the dataset ID.{suggestion_text}"
+            ) from e
+        else:
+            repo_name, dataset_name = self.repo_id.split("/", 1)
+            if repo_name not in dataset_dict:
+                all_repos = list(dataset_dict.keys())
+                matches = process.extract(repo_name, all_repos, limit=1000)
                 filtered_matches = [
                     (match, score) for match, score in matches if score > 80
                 ]
@@ -213,56 +320,64 @@ class HuggingFaceLoader(LoaderBase):
                     else ""
                 )
                 raise ValueError(
-                    f"The dataset '{self.repo_id}' does not exist on Hugging Face. "
-                    f"Please verify the dataset ID.{suggestion_text}"
+                    f"The repository '{repo_name}' does not exist on Hugging Face. "
+                    f"Please verify the repository name.{suggestion_text}"
                 ) from e
             else:
-                repo_name, dataset_name = self.repo_id.split("/", 1)
-                if repo_name not in dataset_dict:
-                    all_repos = list(dataset_dict.keys())
-                    matches = process.extract(repo_name, all_repos, limit=1000)
-                    filtered_matches = [
-                        (match, score) for match, score in matches if score > 80
-                    ]
-                    top_matches = filtered_matches[:10]
-                    suggestions = [
-                        f"{match} (similarity: {score}%)"
-                        for match, score in top_matches
-                    ]
-                    suggestion_text = (
-                        " Maybe you meant one of these:\n" + "\n".join(suggestions)
-                        if suggestions
-                        else ""
-                    )
-                    raise ValueError(
-                        f"The repository '{repo_name}' does not exist on Hugging Face. "
-                        f"Please verify the repository name.{suggestion_text}"
-                    ) from e
-                else:
-                    available_datasets = dataset_dict[repo_name]
-                    matches = process.extract(
-                        dataset_name, available_datasets, limit=None
-                    )
-                    filtered_matches = [
-                        (match, score) for match, score in matches if score > 80
-                    ]
-                    top_matches = filtered_matches[:10]
-                    suggestions = [
-                        f"{repo_name}/{match} (similarity: {score}%)"
-                        for match, score in top_matches
-                    ]
-                    suggestion_text = (
-                        " Maybe you meant one of these:\n" + "\n".join(suggestions)
-                        if suggestions
-                        else ""
-                    )
-                    raise ValueError(
-                        f"The dataset '{dataset_name}' does not exist in repository '{repo_name}'. "
-                        f"Available datasets: {', '.join(available_datasets)}.{suggestion_text}"
-                    ) from e
+                available_datasets = dataset_dict[repo_name]
+                matches = process.extract(dataset_name, available_datasets, limit=None)
+                filtered_matches = [
+                    (match, score) for match, score in matches if score > 80
+                ]
+                top_matches = filtered_matches[:10]
+                suggestions = [
+                    f"{repo_name}/{match} (similarity: {score}%)"
+                    for match, score in top_matches
+                ]
+                suggestion_text = (
+                    " Maybe you meant one of these:\n" + "\n".join(suggestions)
+                    if suggestions
+                    else ""
+                )
+                raise ValueError(
+                    f"The dataset '{dataset_name}' does not exist in repository '{repo_name}'. "
+                    f"Available datasets: {', '.join(available_datasets)}.{suggestion_text}"
+                ) from e
 
-        except Exception as e:
-            raise ValueError(f"Error loading dataset '{self.repo_id}': {str(e)}") from e
+    def project_columns(self, columns: List[str]) -> int:
+        """Only convert `columns` (and those already selected) to `pandas`, besides the coordinates.
+
+        Args:
+            columns: Columns to read, as named once loaded.
+
+        Returns:
+            `0`, the size of the dataset being unknown until downloaded. The bytes
+            skipped are logged once loaded.
+        """
+        self.columns = list(
+            dict.fromkeys((self.columns or []) + self._source_columns(columns))
+        )
+        return 0
+
+    def _select_columns(
+        self, dataset: Union[datasets.Dataset, datasets.IterableDataset]
+    ) -> Union[datasets.Dataset, datasets.IterableDataset]:
+        """Keep the projected columns of the dataset, before converting it to `pandas`."""
+        if self.columns is None or dataset.column_names is None:
+            return dataset
+        wanted = set(self.columns + self._spatial_columns())
+        kept = [column for column in dataset.column_names if column in wanted]
+        if isinstance(dataset, datasets.Dataset):
+            skipped = sum(
+                dataset.data.column(column).nbytes
+                for column in dataset.column_names
+                if column not in wanted
+            )
+            logger.log(
+                "DEBUG_LOW",
+                f"PROJECT_COLUMNS: Skipped {skipped} bytes of {self.repo_id} columns.",
+            )
+        return dataset.select_columns(kept)
 
     def preview(self, format: str = "ascii") -> Any:
         """Generate a preview of this `DataFrameLoader` loader.
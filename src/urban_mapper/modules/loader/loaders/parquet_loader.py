@@ -1,11 +1,15 @@
+import json
 import pandas as pd
 import geopandas as gpd
-from shapely import wkt
+import pyarrow.parquet as pq
 from beartype import beartype
 from pathlib import Path
-from typing import Union, Optional, Any, Tuple
+from typing import Union, Optional, Any, Tuple, Iterator, List, Dict
 
-from urban_mapper.modules.loader.loaders.file_loader import FileLoaderBase
+from urban_mapper.modules.loader.loaders.file_loader import (
+    FileLoaderBase,
+    BOUNDED_CHUNK_SIZE,
+)
 from urban_mapper.config import DEFAULT_CRS
 from urban_mapper.utils import require_either_or_attributes
 
@@ -16,7 +20,15 @@ class ParquetLoader(FileLoaderBase):
 
     This loader reads data from `Parquet` files and converts them to `GeoDataFrames`
     with point geometries. It requires latitude and longitude columns to create
-    point geometries for each row.
+    point geometries for each row, or a geometry column.
+
+    !!! tip "GeoParquet"
+        Files written as `GeoParquet` (e.g., by `GeoDataFrame.to_parquet`) are read
+        natively when `geometry_column` is one of their geometry columns: geometries are
+        decoded from their `WKB` or `GeoArrow` encoding at once, with the coordinate
+        reference system recorded in the file taking precedence over the source one.
+        Other geometry columns may hold `WKB` bytes or `WKT` strings (see
+        `parse_geometries`).
 
     Attributes:
         file_path (Union[str, Path]): Path to the Parquet file to load.
@@ -28,6 +40,10 @@ class ParquetLoader(FileLoaderBase):
         engine (str): The engine to use for reading Parquet files. Default: `"pyarrow"`
         columns (Optional[list[str]]): List of columns to read from the Parquet file. Default: `None`, which reads all columns.
 
+    !!! tip "Streaming"
+        `load_chunks(chunk_size=...)` reads the file batch by batch (within row groups),
+        rather than all at once.
+
     Examples:
         >>> from urban_mapper.modules.loader import ParquetLoader
         >>>
@@ -101,6 +117,13 @@ class ParquetLoader(FileLoaderBase):
         longitude columns, and converts the data to a `GeoDataFrame` with point
         geometries using the specified coordinate reference system.
 
+        With `bounds` (see `restrict_to_bounds`), the file is read with `pyarrow` batch
+        by batch instead, skipping the row groups outside the bounds by their statistics
+        and dropping the rows outside them before the next batch is read.
+
+        `GeoParquet` files whose geometry column is `geometry_column` are read by
+        `geopandas`, decoding the geometries along with their coordinate reference system.
+
         Returns:
             A `GeoDataFrame` containing the loaded data with point geometries
             created from the latitude and longitude columns.
@@ -111,52 +134,168 @@ class ParquetLoader(FileLoaderBase):
             ValueError: If the specified latitude or longitude columns are not found in the Parquet file.
             IOError: If the Parquet file cannot be read.
         """
-        dataframe = pd.read_parquet(
-            self.file_path,
-            engine=self.engine,
-            columns=self.columns,
-        )
-
-        if self.latitude_column != "" and self.longitude_column != "":
-            if self.latitude_column not in dataframe.columns:
-                raise ValueError(
-                    f"Column '{self.latitude_column}' not found in the Parquet file."
-                )
-            if self.longitude_column not in dataframe.columns:
-                raise ValueError(
-                    f"Column '{self.longitude_column}' not found in the Parquet file."
-                )
-
-            dataframe[self.latitude_column] = pd.to_numeric(
-                dataframe[self.latitude_column], errors="coerce"
-            )
-            dataframe[self.longitude_column] = pd.to_numeric(
-                dataframe[self.longitude_column], errors="coerce"
-            )
-            geometry = gpd.points_from_xy(
-                dataframe[self.longitude_column],
-                dataframe[self.latitude_column],
-            )
+        if self.bounds is not None:
+            dataframe = pd.concat(self._read_batches(BOUNDED_CHUNK_SIZE))
+        elif self.geometry_column in self._geoparquet_columns():
+            return gpd.read_parquet(
+                self.file_path, columns=self._read_columns()
+            ).set_geometry(self.geometry_column)
         else:
-            if self.geometry_column not in dataframe.columns:
-                raise ValueError(
-                    f"Column '{self.geometry_column}' not found in the Parquet file."
-                )
-
-            filter_not_na = dataframe[self.geometry_column].notna()
-            dataframe.loc[filter_not_na, self.geometry_column] = dataframe.loc[
-                filter_not_na, self.geometry_column
-            ].apply(wkt.loads)
-            geometry = self.geometry_column
-
-        geodataframe = gpd.GeoDataFrame(
-            dataframe,
-            geometry=geometry,
-            crs=self.coordinate_reference_system[0]
-            if isinstance(self.coordinate_reference_system, tuple)
-            else self.coordinate_reference_system,
+            dataframe = pd.read_parquet(
+                self.file_path,
+                engine=self.engine,
+                columns=self._read_columns(),
+            )
+
+        return self._to_geodataframe(dataframe, "Parquet")
+
+    @require_either_or_attributes(
+        [["latitude_column", "longitude_column"], ["geometry_column"]],
+        error_msg="Either both 'latitude_column' and 'longitude_column' must be set, or 'geometry_column' must be set.",
+    )
+    def _load_chunks(self, chunk_size: int) -> Iterator[gpd.GeoDataFrame]:
+        """Read the `Parquet` file in record batches of at most `chunk_size` rows.
+
+        Batches are read with `pyarrow` whatever the `engine`, one row group after the
+        other, so only the current batch is decoded in memory.
+
+        Args:
+            chunk_size: Maximum number of rows per chunk.
+
+        Yields:
+            `GeoDataFrames` of at most `chunk_size` rows. Files stored with a range
+            index are indexed by row number in the file, as by `load()`.
+        """
+        crs = self._geoparquet_crs()
+        for dataframe in self._read_batches(chunk_size):
+            yield self._to_geodataframe(dataframe, "Parquet", crs=crs)
+
+    def _geoparquet_columns(self) -> Dict[str, Dict[str, Any]]:
+        """Geometry columns of a `GeoParquet` file with their metadata, none for plain `Parquet`."""
+        metadata = pq.read_schema(self.file_path).metadata or {}
+        if b"geo" not in metadata:
+            return {}
+        return json.loads(metadata[b"geo"]).get("columns", {})
+
+    def _geoparquet_crs(self) -> Any:
+        """Coordinate reference system `GeoParquet` records for `geometry_column`, if any.
+
+        Per the specification, a geometry column without `crs` is in `OGC:CRS84`
+        (longitude/latitude), while an explicit `null` leaves it undefined.
+        """
+        column = self._geoparquet_columns().get(self.geometry_column)
+        if column is None:
+            return None
+        return column.get("crs", "OGC:CRS84")
+
+    def _read_batches(self, chunk_size: int) -> Iterator[pd.DataFrame]:
+        """Read the `Parquet` file in batches of `chunk_size` rows, within `bounds` if set.
+
+        With `bounds`, row groups whose latitude/longitude statistics lie outside them
+        are skipped without being read, and the rows of the others are tested against
+        them batch by batch, keeping their row number in the file as index.
+        """
+        parquet_file = pq.ParquetFile(self.file_path)
+        metadata = parquet_file.metadata
+        offset = 0
+        read_any = False
+        for group in range(metadata.num_row_groups):
+            rows = metadata.row_group(group).num_rows
+            if self.bounds is not None and not self._overlaps_bounds(
+                metadata.row_group(group)
+            ):
+                offset += rows
+                continue
+            for batch in parquet_file.iter_batches(
+                batch_size=chunk_size,
+                row_groups=[group],
+                columns=self._read_columns(),
+            ):
+                dataframe = batch.to_pandas()
+                range_indexed = isinstance(dataframe.index, pd.RangeIndex)
+                if range_indexed:
+                    dataframe.index = pd.RangeIndex(offset, offset + len(dataframe))
+                offset += len(dataframe)
+                if self.bounds is not None:
+                    dataframe = dataframe[self._within_bounds(dataframe)]
+                read_any = True
+                yield dataframe
+        if not read_any:
+            empty = parquet_file.schema_arrow.empty_table()
+            columns = self._read_columns()
+            yield (empty if columns is None else empty.select(columns)).to_pandas()
+
+    def _overlaps_bounds(self, row_group: pq.RowGroupMetaData) -> bool:
+        """Whether the coordinate statistics of a row group may overlap `bounds`."""
+        min_x, min_y, max_x, max_y = self.bounds
+        limits = {
+            self.longitude_column: (min_x, max_x),
+            self.latitude_column: (min_y, max_y),
+        }
+        for position in range(row_group.num_columns):
+            chunk = row_group.column(position)
+            if chunk.path_in_schema not in limits:
+                continue
+            statistics = chunk.statistics
+            if (
+                statistics is None
+                or not statistics.has_min_max
+                or chunk.physical_type not in ("DOUBLE", "FLOAT", "INT32", "INT64")
+            ):
+                continue
+            low, high = limits[chunk.path_in_schema]
+            if statistics.max < low or statistics.min > high:
+                return False
+        return True
+
+    def restrict_to_bounds(
+        self, bounds: Optional[Tuple[float, float, float, float]]
+    ) -> bool:
+        """Skip row groups and rows outside `bounds` while reading the file.
+
+        Args:
+            bounds: Bounding box (`min_x`, `min_y`, `max_x`, `max_y`) of the rows to keep,
+                replacing any previous one. `None` reads every row again.
+
+        Returns:
+            Whether rows are tested against `bounds`: only with latitude and longitude
+            columns, and no reprojection.
+        """
+        return self._set_bounds(bounds)
+
+    def _read_columns(self) -> Optional[list[str]]:
+        """`columns` the file holds, plus the coordinate or geometry ones, `None` for all."""
+        if self.columns is None:
+            return None
+        wanted = set(self.columns + self._spatial_columns())
+        return [
+            column
+            for column in pq.read_schema(self.file_path).names
+            if column in wanted
+        ]
+
+    def project_columns(self, columns: List[str]) -> int:
+        """Only read `columns` (and those already selected), besides the coordinates.
+
+        Args:
+            columns: Columns to read, as named once loaded.
+
+        Returns:
+            Uncompressed bytes of the column chunks no longer read, from the file metadata.
+        """
+        self.columns = list(
+            dict.fromkeys((self.columns or []) + self._source_columns(columns))
         )
-        return geodataframe
+        read_columns = set(self._read_columns())
+        metadata = pq.ParquetFile(self.file_path).metadata
+        skipped = 0
+        for group in range(metadata.num_row_groups):
+            row_group = metadata.row_group(group)
+            for position in range(row_group.num_columns):
+                chunk = row_group.column(position)
+                if chunk.path_in_schema.split(".")[0] not in read_columns:
+                    skipped += chunk.total_uncompressed_size
+        return skipped
 
     def preview(self, format: str = "ascii") -> Any:
         """Generate a preview of this `Parquet` loader.
@@ -0,0 +1,329 @@
+import glob
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+from beartype import beartype
+
+from urban_mapper import logger
+from urban_mapper.config import DEFAULT_CRS
+from urban_mapper.modules.loader.loaders.file_loader import FileLoaderBase
+from urban_mapper.modules.loader.loaders.csv_loader import CSVLoader
+from urban_mapper.modules.loader.loaders.parquet_loader import ParquetLoader
+from urban_mapper.modules.loader.loaders.shapefile_loader import ShapefileLoader
+
+# Loaders reading the files of a partitioned dataset, by file extension.
+PARTITION_FILE_LOADERS = {
+    ".csv": CSVLoader,
+    ".parquet": ParquetLoader,
+    ".shp": ShapefileLoader,
+}
+
+# Files read at once by default; reads mostly release the GIL (Arrow, pandas parsers).
+MAX_LOAD_WORKERS = 8
+
+
+@beartype
+class PartitionedLoader(FileLoaderBase):
+    """Loader for datasets split into many files, e.g. one `Parquet` file per day.
+
+    Reads every file matching a glob pattern (`"trips/2025-*.parquet"`), or every
+    `CSV`/`Parquet`/shapefile below a directory, with the loader of its format, several
+    files at once on a bounded thread pool, and concatenates them into a single
+    `GeoDataFrame` indexed from `0`.
+
+    !!! tip "Hive partitions"
+        Directories named `key=value` (e.g. `trips/date=2025-01-01/part-0.parquet`) are
+        partition columns: every row gets the `key` column with the `value` of its file,
+        as a categorical. `partition_filter` prunes partitions before any file is read:
+
+        - [x] `{"date": "2025-01-01"}`: a single value.
+        - [x] `{"date": ["2025-01-01", "2025-01-02"]}`: any of several values.
+        - [x] `{"date": lambda date: date >= "2025-01-15"}`: values a predicate accepts.
+
+        Values are compared as the strings of the directory names.
+
+    Column projection (`project_columns`) and bounding box pushdown (`restrict_to_bounds`)
+    are forwarded to the loader of every file, and `load_chunks` streams the files one
+    after the other.
+
+    Attributes:
+        file_path (Path): Glob pattern or directory of the files to load.
+        file_paths (List[Path]): Files to load, after partition pruning, in sorted order.
+        partitions (List[Dict[str, str]]): Partition values of every file in `file_paths`.
+        loaders (List[FileLoaderBase]): Loader of every file in `file_paths`.
+        partition_filter (Optional[Dict[str, Any]]): Values of the partitions to keep.
+        max_workers (int): Maximum number of files read at once. Default: `8`
+        latitude_column (str): Name of the column containing latitude values.
+        longitude_column (str): Name of the column containing longitude values.
+        coordinate_reference_system (Union[str, Tuple[str, str]]):
+            If a string, it specifies the coordinate reference system to use (default: 'EPSG:4326').
+            If a tuple (source_crs, target_crs), it defines a conversion from the source CRS to the target CRS (default target CRS: 'EPSG:4326').
+
+    Examples:
+        >>> from urban_mapper.modules.loader import PartitionedLoader
+        >>>
+        >>> # Daily files matching a pattern
+        >>> loader = PartitionedLoader(
+        ...     file_path="trips/2025-*.parquet",
+        ...     latitude_column="lat",
+        ...     longitude_column="lon",
+        ... )
+        >>> gdf = loader.load()
+        >>>
+        >>> # Hive-style partitions, keeping two days only
+        >>> loader = PartitionedLoader(
+        ...     file_path="trips/",
+        ...     latitude_column="lat",
+        ...     longitude_column="lon",
+        ...     partition_filter={"date": ["2025-01-01", "2025-01-02"]},
+        ... )
+        >>> gdf = loader.load()
+        >>> gdf["date"].unique()
+    """
+
+    def __init__(
+        self,
+        file_path: Union[str, Path],
+        latitude_column: Optional[str] = None,
+        longitude_column: Optional[str] = None,
+        geometry_column: Optional[str] = None,
+        coordinate_reference_system: Union[str, Tuple[str, str]] = DEFAULT_CRS,
+        partition_filter: Optional[Dict[str, Any]] = None,
+        max_workers: int = MAX_LOAD_WORKERS,
+        **additional_loader_parameters: Any,
+    ) -> None:
+        if max_workers < 1:
+            raise ValueError("max_workers must be a positive integer.")
+        super().__init__(
+            file_path=file_path,
+            latitude_column=latitude_column,
+            longitude_column=longitude_column,
+            geometry_column=geometry_column,
+            coordinate_reference_system=coordinate_reference_system,
+            **additional_loader_parameters,
+        )
+        self.partition_filter = partition_filter
+        self.max_workers = max_workers
+        self.file_paths: List[Path] = []
+        self.partitions: List[Dict[str, str]] = []
+        for path in self._discover_files():
+            partition = self._partition_values(path)
+            if self._keeps_partition(partition):
+                self.file_paths.append(path)
+                self.partitions.append(partition)
+        self.loaders: List[FileLoaderBase] = [
+            PARTITION_FILE_LOADERS[path.suffix.lower()](
+                file_path=path,
+                latitude_column=latitude_column,
+                longitude_column=longitude_column,
+                geometry_column=geometry_column,
+                coordinate_reference_system=coordinate_reference_system,
+            )
+            for path in self.file_paths
+        ]
+
+    def _discover_files(self) -> List[Path]:
+        """Files of a supported format below the directory, or matching the pattern.
+
+        Raises:
+            ValueError: If no such file exists.
+        """
+        if self.file_path.is_dir():
+            paths = [
+                path
+                for path in self.file_path.rglob("*")
+                if path.is_file() and path.suffix.lower() in PARTITION_FILE_LOADERS
+            ]
+        else:
+            paths = [
+                Path(path)
+                for path in glob.glob(str(self.file_path), recursive=True)
+                if Path(path).suffix.lower() in PARTITION_FILE_LOADERS
+            ]
+        if not paths:
+            raise ValueError(
+                f"No {', '.join(PARTITION_FILE_LOADERS)} file found at '{self.file_path}'."
+            )
+        return sorted(paths)
+
+    @staticmethod
+    def _partition_values(path: Path) -> Dict[str, str]:
+        """Partition values of a file, from its `key=value` parent directories."""
+        return dict(part.split("=", 1) for part in path.parent.parts if "=" in part)
+
+    def _keeps_partition(self, partition: Dict[str, str]) -> bool:
+        """Whether a file with these partition values passes `partition_filter`."""
+        for key, accepted in (self.partition_filter or {}).items():
+            value = partition.get(key)
+            if value is None:
+                return False
+            if callable(accepted):
+                if not accepted(value):
+                    return False
+            elif isinstance(accepted, (list, tuple, set)):
+                if value not in {str(item) for item in accepted}:
+                    return False
+            elif value != str(accepted):
+                return False
+        return True
+
+    def _load(self) -> gpd.GeoDataFrame:
+        """Read the files concurrently and concatenate them, with their partition columns.
+
+        Up to `max_workers` files are read at once. Every file is converted to a
+        `GeoDataFrame` in the target coordinate reference system by its own loader, then
+        the files are concatenated in one pass, as they are released, and the partition
+        columns appended as categoricals built from one code per file.
+
+        Returns:
+            A `GeoDataFrame` with the rows of all files, in sorted file order.
+
+        Raises:
+            ValueError: If no file is left after partition pruning.
+        """
+        if not self.loaders:
+            raise ValueError(
+                f"Partition filter {self.partition_filter} prunes every file at '{self.file_path}'."
+            )
+        logger.log(
+            "DEBUG_LOW",
+            f"PARTITIONED_LOADER: Reading {len(self.loaders)} files with "
+            f"{min(self.max_workers, len(self.loaders))} workers.",
+        )
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(self.loaders))
+        ) as executor:
+            frames = list(executor.map(lambda loader: loader.load(), self.loaders))
+        lengths = [len(frame) for frame in frames]
+        dataframe = pd.concat(frames, ignore_index=True)
+        del frames
+        return self._add_partition_columns(dataframe, range(len(lengths)), lengths)
+
+    def _load_chunks(self, chunk_size: int) -> Iterator[gpd.GeoDataFrame]:
+        """Stream the files one after the other, chunk by chunk.
+
+        Args:
+            chunk_size: Maximum number of rows per chunk.
+
+        Yields:
+            `GeoDataFrames` of at most `chunk_size` rows, with the partition columns of
+            their file, indexed contiguously across files.
+        """
+        offset = 0
+        for position, loader in enumerate(self.loaders):
+            for chunk in loader.load_chunks(chunk_size):
+                chunk.index = pd.RangeIndex(offset, offset + len(chunk))
+                offset += len(chunk)
+                yield self._add_partition_columns(chunk, [position], [len(chunk)])
+
+    def _add_partition_columns(
+        self,
+        dataframe: gpd.GeoDataFrame,
+        positions: Any,
+        lengths: List[int],
+    ) -> gpd.GeoDataFrame:
+        """Append one categorical column per partition key to consecutive file blocks.
+
+        Args:
+            dataframe: Rows of the files at `positions` of `file_paths`, in that order.
+            positions: Positions of the files in `file_paths`.
+            lengths: Number of rows of every file.
+        """
+        keys = list(dict.fromkeys(key for part in self.partitions for key in part))
+        for key in keys:
+            categories = pd.Index(
+                sorted({part[key] for part in self.partitions if key in part})
+            )
+            codes = np.array(
+                [
+                    categories.get_loc(self.partitions[position][key])
+                    if key in self.partitions[position]
+                    else -1
+                    for position in positions
+                ],
+                dtype=np.int32,
+            )
+            dataframe[key] = pd.Categorical.from_codes(
+                np.repeat(codes, lengths), categories=categories
+            )
+        return dataframe
+
+    def project_columns(self, columns: List[str]) -> int:
+        """Only read `columns` from every file, besides the coordinates.
+
+        Args:
+            columns: Columns to read, as named once loaded.
+
+        Returns:
+            Estimated bytes no longer read, summed over the files.
+        """
+        columns = self._source_columns(columns)
+        return sum(loader.project_columns(columns) for loader in self.loaders)
+
+    def restrict_to_bounds(
+        self, bounds: Optional[Tuple[float, float, float, float]]
+    ) -> bool:
+        """Skip the rows outside `bounds` while reading every file.
+
+        Args:
+            bounds: Bounding box (`min_x`, `min_y`, `max_x`, `max_y`) of the rows to keep,
+                replacing any previous one. `None` reads every row again.
+
+        Returns:
+            Whether every file loader skips the rows outside `bounds`.
+        """
+        restricted = [loader.restrict_to_bounds(bounds) for loader in self.loaders]
+        self.bounds = bounds if restricted and all(restricted) else None
+        return bool(restricted) and all(restricted)
+
+    def preview(self, format: str = "ascii") -> Any:
+        """Generate a preview of this partitioned loader.
+
+        Args:
+            format: The output format for the preview. Options include:
+
+                - [x] "ascii": Text-based format for terminal display
+                - [x] "json": JSON-formatted data for programmatic use
+
+        Returns:
+            A string or dictionary representing the loader, depending on the format.
+
+        Raises:
+            ValueError: If an unsupported format is requested.
+        """
+        partition_keys = list(
+            dict.fromkeys(key for part in self.partitions for key in part)
+        )
+        if format == "ascii":
+            return (
+                f"Loader: PartitionedLoader\n"
+                f"  Files: {self.file_path} ({len(self.file_paths)} files)\n"
+                f"  Partitions: {partition_keys or 'None'}\n"
+                f"  Partition Filter: {self.partition_filter}\n"
+                f"  Latitude Column: {self.latitude_column}\n"
+                f"  Longitude Column: {self.longitude_column}\n"
+                f"  Geometry Column: {self.geometry_column}\n"
+                f"  Max Workers: {self.max_workers}\n"
+                f"  CRS: {self.coordinate_reference_system}\n"
+                f"  Additional params: {self.additional_loader_parameters}\n"
+            )
+        elif format == "json":
+            return {
+                "loader": "PartitionedLoader",
+                "file": str(self.file_path),
+                "files": [str(path) for path in self.file_paths],
+                "partitions": partition_keys,
+                "partition_filter": str(self.partition_filter),
+                "latitude_column": self.latitude_column,
+                "longitude_column": self.longitude_column,
+                "geometry_column": self.geometry_column,
+                "max_workers": self.max_workers,
+                "coordinate_reference_system": self.coordinate_reference_system,
+                "additional_params": self.additional_loader_parameters,
+            }
+        else:
+            raise ValueError(f"Unsupported format '{format}'")
@@ -2,6 +2,7 @@ from typing import Any
 
 import geopandas as gpd
 from beartype import beartype
+from urban_mapper.modules.loader.helpers import transform_geometries
 from urban_mapper.modules.loader.loaders.file_loader import FileLoaderBase
 
 
@@ -78,7 +79,7 @@ class ShapefileLoader(FileLoaderBase):
         )
 
         if gdf.crs.to_string() != coord_system:
-            gdf = gdf.to_crs(coord_system)
+            gdf[gdf.geometry.name] = transform_geometries(gdf.geometry, coord_system)
 
         if (
             not self.latitude_column
@@ -1,7 +1,9 @@
 from .check_output_column import check_output_column
 from .geometry_coords import extract_point_coord
+from .layer_indices_column import layer_indices_column
 
 __all__ = [
     "check_output_column",
     "extract_point_coord",
+    "layer_indices_column",
 ]
@@ -0,0 +1,47 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+from beartype import beartype
+
+
+@beartype
+def layer_indices_column(
+    row_positions: np.ndarray,
+    layer_positions: np.ndarray,
+    index: pd.Index,
+) -> pd.Series:
+    """Build a list-valued column of layer indices, stored as `CSR` arrays.
+
+    Used when one data row maps to several layer items (e.g., every vertex of a
+    `LineString` snapped to its nearest street). Rather than a Python list per row,
+    the column is an `Arrow` list array — one flat `values` array of layer indices plus
+    an `offsets` array delimiting each row — that aggregators consume directly,
+    without exploding the `DataFrame`.
+
+    Args:
+        row_positions: Position of the data row of every match.
+        layer_positions: Layer index of every match.
+        index: Index of the data the column belongs to.
+
+    Returns:
+        A `list<int64>[pyarrow]` series holding, per row, its sorted unique layer
+        indices (`<NA>` for rows without any match).
+
+    Examples:
+        >>> layer_indices_column(np.array([0, 0, 2]), np.array([7, 3, 7]), pd.RangeIndex(3))
+        0    [3 7]
+        1     <NA>
+        2      [7]
+        dtype: list<item: int64>[pyarrow]
+    """
+    n_layer = int(layer_positions.max()) + 1 if len(layer_positions) else 1
+    pairs = np.unique(
+        row_positions.astype(np.int64) * n_layer + layer_positions.astype(np.int64)
+    )
+    rows, values = np.divmod(pairs, n_layer)
+    sizes = np.bincount(rows, minlength=len(index))
+    offsets = np.concatenate([[0], np.cumsum(sizes)]).astype(np.int32)
+    list_array = pa.ListArray.from_arrays(
+        pa.array(offsets), pa.array(values, type=pa.int64()), mask=pa.array(sizes == 0)
+    )
+    return pd.Series(pd.arrays.ArrowExtensionArray(list_array), index=index)
@@ -9,7 +9,7 @@ import numpy as np
 from urban_mapper.utils import require_attributes_not_none
 from .osmnx_streets import StreetNetwork
 from ..abc_urban_layer import UrbanLayerBase
-from ..helpers import extract_point_coord
+from ..helpers import extract_point_coord, layer_indices_column
 
 
 @beartype
@@ -325,7 +325,9 @@ class OSMNXIntersections(UrbanLayerBase):
             X = dataframe[longitude_column].values
             Y = dataframe[latitude_column].values
         else:
-            coord = extract_point_coord(dataframe[geometry_column])
+            coord = extract_point_coord(
+                dataframe[geometry_column].reset_index(drop=True)
+            )
             X = coord.x.values
             Y = coord.y.values
 
@@ -344,7 +346,9 @@ class OSMNXIntersections(UrbanLayerBase):
                 dataframe = dataframe[mask]
             else:
                 coord = coord[mask]
-                dataframe = dataframe.loc[coord.index.unique()]
+                kept_rows = np.unique(coord.index)
+                dataframe = dataframe.iloc[kept_rows]
+                coord.index = np.searchsorted(kept_rows, coord.index)
         else:
             nearest_nodes = result
 
@@ -354,13 +358,10 @@ class OSMNXIntersections(UrbanLayerBase):
         if geometry_column is None:
             dataframe[output_column] = nearest_indices
         else:
-            coord["nearest_indices"] = nearest_indices
-            coord = coord.reset_index()
-            coord = coord.sort_values("nearest_indices").groupby("index")
-            coord = coord["nearest_indices"].unique()
-
-            # One data row can be projected into many layer items
-            dataframe.loc[coord.index, output_column] = coord.values
+            # One data row can be projected into many layer items, kept as CSR lists
+            dataframe[output_column] = layer_indices_column(
+                coord.index.to_numpy(), np.asarray(nearest_indices), dataframe.index
+            )
 
         if _reset_layer_index:
             self.layer = self.layer.reset_index()
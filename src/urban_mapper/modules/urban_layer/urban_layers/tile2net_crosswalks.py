@@ -1,10 +1,12 @@
 import geopandas as gpd
+import numpy as np
 from pathlib import Path
 from typing import Tuple, Any, Optional
 from beartype import beartype
 
 from urban_mapper.utils import require_attributes_not_none
 from ..abc_urban_layer import UrbanLayerBase
+from ..helpers import layer_indices_column
 
 
 @beartype
@@ -162,26 +164,29 @@ class Tile2NetCrosswalks(UrbanLayerBase):
         else:
             layer_projected = self.layer
 
+        points = longitude_column is not None and latitude_column is not None
         mapped_data = gpd.sjoin_nearest(
-            dataframe,
+            # Matches of geometries are gathered back by row position
+            dataframe if points else dataframe.reset_index(drop=True),
             layer_projected[["geometry", "feature_id"]],
             how="left",
             max_distance=threshold_distance,
             distance_col="distance_to_crosswalk",
         )
 
-        if longitude_column is not None and latitude_column is not None:
+        if points:
             mapped_data[output_column] = mapped_data["feature_id"]
             mapped_data = mapped_data.drop(
                 columns=["feature_id", "distance_to_crosswalk", "index_right"]
             )
         else:
-            mapped_data = mapped_data.reset_index()
-            mapped_data = mapped_data.sort_values("feature_id").groupby("index")
-            mapped_data = mapped_data["feature_id"].unique()
-
-            # One data row can be projected into many layer items
-            dataframe.loc[mapped_data.index, output_column] = mapped_data.values
+            # One data row can be projected into many layer items, kept as CSR lists
+            matched = mapped_data["feature_id"].notna().to_numpy()
+            dataframe[output_column] = layer_indices_column(
+                mapped_data.index.to_numpy()[matched],
+                mapped_data["feature_id"].to_numpy()[matched].astype(np.int64),
+                dataframe.index,
+            )
             mapped_data = dataframe
 
         if _reset_layer_index:
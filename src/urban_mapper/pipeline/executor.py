@@ -1,10 +1,14 @@
+from pathlib import Path
 from typing import Tuple, Optional, Any, List, Union, Dict
 import geopandas as gpd
+import pandas as pd
 from beartype import beartype
+from urban_mapper import logger
 from urban_mapper.modules.loader import LoaderBase
 from urban_mapper.modules.imputer import GeoImputerBase
 from urban_mapper.modules.filter import GeoFilterBase
 from urban_mapper.modules.enricher import EnricherBase
+from urban_mapper.modules.enricher.aggregator.helpers import GroupCodes
 from urban_mapper.modules.urban_layer.abc_urban_layer import UrbanLayerBase
 from urban_mapper.modules.visualiser import VisualiserBase
 from alive_progress import alive_bar
@@ -22,6 +26,14 @@ class PipelineExecutor:
             List of (name, component) tuples representing the pipeline steps.
         data (Optional[gpd.GeoDataFrame]): Processed GeoDataFrame, populated after execution.
         urban_layer (Optional[UrbanLayerBase]): Enriched urban layer instance, set after execution.
+        map_projection (bool): Whether only the columns the enrichers and the mapping read are
+            mapped, when every enricher knows them, `data` then being left as loaded (and
+            filtered), without the mapped columns. Off by default: the whole data is mapped.
+        state_store (Optional[str]): Directory holding the aggregate state of every enricher,
+            when composing incrementally (see `compose`).
+        project_columns (bool): Whether loaders only read the columns the other steps use.
+        bytes_saved (Dict[str, int]): Estimated bytes every loader skipped thanks to
+            `project_columns`, by loader name, after execution.
         _composed (bool): Indicates if the pipeline has been composed.
 
     Examples:
@@ -54,8 +66,18 @@ class PipelineExecutor:
                 ],
             ]
         ],
+        map_projection: bool = False,
+        state_store: Optional[Union[str, Path]] = None,
+        project_columns: bool = False,
     ) -> None:
         self.steps = steps
+        self.map_projection = map_projection
+        self.state_store = state_store
+        self.project_columns = project_columns
+        self.bytes_saved: Dict[str, int] = {}
+        self._mapped_data: Optional[
+            Union[Dict[str, gpd.GeoDataFrame], gpd.GeoDataFrame]
+        ] = None
         self.data: Optional[Dict[str, gpd.GeoDataFrame]] = None
         self.urban_layer: Optional[UrbanLayerBase] = None
         self._composed: bool = False
@@ -72,6 +94,41 @@ class PipelineExecutor:
             - [x] Map to urban layer
             - [x] Enrich urban layer
 
+        !!! tip "Mapping A Column Projection"
+            With `map_projection`, when the data is a single `GeoDataFrame` and every
+            enricher knows the columns it reads (`required_columns`), the mapping runs on a
+            projection of the data holding only those (and the mapping) columns, so that
+            the copies the mapping makes leave the other columns out. `data` is then
+            returned as it was before mapping, without the mapped columns (e.g.,
+            `nearest_street`), rather than as a full mapped copy.
+
+        !!! tip "Incremental Composition"
+            With a `state_store`, the loaded data is a new batch appended to the previous
+            ones (e.g., today's trips): every enricher merges it into its aggregate state,
+            persisted as `<state_store>/<step name>.npz`, and the enriched columns cover the
+            whole history while only the batch is mapped and aggregated. Requires enrichers
+            whose aggregations can be merged (counts, sums, means, extrema, approximate
+            distinct counts).
+
+        !!! tip "Projection Pushdown"
+            With `project_columns`, and when every imputer, filter and enricher knows the
+            columns it reads, loaders are restricted to those columns (and the ones the
+            urban layer mappings read) before loading: e.g., 4 columns of a 20-column taxi
+            file. The estimated bytes skipped are logged and kept in `bytes_saved`. The
+            loaded data then only holds those columns.
+
+        !!! tip "Bounding Box Pushdown"
+            The bounding box of a `BoundingBoxFilter` is pushed down into the loaders it
+            filters (unless an imputer may fill their missing coordinates), so that rows
+            outside of it are never materialised. The filter still runs afterwards, giving
+            the same data as without pushdown. Loaders get their previous bounds back once
+            loaded, so that reusing them elsewhere reads every row again.
+
+        !!! tip "Dtype Optimisation"
+            Loaders built `with_dtype_optimisation()` keep the dtypes of the columns the
+            enrichers read, so that enrichments match the ones of the unoptimised data;
+            if an enricher reads unknown columns, they skip the optimisation.
+
         Raises:
             ValueError: If pipeline is already composed or lacks required steps (loader, urban layer).
 
@@ -103,6 +160,11 @@ class PipelineExecutor:
         if num_loaders == 0:
             raise ValueError("Pipeline must include exactly one LoaderBase step.")
 
+        if self.project_columns:
+            self._project_loaders(urban_layer_instance)
+        previous_bounds = self._push_down_bounds(urban_layer_instance)
+        self._keep_enricher_dtypes()
+
         with alive_bar(
             total_steps,
             title="Pipeline Progress",
@@ -111,15 +173,20 @@ class PipelineExecutor:
         ) as bar:
             self.data = None if num_loaders == 1 else {}
 
-            for name, step in self.steps:
-                if isinstance(step, LoaderBase):
-                    bar()
-                    bar.title = f"~> Loading: {name}..."
-
-                    if num_loaders == 1:
-                        self.data = step.load()
-                    else:
-                        self.data[name] = step.load()
+            try:
+                for name, step in self.steps:
+                    if isinstance(step, LoaderBase):
+                        bar()
+                        bar.title = f"~> Loading: {name}..."
+
+                        if num_loaders == 1:
+                            self.data = step.load()
+                        else:
+                            self.data[name] = step.load()
+            finally:
+                # The pushed down bounds only hold for this composition
+                for loader, bounds in previous_bounds:
+                    loader.restrict_to_bounds(bounds)
 
             for name, step in self.steps:
                 if isinstance(step, GeoImputerBase):
@@ -137,20 +204,257 @@ class PipelineExecutor:
             bar.title = (
                 f"~> Let's spatial join the {urban_layer_name} layer with the data..."
             )
-            _, mapped_data = urban_layer_instance.map_nearest_layer(self.data)
-            self.data = mapped_data
-
+            projected_columns = self._projected_columns(urban_layer_instance)
+            if projected_columns is not None:
+                _, mapped_data = urban_layer_instance.map_nearest_layer(
+                    self.data[projected_columns]
+                )
+            else:
+                _, mapped_data = urban_layer_instance.map_nearest_layer(self.data)
+                self.data = mapped_data
+
+            self._mapped_data = mapped_data
+            if self.state_store is not None:
+                Path(self.state_store).mkdir(parents=True, exist_ok=True)
             for name, step in self.steps:
                 if isinstance(step, EnricherBase):
                     bar()
                     bar.title = f"~> Applying enricher: {name}..."
-                    urban_layer_instance = step.enrich(self.data, urban_layer_instance)
+                    if self.state_store is not None:
+                        urban_layer_instance = step.enrich_incremental(
+                            mapped_data,
+                            urban_layer_instance,
+                            Path(self.state_store) / f"{name}.npz",
+                        )
+                    else:
+                        urban_layer_instance = step.enrich(
+                            mapped_data, urban_layer_instance
+                        )
 
             self.urban_layer = urban_layer_instance
             self._composed = True
             bar()
             bar.title = f"🗺️ Successfully composed pipeline with {total_steps} steps!"
 
+    def _project_loaders(self, urban_layer: UrbanLayerBase) -> None:
+        """Restrict every loader to the columns the other steps read, if they all know them.
+
+        Args:
+            urban_layer: Urban layer the data will be mapped to.
+        """
+        wanted = []
+        for name, step in self.steps:
+            if isinstance(step, (GeoImputerBase, GeoFilterBase, EnricherBase)):
+                if step.required_columns is None:
+                    logger.log(
+                        "DEBUG_LOW",
+                        f"PROJECT_COLUMNS: Step {name} reads unknown columns, loading all of them.",
+                    )
+                    return
+                wanted.extend(step.required_columns)
+        for mapping in urban_layer.mappings:
+            wanted.extend(
+                mapping.get(key)
+                for key in ("longitude_column", "latitude_column", "geometry_column")
+            )
+        columns = [column for column in dict.fromkeys(wanted) if column is not None]
+        for name, step in self.steps:
+            if isinstance(step, LoaderBase):
+                self.bytes_saved[name] = step.project_columns(columns)
+                logger.log(
+                    "DEBUG_LOW",
+                    f"PROJECT_COLUMNS: Loader {name} reads {columns}, "
+                    f"skipping ~{self.bytes_saved[name]} bytes.",
+                )
+
+    def _push_down_bounds(
+        self, urban_layer: UrbanLayerBase
+    ) -> List[Tuple[LoaderBase, Optional[Tuple[float, float, float, float]]]]:
+        """Push the bounding boxes of the filters down into the loaders they filter.
+
+        Args:
+            urban_layer: Urban layer the filters get their bounds from.
+
+        Returns:
+            Every restricted loader with the bounds it had before, to restore once loaded.
+        """
+        loaders = [
+            (name, step) for name, step in self.steps if isinstance(step, LoaderBase)
+        ]
+        single = len(loaders) == 1
+
+        def applies(step: Union[GeoImputerBase, GeoFilterBase], name: str) -> bool:
+            return single or step.data_id is None or step.data_id == name
+
+        previous_bounds = []
+
+        for _, step in self.steps:
+            if not isinstance(step, GeoFilterBase):
+                continue
+            bounds = step.pushdown_bounds(urban_layer)
+            if bounds is None:
+                continue
+            for name, loader in loaders:
+                if not applies(step, name) or any(
+                    isinstance(imputer, GeoImputerBase)
+                    and imputer.imputes_coordinates
+                    and applies(imputer, name)
+                    for _, imputer in self.steps
+                ):
+                    continue
+                bounds_before = getattr(loader, "bounds", None)
+                if loader.restrict_to_bounds(bounds):
+                    if all(
+                        loader is not restricted for restricted, _ in previous_bounds
+                    ):
+                        previous_bounds.append((loader, bounds_before))
+                    logger.log(
+                        "DEBUG_LOW",
+                        f"PUSH_DOWN_BOUNDS: Loader {name} skips rows outside {bounds}.",
+                    )
+        return previous_bounds
+
+    def _keep_enricher_dtypes(self) -> None:
+        """Keep the dtypes of the columns the enrichers read in every loader."""
+        columns: Optional[List[str]] = []
+        for _, step in self.steps:
+            if isinstance(step, EnricherBase):
+                if step.required_columns is None:
+                    columns = None
+                    break
+                columns.extend(step.required_columns)
+        if columns is not None:
+            columns = list(dict.fromkeys(columns))
+        for name, step in self.steps:
+            if isinstance(step, LoaderBase):
+                step.keep_dtypes(columns)
+                logger.log(
+                    "DEBUG_LOW",
+                    f"DTYPE_OPTIMISATION: Loader {name} keeps the dtypes of "
+                    f"{'all columns' if columns is None else columns}.",
+                )
+
+    def _projected_columns(self, urban_layer: UrbanLayerBase) -> Optional[List[str]]:
+        """Columns of the data the mapping and the enrichers read, to map a projection on.
+
+        Args:
+            urban_layer: Urban layer the data is mapped to.
+
+        Returns:
+            The columns to project the data on before mapping, or `None` to map the
+            whole data (`map_projection` not set, several datasets, or an enricher
+            whose columns are unknown).
+        """
+        if not self.map_projection or not isinstance(self.data, gpd.GeoDataFrame):
+            return None
+        wanted = []
+        for _, step in self.steps:
+            if isinstance(step, EnricherBase):
+                if step.required_columns is None:
+                    return None
+                wanted.extend(step.required_columns)
+        for mapping in urban_layer.mappings:
+            wanted.extend(
+                mapping.get(key)
+                for key in ("longitude_column", "latitude_column", "geometry_column")
+            )
+        wanted.append(self.data.geometry.name)
+        return [
+            column
+            for column in dict.fromkeys(wanted)
+            if column is not None and column in self.data.columns
+        ]
+
+    def sweep(
+        self, enrichers: Union[Dict[str, EnricherBase], List[EnricherBase]]
+    ) -> pd.DataFrame:
+        """Evaluate Enrichment Variants Over The Already Mapped Data.
+
+        Runs the aggregation of every enricher (e.g., other value columns, `where`
+        filters or methods) on the data mapped by `compose`, without loading, mapping
+        or enriching anything again, and without touching the urban layer. The group
+        codes of every distinct `group_by` are factorised once and shared by all the
+        variants grouping by it.
+
+        Args:
+            enrichers: Variants to evaluate, by name, or as a list named after their
+                `output_column`. Each must hold an aggregator without breakdown, e.g.
+                built by `mapper.enricher...build()`.
+
+        Returns:
+            pd.DataFrame: Tidy table with one row per (urban layer element, variant), holding
+                the element, `variant` and `value` columns. Elements without records get `0`
+                for numeric values, as enriched columns do.
+
+        Raises:
+            ValueError: If the pipeline isn’t composed, holds several datasets, or a variant
+                has no aggregator or breaks its groups down.
+
+        Examples:
+            >>> variants = {
+            ...     method: mapper.enricher.with_data(group_by="nearest_street", values_from="fare")
+            ...     .aggregate_by(method=method).build()
+            ...     for method in ("mean", "max", "sum")
+            ... }
+            >>> results = executor.sweep(variants)
+            >>> results.pivot(index="nearest_street", columns="variant", values="value")
+        """
+        if not self._composed:
+            raise ValueError("Pipeline not composed. Call compose() first.")
+        if not isinstance(self._mapped_data, gpd.GeoDataFrame):
+            raise ValueError("Sweeps run over a pipeline with a single dataset.")
+        if isinstance(enrichers, list):
+            enrichers = {enricher.output_column: enricher for enricher in enrichers}
+        for name, enricher in enrichers.items():
+            aggregator = getattr(enricher, "aggregator", None)
+            if aggregator is None or aggregator.breaks_down:
+                raise ValueError(
+                    f"Variant '{name}' must aggregate onto the urban layer elements alone."
+                )
+
+        data = self._sweep_data(list(enrichers.values()))
+        layer_index = self.urban_layer.layer.index
+        element = layer_index.name or "element"
+        shared_groups: Dict[Tuple[str, ...], GroupCodes] = {}
+        results = []
+        for name, enricher in enrichers.items():
+            aggregator = enricher.aggregator
+            key = tuple(aggregator.group_by_columns)
+            if key not in shared_groups:
+                shared_groups[key] = GroupCodes.from_dataframe(
+                    data, aggregator.group_by_column
+                )
+            groups = shared_groups[key]
+            values = pd.Series(
+                aggregator.reduce(data, groups), index=groups.keys
+            ).reindex(layer_index)
+            if pd.api.types.is_numeric_dtype(values):
+                values = values.fillna(0)
+            results.append(
+                pd.DataFrame(
+                    {element: layer_index, "variant": name, "value": values.to_numpy()}
+                )
+            )
+        return pd.concat(results, ignore_index=True)
+
+    def _sweep_data(self, enrichers: List[EnricherBase]) -> gpd.GeoDataFrame:
+        """The mapped data, with the columns variants read but the projected mapping left out."""
+        data = self._mapped_data
+        wanted = []
+        for enricher in enrichers:
+            if enricher.required_columns is None:
+                wanted = None
+                break
+            wanted.extend(enricher.required_columns)
+        missing = [
+            column
+            for column in self.data.columns
+            if column not in data.columns and (wanted is None or column in wanted)
+        ]
+        if missing:
+            data = data.join(self.data[missing])
+        return data
+
     def transform(
         self,
     ) -> Tuple[
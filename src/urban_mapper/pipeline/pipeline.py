@@ -100,6 +100,17 @@ class UrbanPipeline:
             List of (name, component) tuples defining pipeline steps.
         validator (PipelineValidator): Validates step compatibility.
         executor (PipelineExecutor): Executes the pipeline steps.
+        map_projection (bool): Whether only the columns the enrichers and the urban layer
+            mappings read are mapped, rather than every column of the data. The returned
+            data is then as loaded, without the mapped columns (e.g. `nearest_street`).
+            Off by default.
+        state_store (Optional[str]): Directory persisting the aggregate state of the enrichers.
+            When set, every composition appends the loaded data to the previous ones
+            (e.g., a new day of trips), merging it into the stored state rather than
+            re-running the whole history.
+        project_columns (bool): Whether loaders only read the columns the imputers, filters,
+            urban layer mappings and enrichers use, rather than every column of the files.
+            The estimated bytes skipped are kept in `executor.bytes_saved`.
 
     Examples:
         >>> import urban_mapper as um
@@ -114,6 +125,14 @@ class UrbanPipeline:
         >>> pipeline = UrbanPipeline(steps)
         >>> data, layer = pipeline.compose_transform()
         >>> pipeline.visualise(["pickup_count"])
+        >>> # Every morning, append the new day of trips to the counts of the previous ones
+        >>> pipeline = UrbanPipeline(steps, state_store="pickup_state/")
+        >>> data, layer = pipeline.compose_transform()
+        >>> # Only read the coordinates of the 20+ columns of the taxi file
+        >>> pipeline = UrbanPipeline(steps, project_columns=True)
+        >>> data, layer = pipeline.compose_transform()
+        >>> pipeline.executor.bytes_saved
+        {'loader': 1843200000}
 
     """
 
@@ -136,11 +155,22 @@ class UrbanPipeline:
                 ]
             ],
         ] = None,
+        map_projection: bool = False,
+        state_store: Optional[Union[str, Path]] = None,
+        project_columns: bool = False,
     ) -> None:
         self.steps = steps
+        self.map_projection = map_projection
+        self.state_store = state_store
+        self.project_columns = project_columns
         if steps:
             self.validator = PipelineValidator(steps)
-            self.executor = PipelineExecutor(steps)
+            self.executor = PipelineExecutor(
+                steps,
+                map_projection=map_projection,
+                state_store=state_store,
+                project_columns=project_columns,
+            )
 
     @require_attributes_not_none("steps")
     @property
@@ -269,6 +299,36 @@ class UrbanPipeline:
         """
         return self.executor.compose_transform()
 
+    @require_attributes_not_none("steps")
+    def sweep(
+        self, enrichers: Union[Dict[str, EnricherBase], List[EnricherBase]]
+    ) -> pd.DataFrame:
+        """Evaluate enrichment variants over the already mapped data.
+
+        Tries many enrichers (other value columns, filters, methods) on a composed
+        pipeline, reusing its loaded and mapped data and the group codes shared by
+        variants, without re-composing nor mutating the urban layer.
+
+        Args:
+            enrichers: Variants to evaluate, by name, or as a list named after their `output_column`.
+
+        Returns:
+            pd.DataFrame: Tidy table with the urban layer element, `variant` and `value` columns.
+
+        Raises:
+            ValueError: If no steps, not composed, or a variant cannot be evaluated.
+
+        Examples:
+            >>> results = pipeline.sweep(
+            ...     [
+            ...         mapper.enricher.with_data(group_by="nearest_street").count_by("trips").build(),
+            ...         mapper.enricher.with_data(group_by="nearest_street")
+            ...         .count_by("night_trips", where="hour < 6").build(),
+            ...     ]
+            ... )
+        """
+        return self.executor.sweep(enrichers)
+
     @require_attributes_not_none("steps")
     def visualise(self, result_columns: Union[str, List[str]], **kwargs: Any) -> Any:
         """Visualise pipeline results.
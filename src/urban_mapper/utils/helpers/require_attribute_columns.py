@@ -14,7 +14,12 @@ def require_attribute_columns(data_arg_name: str, attr_names: list[str]):
             if data is None:
                 raise ValueError(f"Argument '{data_arg_name}' cannot be None")
 
-            required_columns = [getattr(self, attr_name) for attr_name in attr_names]
+            required_columns = []
+            for attr_name in attr_names:
+                columns = getattr(self, attr_name)
+                required_columns.extend(
+                    columns if isinstance(columns, list) else [columns]
+                )
             missing = [col for col in required_columns if col not in data.columns]
             if missing:
                 raise ValueError(f"Missing required columns: {', '.join(missing)}")
@@ -0,0 +1,112 @@
+import numpy as np
+import pandas as pd
+from urban_mapper.modules.enricher import DistinctCountAggregator, SimpleAggregator
+from urban_mapper.modules.enricher.aggregator.helpers import AggregateState
+from urban_mapper.modules.enricher import AGGREGATION_FUNCTIONS
+import pytest
+
+
+# @pytest.mark.skip()
+class TestAggregateState:
+    """
+    It tests an AggregateState class.
+
+    """
+
+    data = pd.DataFrame(
+        {
+            "street": [0, 0, 1, 1, 2, 2, 2, 3],
+            "fare": [1.0, 4.0, 2.0, np.nan, 5.0, 1.0, 3.0, 7.0],
+            "vehicle": ["a", "b", "a", "a", "c", "d", "c", "e"],
+        }
+    )
+
+    def test_merge(self):
+        """
+        Merging the states of two batches gives the state of their union
+        """
+        for method in ("sum", "mean", "min", "max"):
+            aggregator = SimpleAggregator(
+                group_by_column="street",
+                value_column="fare",
+                aggregation_function=AGGREGATION_FUNCTIONS[method],
+            )
+            merged = AggregateState.from_batch(aggregator, self.data.iloc[:5]).merge(
+                AggregateState.from_batch(aggregator, self.data.iloc[5:])
+            )
+            expected = self.data.groupby("street")["fare"].agg(method)
+            assert merged.values().tolist() == pytest.approx(expected.tolist())
+
+        """
+        Approximate distinct counts merge through their sketches
+    """
+        aggregator = DistinctCountAggregator(
+            group_by_column="street", value_column="vehicle", approximate=True
+        )
+        merged = AggregateState.from_batch(aggregator, self.data.iloc[:3]).merge(
+            AggregateState.from_batch(aggregator, self.data.iloc[3:])
+        )
+        assert merged.values().round().tolist() == [2, 1, 2, 1]
+
+    def test_save_load(self, tmp_path):
+        """
+        States survive a save / load round trip
+        """
+        aggregator = SimpleAggregator(
+            group_by_column="street",
+            value_column="fare",
+            aggregation_function=AGGREGATION_FUNCTIONS["mean"],
+            weight="fare",
+        )
+        state = AggregateState.from_batch(aggregator, self.data)
+        state.save(tmp_path / "state.npz")
+        loaded = AggregateState.load(tmp_path / "state.npz")
+        assert loaded.reduction == "mean"
+        assert loaded.keys.equals(state.keys)
+        assert np.allclose(loaded.values(), state.values())
+        assert loaded.fingerprint == aggregator.state_fingerprint
+
+    def test_configuration_mismatch(self):
+        """
+        States of aggregations configured differently cannot be merged
+        """
+        aggregator = SimpleAggregator(
+            group_by_column="street",
+            value_column="fare",
+            aggregation_function=AGGREGATION_FUNCTIONS["sum"],
+        )
+        state = AggregateState.from_batch(aggregator, self.data)
+        for other in (
+            SimpleAggregator(
+                group_by_column="street",
+                value_column="fare",
+                aggregation_function=AGGREGATION_FUNCTIONS["sum"],
+                where="fare > 2",
+            ),
+            SimpleAggregator(
+                group_by_column="street",
+                value_column="fare",
+                aggregation_function=AGGREGATION_FUNCTIONS["sum"],
+                weight="fare",
+            ),
+        ):
+            assert other.state_fingerprint != aggregator.state_fingerprint
+            with pytest.raises(ValueError):
+                state.merge(AggregateState.from_batch(other, self.data))
+
+    def test_merge_mixed_dtypes(self):
+        """
+        IDs read as integers, then as floats or objects, are not counted twice
+        """
+        aggregator = DistinctCountAggregator(
+            group_by_column="street", value_column="vehicle", approximate=True
+        )
+        ids = pd.DataFrame({"street": [0, 0, 1, 1], "vehicle": [1, 2, 3, 4]})
+        floats = ids.assign(vehicle=[1.0, 2.0, np.nan, 4.0])
+        objects = ids.assign(
+            vehicle=pd.Series([np.int32(1), 2.0, None, 4], dtype=object)
+        )
+        state = AggregateState.from_batch(aggregator, ids)
+        for other in (floats, objects):
+            merged = state.merge(AggregateState.from_batch(aggregator, other))
+            assert merged.values().round().tolist() == [2, 2]
@@ -0,0 +1,74 @@
+import urban_mapper as um
+from urban_mapper.modules.enricher import CategoricalAggregator
+import pytest
+
+
+# @pytest.mark.skip()
+class TestCategoricalAggregator:
+    """
+    It tests a CategoricalAggregator class.
+
+    """
+
+    loader = um.UrbanMapper().loader
+
+    file_path = "test/data_files/small_nyc_neighborhoods.csv"
+    data_neigborhood = (
+        loader.from_file(file_path).with_columns(geometry_column="geometry").load()
+    )
+
+    def test_aggregate(self):
+        """
+        Most frequent category
+        """
+        aggregator = CategoricalAggregator(
+            group_by_column="borocode", value_column="boroname", method="mode"
+        )
+        result = aggregator.aggregate(self.data_neigborhood)
+        assert result is not None
+        expected = self.data_neigborhood.groupby("borocode")["boroname"].agg(
+            lambda values: values.value_counts().sort_index().idxmax()
+        )
+        assert (result["value"] == expected.loc[result.index]).all()
+
+        """
+        Top-k categories with their counts
+    """
+        aggregator = CategoricalAggregator(
+            group_by_column="borocode", value_column="ntaname", method="top_k", k=2
+        )
+        result = aggregator.aggregate(self.data_neigborhood)
+        assert result is not None
+        assert all(len(value) <= 2 for value in result["value"])
+        assert aggregator.crosstab is not None
+
+    def test_category_shares(self):
+        """
+        Shares of every category sum to one per group
+        """
+        aggregator = CategoricalAggregator(
+            group_by_column="boroname",
+            value_column="ntaname",
+            method="category_shares",
+        )
+        result = aggregator.aggregate(self.data_neigborhood)
+        assert result is not None
+        assert aggregator.breaks_down
+        totals = result["value"].groupby(level=0).sum()
+        assert totals.round(6).eq(1).all()
+
+    def test_invalid_method(self):
+        """
+        Unknown methods and non-positive k are rejected
+        """
+        with pytest.raises(ValueError):
+            CategoricalAggregator(
+                group_by_column="borocode", value_column="boroname", method="median"
+            )
+        with pytest.raises(ValueError):
+            CategoricalAggregator(
+                group_by_column="borocode",
+                value_column="ntaname",
+                method="top_k",
+                k=0,
+            )
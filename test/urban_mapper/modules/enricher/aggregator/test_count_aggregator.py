@@ -1,5 +1,7 @@
+import numpy as np
 import urban_mapper as um
 from urban_mapper.modules.enricher import CountAggregator
+from urban_mapper.modules.urban_layer.helpers import layer_indices_column
 import pytest
 
 
@@ -23,3 +25,50 @@ class TestCountAggregator:
         """
         aggregator = CountAggregator(group_by_column="borocode", count_function=len)
         assert aggregator.aggregate(self.data_neigborhood) is not None
+
+    def test_aggregate_multiple_columns(self):
+        """
+        Grouping and couting rows per composite key
+        """
+        aggregator = CountAggregator(
+            group_by_column=["borocode", "ntaname"], count_function=len
+        )
+        result = aggregator.aggregate(self.data_neigborhood)
+        assert result is not None
+        assert result.index.nlevels == 2
+        assert result["value"].sum() == len(self.data_neigborhood)
+
+    def test_aggregate_list_column(self):
+        """
+        Grouping and couting rows mapped to several layer items
+        """
+        data = self.data_neigborhood.copy()
+        rows = np.repeat(np.arange(len(data)), 2)
+        data["nearest_items"] = layer_indices_column(
+            rows, rows % 3 + np.tile([0, 1], len(data)), data.index
+        )
+        aggregator = CountAggregator(
+            group_by_column="nearest_items", count_function=len
+        )
+        result = aggregator.aggregate(data)
+        assert result is not None
+        assert result["value"].sum() == 2 * len(data)
+
+    def test_aggregate_where_weight(self):
+        """
+        Counting rows matching an expression, and summing weights
+        """
+        aggregator = CountAggregator(group_by_column="borocode", where="gini > 0.5")
+        result = aggregator.aggregate(self.data_neigborhood)
+        assert result is not None
+        expected = (
+            self.data_neigborhood[self.data_neigborhood["gini"] > 0.5]
+            .groupby("borocode")
+            .size()
+        )
+        assert (result["value"].loc[expected.index] == expected).all()
+
+        aggregator = CountAggregator(group_by_column="borocode", weight="gini")
+        result = aggregator.aggregate(self.data_neigborhood)
+        expected = self.data_neigborhood.groupby("borocode")["gini"].sum()
+        assert (result["value"] - expected.loc[result.index]).abs().max() < 1e-9
@@ -0,0 +1,86 @@
+import urban_mapper as um
+from urban_mapper.modules.enricher import DistinctCountAggregator
+import pytest
+
+
+# @pytest.mark.skip()
+class TestDistinctCountAggregator:
+    """
+    It tests a DistinctCountAggregator class.
+
+    """
+
+    loader = um.UrbanMapper().loader
+
+    file_path = "test/data_files/small_VZV_Speed_Humps_with_LatLon.csv"
+    data_speed_hump = (
+        loader.from_file(file_path)
+        .with_columns(geometry_column="the_geom")
+        .with_map({"the_geom": "geometry"})
+        .load()
+    )
+
+    def test_aggregate(self):
+        """
+        Exact distinct count
+        """
+        aggregator = DistinctCountAggregator(
+            group_by_column="on_street", value_column="humps"
+        )
+        result = aggregator.aggregate(self.data_speed_hump)
+        assert result is not None
+        expected = self.data_speed_hump.groupby("on_street")["humps"].nunique()
+        assert (result["value"] == expected.loc[result.index]).all()
+
+        """
+        Approximate distinct count
+    """
+        aggregator = DistinctCountAggregator(
+            group_by_column="on_street", value_column="OBJECTID", approximate=True
+        )
+        result = aggregator.aggregate(self.data_speed_hump)
+        assert result is not None
+        assert aggregator.registers is not None
+
+    def test_merge(self):
+        """
+        Merging sketches of two batches
+        """
+        half = len(self.data_speed_hump) // 2
+        first = DistinctCountAggregator(
+            group_by_column="on_street", value_column="OBJECTID", approximate=True
+        )
+        second = DistinctCountAggregator(
+            group_by_column="on_street", value_column="OBJECTID", approximate=True
+        )
+        first.aggregate(self.data_speed_hump.iloc[:half])
+        second.aggregate(self.data_speed_hump.iloc[half:])
+        merged = first.registers.merge(second.registers)
+        assert len(merged.estimate()) == self.data_speed_hump["on_street"].nunique()
+
+    def test_invalid_precision(self):
+        """
+        Sketches out of the supported precision range, or of two precisions
+        """
+        aggregator = DistinctCountAggregator(
+            group_by_column="on_street",
+            value_column="OBJECTID",
+            approximate=True,
+            precision=3,
+        )
+        with pytest.raises(ValueError):
+            aggregator.aggregate(self.data_speed_hump)
+
+        first = DistinctCountAggregator(
+            group_by_column="on_street", value_column="OBJECTID", approximate=True
+        )
+        second = DistinctCountAggregator(
+            group_by_column="on_street",
+            value_column="OBJECTID",
+            approximate=True,
+            precision=8,
+        )
+        first.aggregate(self.data_speed_hump)
+        second.aggregate(self.data_speed_hump)
+        with pytest.raises(ValueError):
+            first.registers.merge(second.registers)
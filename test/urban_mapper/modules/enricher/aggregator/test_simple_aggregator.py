@@ -75,3 +75,26 @@ class TestSimpleAggregator:
             aggregation_function=AGGREGATION_FUNCTIONS["median"],
         )
         assert aggregator.aggregate(self.data_neigborhood) is not None
+
+    def test_aggregate_where_weight(self):
+        """
+        Weighted mean of the rows matching an expression
+        """
+        aggregator = SimpleAggregator(
+            group_by_column="borocode",
+            value_column="gini",
+            aggregation_function=AGGREGATION_FUNCTIONS["mean"],
+            where="gini > 0.4",
+            weight="borocode",
+        )
+        result = aggregator.aggregate(self.data_neigborhood)
+        assert result is not None
+        assert (result["value"].dropna() > 0.4).all()
+
+        with pytest.raises(ValueError):
+            SimpleAggregator(
+                group_by_column="borocode",
+                value_column="gini",
+                aggregation_function=AGGREGATION_FUNCTIONS["median"],
+                weight="borocode",
+            )
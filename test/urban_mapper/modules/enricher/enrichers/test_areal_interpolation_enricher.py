@@ -0,0 +1,82 @@
+import geopandas as gpd
+import urban_mapper as um
+from urban_mapper.modules import CustomUrbanLayer
+from urban_mapper.modules.enricher import ArealInterpolationEnricher
+from urban_mapper.modules.enricher.factory import EnricherConfig
+import pytest
+
+
+# @pytest.mark.skip()
+class TestArealInterpolationEnricher:
+    """
+    It tests an ArealInterpolationEnricher class.
+
+    """
+
+    lots = gpd.read_file("test/data_files/small_PLUTO/MapPLUTO_UNCLIPPED.shp")
+
+    def _layer(self):
+        layer = CustomUrbanLayer()
+        layer.from_file("test/data_files/nyc_borough_boundaries.geojson")
+        return layer
+
+    def test_enrich(self):
+        """
+        Splitting residential units and averaging floor area ratios per borough
+        """
+        enricher = ArealInterpolationEnricher(
+            extensive=["UnitsRes"], intensive=["BuiltFAR"], config=EnricherConfig()
+        )
+        layer = enricher.enrich(self.lots, self._layer())
+        assert layer.layer["UnitsRes"].sum() == pytest.approx(
+            self.lots["UnitsRes"].sum()
+        )
+        far = layer.layer["BuiltFAR"].dropna()
+        assert far.between(
+            self.lots["BuiltFAR"].min(), self.lots["BuiltFAR"].max()
+        ).all()
+
+        """
+        Chunking does not change the results
+    """
+        chunked = ArealInterpolationEnricher(
+            extensive=["UnitsRes"],
+            intensive=["BuiltFAR"],
+            chunk_size=3,
+            config=EnricherConfig(),
+        ).enrich(self.lots, self._layer())
+        assert chunked.layer["UnitsRes"].to_numpy() == pytest.approx(
+            layer.layer["UnitsRes"].to_numpy()
+        )
+
+    def test_enrich_lines(self):
+        """
+        Splitting lot boundaries between boroughs, unclipped lots reaching into the water
+        """
+        boundaries = self.lots[["geometry"]].copy()
+        boundaries["geometry"] = boundaries.boundary
+        boundaries["lots"] = 1
+        enricher = (
+            um.UrbanMapper()
+            .enricher.interpolate_by(extensive="lots", measure="length")
+            .build()
+        )
+        layer = enricher.enrich(boundaries, self._layer())
+        assert 0 < layer.layer["lots"].sum() <= len(boundaries)
+
+    def test_enrich_without_crs(self):
+        """
+        Source geometries without a CRS are rejected
+        """
+        enricher = ArealInterpolationEnricher(
+            extensive=["UnitsRes"], config=EnricherConfig()
+        )
+        with pytest.raises(ValueError):
+            enricher.enrich(self.lots.set_crs(None, allow_override=True), self._layer())
+
+    def test_preview(self):
+        enricher = (
+            um.UrbanMapper().enricher.interpolate_by(extensive="UnitsRes").build()
+        )
+        assert "Interpolate" in enricher.preview(format="ascii")
+        assert isinstance(enricher.preview(format="json"), dict)
@@ -0,0 +1,97 @@
+import numpy as np
+import urban_mapper as um
+from urban_mapper.modules import CustomUrbanLayer
+from urban_mapper.modules.enricher import FlowMatrixEnricher, FlowMatrix
+from urban_mapper.modules.enricher.factory import EnricherConfig
+import pytest
+
+
+# @pytest.mark.skip()
+class TestFlowMatrixEnricher:
+    """
+    It tests a FlowMatrixEnricher class.
+
+    """
+
+    loader = um.UrbanMapper().loader
+
+    file_path = "test/data_files/small_VZV_Speed_Humps_with_LatLon.csv"
+    data_speed_hump = (
+        loader.from_file(file_path)
+        .with_columns(latitude_column="latitude", longitude_column="longitude")
+        .load()
+    )
+    data_speed_hump["origin"] = data_speed_hump["OBJECTID"] % 5
+    data_speed_hump["destination"] = data_speed_hump["OBJECTID"] % 3
+
+    layer = CustomUrbanLayer()
+    layer.from_file("test/data_files/nyc_borough_boundaries.geojson")
+
+    def test_enrich(self):
+        """
+        Counting trips per (origin, destination) pair, with marginals on the layer
+        """
+        enricher = FlowMatrixEnricher(
+            origin_column="origin",
+            destination_column="destination",
+            output_column="trips",
+            config=EnricherConfig(),
+        )
+        layer = enricher.enrich(self.data_speed_hump, self.layer)
+        expected = self.data_speed_hump.groupby(["origin", "destination"]).size()
+        flows = enricher.flows.to_long().set_index(["origin", "destination"])["trips"]
+        assert flows.sort_index().tolist() == expected.sort_index().tolist()
+        assert (
+            layer.layer["trips_out"].tolist()
+            == self.data_speed_hump["origin"]
+            .value_counts()
+            .reindex(layer.layer.index, fill_value=0)
+            .tolist()
+        )
+        assert layer.layer["trips_in"].sum() == len(self.data_speed_hump)
+
+        """
+        Top flows, in decreasing order
+    """
+        top = enricher.flows.top_k(3)
+        assert len(top) == min(3, len(expected))
+        assert top["trips"].tolist() == sorted(expected, reverse=True)[:3]
+        with pytest.raises(ValueError):
+            enricher.flows.top_k(0)
+
+    def test_missing_columns(self):
+        """
+        Origin or destination columns missing from the input data
+        """
+        enricher = FlowMatrixEnricher(
+            origin_column="origin",
+            destination_column="borough",
+            config=EnricherConfig(),
+        )
+        with pytest.raises(ValueError):
+            enricher.enrich(self.data_speed_hump, self.layer)
+
+    def test_save_load(self, tmp_path):
+        """
+        Summed flows survive a save / load round trip
+        """
+        enricher = (
+            um.UrbanMapper()
+            .enricher.flows_between(
+                "origin", "destination", "humps", values_from="humps"
+            )
+            .build()
+        )
+        enricher.enrich(self.data_speed_hump, self.layer)
+        enricher.flows.save(tmp_path / "flows.npz")
+        flows = FlowMatrix.load(tmp_path / "flows.npz")
+        assert flows.name == "humps"
+        assert flows.elements.equals(enricher.flows.elements)
+        assert np.allclose(flows.values.toarray(), enricher.flows.values.toarray())
+
+    def test_preview(self):
+        enricher = (
+            um.UrbanMapper().enricher.flows_between("origin", "destination").build()
+        )
+        assert "Flows" in enricher.preview(format="ascii")
+        assert isinstance(enricher.preview(format="json"), dict)
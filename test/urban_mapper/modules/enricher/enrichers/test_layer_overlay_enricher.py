@@ -0,0 +1,75 @@
+import urban_mapper as um
+from urban_mapper.modules import CustomUrbanLayer
+from urban_mapper.modules.enricher import LayerOverlayEnricher
+from urban_mapper.modules.enricher.factory import EnricherConfig
+import pytest
+
+
+# @pytest.mark.skip()
+class TestLayerOverlayEnricher:
+    """
+    It tests a LayerOverlayEnricher class.
+
+    """
+
+    loader = um.UrbanMapper().loader
+
+    file_path = "test/data_files/small_VZV_Speed_Humps_with_LatLon.csv"
+    data_speed_hump = (
+        loader.from_file(file_path)
+        .with_columns(latitude_column="latitude", longitude_column="longitude")
+        .load()
+    )
+
+    def _layer(self):
+        layer = CustomUrbanLayer()
+        layer.from_file("test/data_files/nyc_borough_boundaries.geojson")
+        return layer
+
+    def test_enrich_count(self):
+        """
+        Counting points per borough, and touching boroughs per borough
+        """
+        enricher = LayerOverlayEnricher(
+            output_column="hump_count", config=EnricherConfig()
+        )
+        layer = enricher.enrich(self.data_speed_hump, self._layer())
+        within = self.data_speed_hump.sjoin(
+            layer.layer[["geometry"]], predicate="intersects"
+        )
+        assert layer.layer["hump_count"].sum() == len(within)
+
+        enricher = LayerOverlayEnricher(
+            output_column="neighbours", predicate="touches", config=EnricherConfig()
+        )
+        layer = enricher.enrich(self._layer(), self._layer())
+        assert layer.layer["neighbours"].tolist() == [0, 3, 2, 3, 2]
+
+    def test_enrich_measures(self):
+        """
+        Overlaying a layer on itself measures its own areas and boundary lengths
+        """
+        layer = self._layer()
+        areas = layer.layer.to_crs(layer.layer.estimate_utm_crs()).area.to_numpy()
+        enricher = (
+            um.UrbanMapper()
+            .enricher.overlay_by(
+                measure="area", output_column="area", predicate="within"
+            )
+            .build()
+        )
+        layer = enricher.enrich(self._layer(), layer)
+        assert layer.layer["area"].to_numpy() == pytest.approx(areas)
+
+        boundaries = self._layer()
+        boundaries.layer = boundaries.layer.set_geometry(boundaries.layer.boundary)
+        enricher = LayerOverlayEnricher(
+            output_column="shore", measure="length", config=EnricherConfig()
+        )
+        layer = enricher.enrich(boundaries, layer)
+        assert (layer.layer["shore"] > 0).all()
+
+    def test_preview(self):
+        enricher = um.UrbanMapper().enricher.overlay_by("count").build()
+        assert "Overlay" in enricher.preview(format="ascii")
+        assert isinstance(enricher.preview(format="json"), dict)
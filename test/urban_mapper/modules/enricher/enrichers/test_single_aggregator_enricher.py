@@ -124,6 +124,58 @@ class TestSingleAggregatorEnricher:
         )
         assert enricher.enrich(self.data_neigborhood, self.layer) is not None
 
+    def test_enrich_breakdown(self):
+        """
+        Counting rows per composite key, pivoted columns
+        """
+        enricher = SingleAggregatorEnricher(
+            aggregator=CountAggregator(
+                group_by_column=["borocode", "ntaname"], count_function=len
+            ),
+            output_column="count_out",
+            config=self.config,
+        )
+        assert enricher.enrich(self.data_neigborhood, self.layer) is not None
+
+        """
+        Summing values per composite key, long-form table
+    """
+        enricher = SingleAggregatorEnricher(
+            aggregator=SimpleAggregator(
+                group_by_column=["borocode", "ntaname"],
+                value_column="gini",
+                aggregation_function=AGGREGATION_FUNCTIONS["sum"],
+            ),
+            output_column="sum_out",
+            breakdown="table",
+            config=self.config,
+        )
+        assert enricher.enrich(self.data_neigborhood, self.layer) is not None
+        assert enricher.breakdown_table is not None
+
+    def test_enrich_datasets_combined(self):
+        """
+        Counting rows of several datasets in a single pass
+        """
+        config = EnricherConfig().with_data(group_by="borocode").count_by("count_out")
+        enricher = SingleAggregatorEnricher(
+            aggregator=CountAggregator(group_by_column="borocode", count_function=len),
+            output_column="count_out",
+            config=config.with_datasets_combined(),
+        )
+        datasets = {
+            "neighborhoods": self.data_neigborhood,
+            "more_neighborhoods": self.data_neigborhood.copy(),
+        }
+        layer = enricher.enrich(datasets, self.layer)
+        assert "count_out_neighborhoods" in layer.layer.columns
+        assert "count_out_more_neighborhoods" in layer.layer.columns
+        assert (
+            layer.layer["count_out"]
+            == layer.layer["count_out_neighborhoods"]
+            + layer.layer["count_out_more_neighborhoods"]
+        ).all()
+
     def test_preview(self):
         enricher = SingleAggregatorEnricher(
             aggregator=SimpleAggregator(
@@ -0,0 +1,87 @@
+import urban_mapper as um
+from urban_mapper.modules import CustomUrbanLayer
+from urban_mapper.modules.enricher import SpatialLagEnricher, CountAggregator
+from urban_mapper.modules.enricher.helpers import layer_adjacency
+from urban_mapper.modules.enricher.factory import EnricherConfig
+import pytest
+
+
+# @pytest.mark.skip()
+class TestSpatialLagEnricher:
+    """
+    It tests a SpatialLagEnricher class.
+
+    """
+
+    loader = um.UrbanMapper().loader
+
+    file_path = "test/data_files/small_VZV_Speed_Humps_with_LatLon.csv"
+    data_speed_hump = (
+        loader.from_file(file_path)
+        .with_columns(latitude_column="latitude", longitude_column="longitude")
+        .load()
+    )
+    data_speed_hump["borough"] = data_speed_hump["OBJECTID"] % 5
+
+    config = EnricherConfig()
+
+    layer = CustomUrbanLayer()
+    layer.from_file("test/data_files/nyc_borough_boundaries.geojson")
+
+    def test_enrich(self):
+        """
+        Averaging counts over touching boroughs
+        """
+        enricher = SpatialLagEnricher(
+            aggregator=CountAggregator(group_by_column="borough"),
+            output_column="count_out",
+            config=self.config,
+        )
+        layer = enricher.enrich(self.data_speed_hump, self.layer)
+        assert "count_out_lag" in layer.layer.columns
+
+        adjacency = layer_adjacency(layer)
+        assert adjacency is layer_adjacency(layer)
+        assert (adjacency != adjacency.T).nnz == 0
+        neighbours = adjacency[1].indices
+        expected = layer.layer["count_out"].iloc[neighbours].mean()
+        assert abs(layer.layer["count_out_lag"].iloc[1] - expected) < 1e-9
+
+    def test_enrich_sum(self):
+        """
+        Summing counts over boroughs reachable in two hops
+        """
+        enricher = SpatialLagEnricher(
+            aggregator=CountAggregator(group_by_column="borough"),
+            output_column="count_out",
+            lag="sum",
+            hops=2,
+            lag_output_column="count_out_2_hops",
+            config=self.config,
+        )
+        layer = enricher.enrich(self.data_speed_hump, self.layer)
+        assert (layer.layer["count_out_2_hops"] >= 0).all()
+
+        with pytest.raises(ValueError):
+            SpatialLagEnricher(
+                aggregator=CountAggregator(group_by_column="borough"),
+                lag="median",
+                config=self.config,
+            )
+
+    def test_adjacency_rebuilt(self):
+        """
+        Replacing the layer with as many other elements rebuilds its adjacency
+        """
+        layer = CustomUrbanLayer()
+        layer.from_file("test/data_files/nyc_borough_boundaries.geojson")
+        adjacency = layer_adjacency(layer)
+        assert adjacency.nnz > 0
+
+        layer.layer = layer.layer.set_geometry(
+            layer.layer.geometry.centroid.buffer(1e-6)
+        )
+        rebuilt = layer_adjacency(layer)
+        assert rebuilt is not adjacency
+        assert rebuilt.shape == adjacency.shape
+        assert rebuilt.nnz == 0
@@ -0,0 +1,152 @@
+import numpy as np
+import urban_mapper as um
+from urban_mapper.modules import CustomUrbanLayer
+from urban_mapper.modules.enricher import (
+    TemporalBinnedEnricher,
+    TemporalCube,
+    CountAggregator,
+    SimpleAggregator,
+    AGGREGATION_FUNCTIONS,
+)
+from urban_mapper.modules.enricher.factory import EnricherConfig
+
+
+# @pytest.mark.skip()
+class TestTemporalBinnedEnricher:
+    """
+    It tests a TemporalBinnedEnricher class.
+
+    """
+
+    loader = um.UrbanMapper().loader
+
+    file_path = "test/data_files/small_VZV_Speed_Humps_with_LatLon.csv"
+    data_speed_hump = (
+        loader.from_file(file_path)
+        .with_columns(latitude_column="latitude", longitude_column="longitude")
+        .load()
+    )
+    data_speed_hump["borough"] = data_speed_hump["OBJECTID"] % 5
+
+    config = EnricherConfig()
+
+    layer = CustomUrbanLayer()
+    layer.from_file("test/data_files/nyc_borough_boundaries.geojson")
+
+    def test_enrich(self):
+        """
+        Counting rows per borough and per year, dense cube
+        """
+        enricher = TemporalBinnedEnricher(
+            aggregator=CountAggregator(group_by_column="borough", count_function=len),
+            output_column="count_out",
+            time_column="date_insta",
+            frequency="365D",
+            config=self.config,
+        )
+        assert enricher.enrich(self.data_speed_hump, self.layer) is not None
+        assert isinstance(enricher.cube, TemporalCube)
+        assert enricher.cube.to_dense().sum() == len(self.data_speed_hump)
+
+    def test_enrich_sparse(self):
+        """
+        Summing values between explicit edges, sparse cube
+        """
+        enricher = TemporalBinnedEnricher(
+            aggregator=SimpleAggregator(
+                group_by_column="borough",
+                value_column="humps",
+                aggregation_function=AGGREGATION_FUNCTIONS["sum"],
+            ),
+            output_column="sum_out",
+            time_column="date_insta",
+            bin_edges=["2000-01-01", "2010-01-01", "2020-01-01"],
+            sparse=True,
+            config=self.config,
+        )
+        assert enricher.enrich(self.data_speed_hump, self.layer) is not None
+        assert enricher.cube.is_sparse
+        assert enricher.cube.shape == (len(self.layer.layer), 2)
+
+    def test_empty_cells(self):
+        """
+        Empty cells of mean cubes are NaN, and collapsing skips them
+        """
+        cubes = []
+        for sparse in (False, True):
+            enricher = TemporalBinnedEnricher(
+                aggregator=SimpleAggregator(
+                    group_by_column="borough",
+                    value_column="humps",
+                    aggregation_function=AGGREGATION_FUNCTIONS["mean"],
+                ),
+                output_column="mean_out",
+                time_column="date_insta",
+                frequency="30D",
+                sparse=sparse,
+                config=self.config,
+            )
+            enricher.enrich(self.data_speed_hump, self.layer)
+            cubes.append(enricher.cube)
+        dense, sparse = (cube.to_dense() for cube in cubes)
+        assert np.isnan(dense).any()
+        assert np.array_equal(dense, sparse, equal_nan=True)
+        assert len(cubes[1].to_long()) == (~np.isnan(dense)).sum()
+
+        layer = cubes[0].to_layer(self.layer, collapse="min")
+        expected = np.nanmin(np.where(np.isnan(dense), np.inf, dense), axis=1)
+        filled = ~np.isnan(dense).all(axis=1)
+        assert np.allclose(layer.layer["mean_out"].to_numpy()[filled], expected[filled])
+        assert (layer.layer["mean_out"].to_numpy()[filled] > 0).all()
+
+    def test_cube(self):
+        enricher = (
+            um.UrbanMapper()
+            .enricher.with_data(group_by="borough")
+            .count_by(output_column="count_out")
+            .with_time_bins(time_column="date_insta", frequency="365D")
+            .build()
+        )
+        enricher.enrich(self.data_speed_hump, self.layer)
+        assert enricher.cube.to_long() is not None
+        assert enricher.cube.select(start="2015-01-01").to_frame() is not None
+        assert (
+            "count_out"
+            in enricher.cube.to_layer(self.layer, collapse="sum").layer.columns
+        )
+
+    def test_count_after_flows(self):
+        """
+        Counting after configuring flows drops the flow parameters, not the time bins
+        """
+        enricher = (
+            um.UrbanMapper()
+            .enricher.with_data(group_by="borough")
+            .flows_between("borough", "borough")
+            .with_time_bins(time_column="date_insta", frequency="365D")
+            .count_by(output_column="count_out")
+            .build()
+        )
+        assert isinstance(enricher, TemporalBinnedEnricher)
+        enricher.enrich(self.data_speed_hump, self.layer)
+        assert enricher.cube.to_dense().sum() == len(self.data_speed_hump)
+
+        enricher = (
+            um.UrbanMapper()
+            .enricher.with_data(group_by="borough")
+            .overlay_by("count")
+            .count_by(output_column="count_out")
+            .build()
+        )
+        assert enricher.enrich(self.data_speed_hump, self.layer) is not None
+
+    def test_preview(self):
+        enricher = (
+            um.UrbanMapper()
+            .enricher.with_data(group_by="borough")
+            .count_by()
+            .with_time_bins(time_column="date_insta")
+            .build()
+        )
+        assert isinstance(enricher.preview(format="ascii"), str)
+        assert isinstance(enricher.preview(format="json"), dict)
@@ -0,0 +1,119 @@
+import numpy as np
+import urban_mapper as um
+from urban_mapper.modules import CustomUrbanLayer
+from urban_mapper.modules.enricher import ZonalStatisticsEnricher
+from urban_mapper.modules.enricher.factory import EnricherConfig
+import pytest
+
+rasterio = pytest.importorskip("rasterio")
+
+
+# @pytest.mark.skip()
+class TestZonalStatisticsEnricher:
+    """
+    It tests a ZonalStatisticsEnricher class.
+
+    """
+
+    def _layer(self):
+        layer = CustomUrbanLayer()
+        layer.from_file("test/data_files/nyc_borough_boundaries.geojson")
+        return layer
+
+    def _raster(self, path):
+        """A tiled 256 × 256 raster over New York City, valued by row, nodata on the first rows."""
+        values = np.repeat(np.arange(256, dtype="float32")[:, None], 256, axis=1)
+        values[:8] = -1
+        transform = rasterio.transform.from_bounds(
+            -74.3, 40.45, -73.65, 40.95, 256, 256
+        )
+        with rasterio.open(
+            path,
+            "w",
+            driver="GTiff",
+            width=256,
+            height=256,
+            count=1,
+            dtype="float32",
+            crs="EPSG:4326",
+            transform=transform,
+            nodata=-1,
+            tiled=True,
+            blockxsize=64,
+            blockysize=64,
+        ) as raster:
+            raster.write(values, 1)
+        return path
+
+    def test_enrich(self, tmp_path):
+        """
+        Windowed and tiled reads agree on every borough
+        """
+        raster_path = self._raster(tmp_path / "rows.tif")
+        statistics = ["mean", "min", "max", "count"]
+        windowed = ZonalStatisticsEnricher(
+            raster_path, statistics, "rows", config=EnricherConfig()
+        ).enrich(self._layer().layer, self._layer())
+        tiled = ZonalStatisticsEnricher(
+            raster_path,
+            statistics,
+            "rows",
+            strategy="blocks",
+            n_jobs=2,
+            config=EnricherConfig(),
+        ).enrich(self._layer().layer, self._layer())
+        for statistic in statistics:
+            column = f"rows_{statistic}"
+            assert windowed.layer[column].to_numpy() == pytest.approx(
+                tiled.layer[column].to_numpy()
+            )
+        assert (windowed.layer["rows_count"] > 0).all()
+        assert (windowed.layer["rows_min"] >= 8).all()
+        assert (windowed.layer["rows_min"] <= windowed.layer["rows_mean"]).all() and (
+            windowed.layer["rows_mean"] <= windowed.layer["rows_max"]
+        ).all()
+
+    def test_enrich_buffer(self, tmp_path):
+        """
+        Buffering the elements reads more pixels
+        """
+        raster_path = self._raster(tmp_path / "rows.tif")
+        enricher = (
+            um.UrbanMapper()
+            .enricher.zonal_statistics_from(raster_path, ["count"], buffer=500.0)
+            .build()
+        )
+        buffered = enricher.enrich(self._layer().layer, self._layer())
+        plain = ZonalStatisticsEnricher(
+            raster_path, ["count"], config=EnricherConfig()
+        ).enrich(self._layer().layer, self._layer())
+        assert (buffered.layer["zonal_count"] > plain.layer["zonal_count"]).all()
+
+    def test_enrich_overlapping(self, tmp_path):
+        """
+        Pixels shared by overlapping buffers count for each of them with tiled reads
+        """
+        raster_path = self._raster(tmp_path / "rows.tif")
+        windowed, tiled = (
+            ZonalStatisticsEnricher(
+                raster_path,
+                ["count", "sum"],
+                buffer=2000.0,
+                strategy=strategy,
+                config=EnricherConfig(),
+            ).enrich(self._layer().layer, self._layer())
+            for strategy in ("window", "blocks")
+        )
+        for column in ("zonal_count", "zonal_sum"):
+            assert windowed.layer[column].to_numpy() == pytest.approx(
+                tiled.layer[column].to_numpy()
+            )
+
+    def test_preview(self, tmp_path):
+        enricher = (
+            um.UrbanMapper()
+            .enricher.zonal_statistics_from(self._raster(tmp_path / "rows.tif"))
+            .build()
+        )
+        assert "Zonal Statistics" in enricher.preview(format="ascii")
+        assert isinstance(enricher.preview(format="json"), dict)
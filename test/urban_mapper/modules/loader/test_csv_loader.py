@@ -1,4 +1,5 @@
 import geopandas as gpd
+import pandas as pd
 from urban_mapper import CSVLoader
 import pytest
 
@@ -52,6 +53,184 @@ class TestCSVLoader:
         )
         assert isinstance(loader.load(), gpd.GeoDataFrame)
 
+    def test_engines(self):
+        """
+        The Arrow reader gives the data pandas reads
+        """
+        arrow = CSVLoader(
+            self.file_path, longitude_column="longitude", latitude_column="latitude"
+        ).load()
+        pandas = CSVLoader(
+            self.file_path,
+            longitude_column="longitude",
+            latitude_column="latitude",
+            engine="c",
+        ).load()
+        assert arrow.drop(columns="geometry").equals(pandas.drop(columns="geometry"))
+
+        """
+        Projected columns, coordinates always being read
+    """
+        loader = CSVLoader(
+            self.file_path,
+            longitude_column="longitude",
+            latitude_column="latitude",
+            columns=["humps", "not_a_column"],
+        )
+        assert list(loader.load().columns) == [
+            "humps",
+            "longitude",
+            "latitude",
+            "geometry",
+        ]
+
+    def test_malformed_coordinates(self, tmp_path):
+        """
+        Malformed coordinates become missing values with either engine
+        """
+        file_path = tmp_path / "malformed.csv"
+        pd.DataFrame(
+            {
+                "lat": ["40.7", "n/a", "", " 40.8"],
+                "lon": ["-73.9", "-74", "-73.8", "unknown"],
+            }
+        ).to_csv(file_path, index=False)
+        for engine in ("pyarrow", "c"):
+            data = CSVLoader(
+                file_path, latitude_column="lat", longitude_column="lon", engine=engine
+            ).load()
+            assert data["lat"].tolist() == pytest.approx(
+                [40.7, float("nan"), float("nan"), 40.8], nan_ok=True
+            )
+            assert data["lon"].isna().tolist() == [False, False, False, True]
+
+    def test_project_columns(self):
+        """
+        Projecting on renamed columns reads them under their file names
+        """
+        loader = CSVLoader(
+            self.file_path,
+            longitude_column="longitude",
+            latitude_column="latitude",
+            map_columns={"humps": "hump_count"},
+        )
+        assert loader.project_columns(["hump_count", "not_a_column"]) > 0
+        assert set(loader.load().columns) == {
+            "hump_count",
+            "longitude",
+            "latitude",
+            "geometry",
+        }
+
+    def test_load_chunks(self):
+        """
+        Chunks of bounded size, renamed and projected, concatenating to the whole file
+        """
+        loader = CSVLoader(
+            self.file_path,
+            longitude_column="longitude",
+            latitude_column="latitude",
+            coordinate_reference_system=("EPSG:4326", "EPSG:3857"),
+            map_columns={"humps": "hump_count"},
+        )
+        chunks = list(loader.load_chunks(chunk_size=2))
+        assert all(len(chunk) <= 2 for chunk in chunks)
+        assert all(chunk.crs == "EPSG:3857" for chunk in chunks)
+        assert all("hump_count" in chunk.columns for chunk in chunks)
+        data = pd.concat(chunks)
+        expected = loader.load()
+        assert len(data) == 6
+        assert data.index.equals(expected.index)
+        assert data.geometry.to_wkt().equals(expected.geometry.to_wkt())
+
+        """
+        Non-positive chunk sizes
+    """
+        with pytest.raises(ValueError):
+            next(loader.load_chunks(chunk_size=0))
+
+    def test_engines_missing_values(self, tmp_path):
+        """
+        The Arrow and pandas engines read missing values alike
+        """
+        file_path = tmp_path / "missing.csv"
+        file_path.write_text(
+            "name,count,flag,empty,note,latitude,longitude\n"
+            'a,1,True,,"x",40.7,-73.9\n'
+            ',,False,,"",n/a,-73.8\n'
+            'NA,3,,,"null",40.8,\n'
+            "b,4,True,,NULL,40.6,-73.7\n"
+        )
+        arrow, python = (
+            CSVLoader(
+                file_path,
+                longitude_column="longitude",
+                latitude_column="latitude",
+                engine=engine,
+            ).load()
+            for engine in ("pyarrow", "python")
+        )
+        pd.testing.assert_frame_equal(
+            pd.DataFrame(arrow.drop(columns="geometry")),
+            pd.DataFrame(python.drop(columns="geometry")),
+        )
+        assert arrow.geometry.to_wkt().equals(python.geometry.to_wkt())
+        assert arrow["name"].isna().tolist() == [False, True, True, False]
+
+    def test_dtype_optimisation(self):
+        """
+        Narrower dtypes, holding the same values, and the bytes they save
+        """
+        expected = CSVLoader(
+            self.file_path, longitude_column="longitude", latitude_column="latitude"
+        ).load()
+        loader = CSVLoader(
+            self.file_path,
+            longitude_column="longitude",
+            latitude_column="latitude",
+            dtype_optimisation={"keep": ["from_stree"]},
+        )
+        data = loader.load()
+        assert data["humps"].dtype == "int8"
+        assert isinstance(data["on_street"].dtype, pd.CategoricalDtype)
+        assert data["from_stree"].dtype == object
+        assert data["latitude"].dtype == "float64"
+        for column in expected.columns.drop("geometry"):
+            assert data[column].astype(object).equals(expected[column].astype(object))
+        assert data.geometry.equals(expected.geometry)
+        savings = loader.dtype_savings.set_index("column")
+        assert "from_stree" not in savings.index
+        assert (savings["bytes_saved"] > 0).all()
+        assert (
+            data.memory_usage(deep=True).sum()
+            == expected.memory_usage(deep=True).sum() - savings["bytes_saved"].sum()
+        )
+
+        """
+        Coordinates in single precision, within a metre
+    """
+        loader = CSVLoader(
+            self.file_path,
+            longitude_column="longitude",
+            latitude_column="latitude",
+            dtype_optimisation={"float32_coordinates": True},
+        )
+        data = loader.load()
+        assert data["latitude"].dtype == "float32"
+        assert (data["latitude"] - expected["latitude"]).abs().max() < 1e-5
+        assert data.geometry.equals(expected.geometry)
+
+        """
+        Category ratios out of bounds
+    """
+        with pytest.raises(ValueError):
+            CSVLoader(
+                self.file_path,
+                longitude_column="longitude",
+                latitude_column="latitude",
+                dtype_optimisation={"max_category_ratio": 2.0},
+            ).load()
+
     def test_preview(self):
         loader = CSVLoader(
             self.file_path, longitude_column="longitude", latitude_column="latitude"
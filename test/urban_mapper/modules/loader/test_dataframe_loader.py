@@ -1,6 +1,13 @@
+import tracemalloc
+import numpy as np
 import pandas as pd
 import geopandas as gpd
+import urban_mapper as um
 from urban_mapper import DataFrameLoader
+from urban_mapper.modules.loader.helpers import (
+    get_transformer,
+    transform_coordinates,
+)
 import pytest
 
 # @pytest.mark.skip()
@@ -53,6 +60,112 @@ class TestDataFrameLoader:
         )
         assert isinstance(loader.load(), gpd.GeoDataFrame)
 
+    def test_zero_copy(self):
+        """
+        Loading without copy only allocates the geometry and coordinates
+        """
+        generator = np.random.default_rng(0)
+        size = 50_000
+        dataframe = pd.DataFrame(
+            {f"value_{i}": generator.random(size) for i in range(10)}
+        )
+        dataframe["latitude"] = generator.uniform(40.5, 40.9, size)
+        dataframe["longitude"] = generator.uniform(-74.2, -73.7, size)
+        original = dataframe.copy()
+        frame_bytes = dataframe.memory_usage(deep=True).sum()
+
+        tracemalloc.start()
+        gpd.points_from_xy(dataframe["longitude"], dataframe["latitude"])
+        geometry_bytes = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        peaks = {}
+        for copy in (True, False):
+            tracemalloc.start()
+            data = (
+                um.UrbanMapper()
+                .loader.from_dataframe(dataframe, copy=copy)
+                .with_columns(longitude_column="longitude", latitude_column="latitude")
+                .with_map({"value_0": "renamed"})
+                .load()
+            )
+            peaks[copy] = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            assert np.shares_memory(
+                data["value_1"].to_numpy(), dataframe["value_1"].to_numpy()
+            ) == (not copy)
+        assert peaks[False] < geometry_bytes + 0.25 * frame_bytes
+        assert peaks[True] > peaks[False] + 0.9 * frame_bytes
+        assert dataframe.equals(original)
+
+        """
+        GeoDataFrames keep their coordinate reference system
+    """
+        geo_dataframe = gpd.GeoDataFrame(
+            original.iloc[:10],
+            geometry=gpd.points_from_xy(
+                original["longitude"].iloc[:10], original["latitude"].iloc[:10]
+            ),
+        )
+        data = DataFrameLoader(
+            geo_dataframe,
+            geometry_column="geometry",
+            coordinate_reference_system="EPSG:4326",
+            copy=False,
+        ).load()
+        assert data.crs == "EPSG:4326"
+        assert geo_dataframe.crs is None
+
+    def test_reprojection(self):
+        """
+        State plane coordinates, transformed before building the points, match to_crs
+        """
+        state_plane = gpd.GeoSeries.from_xy(
+            self.dataframe["longitude"], self.dataframe["latitude"], crs="EPSG:4326"
+        ).to_crs("EPSG:2263")
+        dataframe = self.dataframe.assign(x=state_plane.x, y=state_plane.y)
+        expected = gpd.GeoSeries.from_xy(
+            dataframe["x"], dataframe["y"], crs="EPSG:2263"
+        ).to_crs("EPSG:4326")
+        data = DataFrameLoader(
+            dataframe,
+            longitude_column="x",
+            latitude_column="y",
+            coordinate_reference_system=("EPSG:2263", "EPSG:4326"),
+        ).load()
+        assert data.crs == "EPSG:4326"
+        assert data["x"].equals(dataframe["x"])
+        assert data.geometry.geom_equals_exact(expected, tolerance=1e-9).all()
+
+        """
+        Geometry columns, transformed with a cached transformer
+    """
+        dataframe = dataframe.assign(the_geom=state_plane.to_wkt())
+        data = DataFrameLoader(
+            dataframe,
+            geometry_column="the_geom",
+            coordinate_reference_system=("EPSG:2263", "EPSG:4326"),
+        ).load()
+        assert data.crs == "EPSG:4326"
+        assert data.geometry.geom_equals_exact(expected, tolerance=1e-9).all()
+        assert get_transformer("EPSG:2263", "EPSG:4326") is get_transformer(
+            "EPSG:2263", "EPSG:4326"
+        )
+
+        """
+        Chunks transformed on several threads match a single pass
+    """
+        x, y = dataframe["x"].to_numpy(), dataframe["y"].to_numpy()
+        single = transform_coordinates(x, y, "EPSG:2263", "EPSG:4326")
+        threaded = transform_coordinates(
+            x, y, "EPSG:2263", "EPSG:4326", max_workers=3, chunk_size=100
+        )
+        assert np.array_equal(single[0], threaded[0])
+        assert np.array_equal(single[1], threaded[1])
+        assert np.array_equal(x, dataframe["x"].to_numpy())
+        with pytest.raises(ValueError):
+            transform_coordinates(x, y[:-1], "EPSG:2263", "EPSG:4326")
+
     def test_preview(self):
         loader = DataFrameLoader(
             self.dataframe, longitude_column="longitude", latitude_column="latitude"
@@ -1,4 +1,7 @@
+import tracemalloc
 import geopandas as gpd
+import numpy as np
+import pandas as pd
 import urban_mapper as um
 from urban_mapper import HuggingFaceLoader
 import pytest
@@ -73,6 +76,66 @@ class TestHuggingFaceLoader:
         )
         assert isinstance(loader.load(), gpd.GeoDataFrame)        
 
+    @pytest.fixture
+    def local_dataset(self, tmp_path):
+        generator = np.random.default_rng(0)
+        size = 20_000
+        pd.DataFrame(
+            {
+                "latitude": generator.uniform(40.5, 40.9, size),
+                "longitude": generator.uniform(-74.2, -73.7, size),
+                "fare": generator.random(size),
+                "kind": generator.choice(["cash", "card"], size),
+            }
+        ).to_parquet(tmp_path / "train.parquet", index=False)
+        return str(tmp_path)
+
+    def test_arrow_load(self, local_dataset):
+        """
+        Converting the Arrow table at once, without copies of the data
+        """
+        expected = pd.read_parquet(f"{local_dataset}/train.parquet")
+        loader = HuggingFaceLoader(
+            repo_id=local_dataset,
+            longitude_column="longitude",
+            latitude_column="latitude",
+        )
+        loader.load()
+        tracemalloc.start()
+        data = loader.load()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        assert data.drop(columns="geometry").equals(expected)
+        assert peak < 3 * expected.memory_usage(deep=True).sum()
+
+        """
+        Streaming record batches up to a number of rows
+    """
+        loader = HuggingFaceLoader(
+            repo_id=local_dataset,
+            number_of_rows=15_000,
+            streaming=True,
+            longitude_column="longitude",
+            latitude_column="latitude",
+        )
+        data = loader.load()
+        assert data.drop(columns="geometry").equals(expected.iloc[:15_000])
+        chunks = list(loader.load_chunks(chunk_size=4_000))
+        assert [len(chunk) for chunk in chunks] == [4_000, 4_000, 4_000, 3_000]
+        assert pd.concat(chunks).geometry.equals(data.geometry)
+
+        """
+        Streaming the whole split
+    """
+        loader = HuggingFaceLoader(
+            repo_id=local_dataset,
+            streaming=True,
+            longitude_column="longitude",
+            latitude_column="latitude",
+        )
+        data = loader.load()
+        assert data.drop(columns="geometry").equals(expected)
+
     def test_preview(self):
         loader = HuggingFaceLoader(
             repo_id=self.repo_id, number_of_rows=self.number_of_rows, 
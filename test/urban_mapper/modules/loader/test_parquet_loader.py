@@ -1,4 +1,5 @@
 import geopandas as gpd
+import pandas as pd
 from urban_mapper import ParquetLoader
 import pytest
 
@@ -52,6 +53,135 @@ class TestParquetLoader:
         )
         assert isinstance(loader.load(), gpd.GeoDataFrame)
 
+    def test_project_columns(self):
+        """
+        Projecting on renamed columns reads them under their file names
+        """
+        loader = ParquetLoader(
+            self.file_path,
+            longitude_column="longitude",
+            latitude_column="latitude",
+            map_columns={"humps": "hump_count"},
+        )
+        assert loader.project_columns(["hump_count", "not_a_column"]) > 0
+        assert set(loader.load().columns) == {
+            "hump_count",
+            "longitude",
+            "latitude",
+            "geometry",
+        }
+
+    def test_restrict_to_bounds(self, tmp_path):
+        """
+        Skipping row groups and rows outside bounds gives the rows the filter keeps
+        """
+        file_path = tmp_path / "row_groups.parquet"
+        pd.read_parquet(self.file_path).to_parquet(file_path, row_group_size=300)
+        min_x, min_y, max_x, max_y = -74.0, 40.6, -73.9, 40.75
+        expected = ParquetLoader(
+            file_path, longitude_column="longitude", latitude_column="latitude"
+        ).load()
+        expected = expected.cx[min_x:max_x, min_y:max_y]
+        loader = ParquetLoader(
+            file_path, longitude_column="longitude", latitude_column="latitude"
+        )
+        assert loader.restrict_to_bounds((min_x, min_y, max_x, max_y))
+        data = loader.load()
+        assert 0 < len(data) < 4025
+        assert data.index.equals(expected.index)
+        assert data.drop(columns="geometry").equals(expected.drop(columns="geometry"))
+        assert sum(len(chunk) for chunk in loader.load_chunks(100)) == len(expected)
+
+        """
+        Bounds cannot be tested on geometries, or on reprojected coordinates
+    """
+        assert not ParquetLoader(
+            file_path, geometry_column="the_geom"
+        ).restrict_to_bounds((min_x, min_y, max_x, max_y))
+        assert not ParquetLoader(
+            file_path,
+            longitude_column="longitude",
+            latitude_column="latitude",
+            coordinate_reference_system=("EPSG:4326", "EPSG:3857"),
+        ).restrict_to_bounds((min_x, min_y, max_x, max_y))
+
+    def test_load_chunks(self):
+        """
+        Chunks of bounded size, renamed and projected, concatenating to the whole file
+        """
+        loader = ParquetLoader(
+            self.file_path,
+            longitude_column="longitude",
+            latitude_column="latitude",
+            coordinate_reference_system=("EPSG:4326", "EPSG:3857"),
+            map_columns={"humps": "hump_count"},
+        )
+        chunks = list(loader.load_chunks(chunk_size=1000))
+        assert all(len(chunk) <= 1000 for chunk in chunks)
+        assert all(chunk.crs == "EPSG:3857" for chunk in chunks)
+        assert all("hump_count" in chunk.columns for chunk in chunks)
+        data = pd.concat(chunks)
+        expected = loader.load()
+        assert len(data) == 4025
+        assert data.index.equals(expected.index)
+        assert data.geometry.to_wkt().equals(expected.geometry.to_wkt())
+
+        """
+        Non-positive chunk sizes
+    """
+        with pytest.raises(ValueError):
+            next(loader.load_chunks(chunk_size=0))
+
+    def test_geometry_encodings(self, tmp_path):
+        """
+        WKB and hexadecimal WKB geometry columns parse like WKT ones
+        """
+        expected = ParquetLoader(self.file_path, geometry_column="the_geom").load()
+        source = pd.read_parquet(self.file_path)
+        for name, encode in [
+            ("wkb", lambda geometries: geometries.to_wkb()),
+            ("hex", lambda geometries: geometries.to_wkb(hex=True)),
+        ]:
+            encoded = source.assign(the_geom=encode(expected.geometry))
+            encoded.to_parquet(tmp_path / f"{name}.parquet")
+            loader = ParquetLoader(
+                tmp_path / f"{name}.parquet", geometry_column="the_geom"
+            )
+            data = loader.load()
+            assert data.geometry.to_wkt().equals(expected.geometry.to_wkt())
+            chunks = pd.concat(loader.load_chunks(chunk_size=1000))
+            assert chunks.geometry.to_wkt().equals(expected.geometry.to_wkt())
+
+        """
+        GeoParquet files, with their coordinate reference system
+    """
+        file_path = tmp_path / "geo.parquet"
+        expected.to_crs("EPSG:3857").to_parquet(file_path)
+        loader = ParquetLoader(
+            file_path,
+            geometry_column="the_geom",
+            coordinate_reference_system=("EPSG:4326", "EPSG:3857"),
+        )
+        data = loader.load()
+        assert data.crs == "EPSG:3857"
+        assert data.geometry.name == "the_geom"
+        assert (
+            data.geometry.geom_equals_exact(
+                expected.to_crs("EPSG:3857").geometry, tolerance=1e-6
+            ).sum()
+            == expected.geometry.notna().sum()
+        )
+        chunks = pd.concat(loader.load_chunks(chunk_size=1000))
+        assert chunks.crs == "EPSG:3857"
+        assert chunks.geometry.to_wkt().equals(data.geometry.to_wkt())
+
+        """
+        Unrecognised encodings
+    """
+        source.assign(the_geom=1).to_parquet(tmp_path / "int.parquet")
+        with pytest.raises(ValueError):
+            ParquetLoader(tmp_path / "int.parquet", geometry_column="the_geom").load()
+
     def test_preview(self):
         loader = ParquetLoader(
             self.file_path, longitude_column="longitude", latitude_column="latitude"
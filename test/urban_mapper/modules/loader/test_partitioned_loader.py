@@ -0,0 +1,137 @@
+import geopandas as gpd
+import pandas as pd
+import urban_mapper as um
+from urban_mapper import PartitionedLoader, ParquetLoader
+import pytest
+
+
+# @pytest.mark.skip()
+class TestPartitionedLoader:
+    file_path = "test/data_files/small_VZV_Speed_Humps_with_LatLon.parquet"
+
+    @pytest.fixture
+    def partitioned(self, tmp_path):
+        source = pd.read_parquet(self.file_path)
+        for part, date in enumerate(["2025-01-01", "2025-01-02", "2025-01-03"]):
+            directory = tmp_path / f"date={date}"
+            directory.mkdir()
+            source.iloc[part::3].to_parquet(directory / "part-0.parquet", index=False)
+        return tmp_path
+
+    def test_load(self, partitioned):
+        """
+        Files below a directory, with their partition columns
+        """
+        loader = PartitionedLoader(
+            partitioned,
+            longitude_column="longitude",
+            latitude_column="latitude",
+            max_workers=2,
+        )
+        data = loader.load()
+        assert isinstance(data, gpd.GeoDataFrame)
+        assert len(data) == 4025
+        assert data.index.equals(pd.RangeIndex(4025))
+        assert isinstance(data["date"].dtype, pd.CategoricalDtype)
+        assert data["date"].value_counts().sort_index().tolist() == [1342, 1342, 1341]
+        expected = ParquetLoader(
+            partitioned / "date=2025-01-02" / "part-0.parquet",
+            longitude_column="longitude",
+            latitude_column="latitude",
+        ).load()
+        assert (
+            data[data["date"] == "2025-01-02"]["OBJECTID"].tolist()
+            == expected["OBJECTID"].tolist()
+        )
+
+        """
+        Glob patterns
+    """
+        loader = PartitionedLoader(
+            str(partitioned / "date=2025-01-0[12]" / "*.parquet"),
+            longitude_column="longitude",
+            latitude_column="latitude",
+        )
+        assert len(loader.load()) == 2684
+
+        """
+        No matching files
+    """
+        with pytest.raises(ValueError):
+            PartitionedLoader(
+                str(partitioned / "*.csv"),
+                longitude_column="longitude",
+                latitude_column="latitude",
+            )
+
+    def test_partition_filter(self, partitioned):
+        """
+        Pruning partitions by value, values or predicate
+        """
+        for partition_filter, dates in [
+            ({"date": "2025-01-01"}, ["2025-01-01"]),
+            ({"date": ["2025-01-01", "2025-01-03"]}, ["2025-01-01", "2025-01-03"]),
+            ({"date": lambda date: date >= "2025-01-02"}, ["2025-01-02", "2025-01-03"]),
+        ]:
+            loader = PartitionedLoader(
+                partitioned,
+                longitude_column="longitude",
+                latitude_column="latitude",
+                partition_filter=partition_filter,
+            )
+            assert len(loader.file_paths) == len(dates)
+            assert sorted(loader.load()["date"].unique().tolist()) == dates
+
+        """
+        Filters pruning every file
+    """
+        loader = PartitionedLoader(
+            partitioned,
+            longitude_column="longitude",
+            latitude_column="latitude",
+            partition_filter={"date": "2024-12-31"},
+        )
+        with pytest.raises(ValueError):
+            loader.load()
+
+    def test_load_chunks(self, partitioned):
+        """
+        Streaming the files matches loading them
+        """
+        loader = PartitionedLoader(
+            partitioned,
+            longitude_column="longitude",
+            latitude_column="latitude",
+            map_columns={"humps": "hump_count"},
+        )
+        chunks = list(loader.load_chunks(chunk_size=500))
+        assert all(len(chunk) <= 500 for chunk in chunks)
+        data = pd.concat(chunks)
+        expected = loader.load()
+        assert "hump_count" in data.columns
+        assert data.index.equals(expected.index)
+        assert data["date"].astype(str).equals(expected["date"].astype(str))
+        assert data.geometry.to_wkt().equals(expected.geometry.to_wkt())
+
+    def test_factory(self, partitioned):
+        """
+        Loading several files through the factory
+        """
+        data = (
+            um.UrbanMapper()
+            .loader.from_files(
+                str(partitioned), partition_filter={"date": "2025-01-03"}
+            )
+            .with_columns(longitude_column="longitude", latitude_column="latitude")
+            .load()
+        )
+        assert len(data) == 1341
+        assert data["date"].unique().tolist() == ["2025-01-03"]
+
+    def test_preview(self, partitioned):
+        loader = PartitionedLoader(
+            partitioned, longitude_column="longitude", latitude_column="latitude"
+        )
+
+        assert isinstance(loader.preview(format="ascii"), str)
+        assert isinstance(loader.preview(format="json"), dict)
@@ -1,5 +1,6 @@
 import urban_mapper as um
 from urban_mapper.modules import Tile2NetSidewalks
+from urban_mapper.modules.enricher import CountAggregator
 import pytest
 
 
@@ -105,6 +106,21 @@ class TestTile2NetSidewalks:
             is not None
         )
 
+    def test_aggregate_geometry_mapping(self):
+        """
+        Counting rows per sidewalk over a mapping of geometries to several sidewalks
+        """
+        layer = Tile2NetSidewalks()
+        layer.from_file(self.sidewalk_path)
+        _, mapped_data = layer.map_nearest_layer(
+            self.data_neigborhood_geom,
+            geometry_column="geometry",
+            output_column="sidewalk_near",
+        )
+        result = CountAggregator(group_by_column="sidewalk_near").aggregate(mapped_data)
+        expected = mapped_data["sidewalk_near"].explode().dropna().value_counts()
+        assert result["value"].sort_index().tolist() == expected.sort_index().tolist()
+
     def test_get_layer_bounding_box(self):
         if self.layer.layer is None:
             self.layer.from_file(self.sidewalk_path)
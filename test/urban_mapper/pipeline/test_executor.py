@@ -0,0 +1,427 @@
+import urban_mapper as um
+from urban_mapper.modules import CustomUrbanLayer, Tile2NetSidewalks
+from urban_mapper.modules.loader import ParquetLoader
+from urban_mapper.modules.filter import BoundingBoxFilter
+from urban_mapper.modules.imputer import AddressGeoImputer, SimpleGeoImputer
+from urban_mapper.modules.enricher import (
+    SingleAggregatorEnricher,
+    CountAggregator,
+    SimpleAggregator,
+    AGGREGATION_FUNCTIONS,
+)
+from urban_mapper.modules.enricher.factory import EnricherConfig
+from urban_mapper.pipeline.executor import PipelineExecutor
+import pytest
+
+
+# @pytest.mark.skip()
+class TestPipelineExecutor:
+    """
+    It tests the column projection and enrichment of the PipelineExecutor class.
+
+    """
+
+    loader = um.UrbanMapper().loader
+
+    file_path = "test/data_files/small_VZV_Speed_Humps_with_LatLon.csv"
+    data_speed_hump = (
+        loader.from_file(file_path)
+        .with_columns(latitude_column="latitude", longitude_column="longitude")
+        .load()
+    )
+    data_speed_hump["borough"] = data_speed_hump["OBJECTID"] % 5
+
+    layer = CustomUrbanLayer()
+    layer.from_file("test/data_files/nyc_borough_boundaries.geojson")
+    layer.mappings = [
+        {
+            "longitude_column": "longitude",
+            "latitude_column": "latitude",
+            "output_column": "borough",
+        }
+    ]
+
+    def _executor(self, aggregator, map_projection=True):
+        enricher = SingleAggregatorEnricher(
+            aggregator=aggregator, output_column="value", config=EnricherConfig()
+        )
+        executor = PipelineExecutor(
+            [("layer", self.layer), ("enricher", enricher)],
+            map_projection=map_projection,
+        )
+        executor.data = self.data_speed_hump
+        return executor
+
+    def test_projected_columns(self):
+        """
+        Summing a column only maps the columns the enricher and the mapping read
+        """
+        executor = self._executor(
+            SimpleAggregator(
+                group_by_column="borough",
+                value_column="humps",
+                aggregation_function=AGGREGATION_FUNCTIONS["sum"],
+            )
+        )
+        columns = executor._projected_columns(self.layer)
+        assert set(columns) == {
+            "borough",
+            "humps",
+            "longitude",
+            "latitude",
+            self.data_speed_hump.geometry.name,
+        }
+        assert "on_street" not in columns
+
+    def test_map_whole_data(self):
+        """
+        The whole data is mapped by default, or when counting with a custom function
+        """
+        executor = self._executor(
+            CountAggregator(group_by_column="borough"), map_projection=False
+        )
+        assert executor._projected_columns(self.layer) is None
+
+        executor = self._executor(
+            CountAggregator(group_by_column="borough", count_function=lambda g: 1)
+        )
+        assert executor._projected_columns(self.layer) is None
+
+    def test_incremental(self, tmp_path):
+        """
+        Merging two batches into a persisted state gives the counts and means of both
+        """
+        first = self.data_speed_hump.iloc[::2]
+        second = self.data_speed_hump.iloc[1::2]
+        for aggregator, output in [
+            (CountAggregator(group_by_column="borough"), "count"),
+            (
+                SimpleAggregator(
+                    group_by_column="borough",
+                    value_column="humps",
+                    aggregation_function=AGGREGATION_FUNCTIONS["mean"],
+                ),
+                "mean",
+            ),
+        ]:
+            enricher = SingleAggregatorEnricher(
+                aggregator=aggregator, output_column=output, config=EnricherConfig()
+            )
+            state_path = tmp_path / f"{output}.npz"
+            enricher.enrich_incremental(first, self.layer, state_path)
+            layer = enricher.enrich_incremental(second, self.layer, state_path)
+            expected = enricher.enrich(self.data_speed_hump, self.layer)
+            assert layer.layer[output].tolist() == pytest.approx(
+                expected.layer[output].tolist(), nan_ok=True
+            )
+
+    def test_incremental_configuration_mismatch(self, tmp_path):
+        """
+        A persisted state is not merged with batches aggregated differently
+        """
+
+        def enricher(value_column):
+            return SingleAggregatorEnricher(
+                aggregator=SimpleAggregator(
+                    group_by_column="borough",
+                    value_column=value_column,
+                    aggregation_function=AGGREGATION_FUNCTIONS["sum"],
+                ),
+                config=EnricherConfig(),
+            )
+
+        state_path = tmp_path / "sum.npz"
+        enricher("humps").enrich_incremental(
+            self.data_speed_hump, self.layer, state_path
+        )
+        with pytest.raises(ValueError):
+            enricher("OBJECTID").enrich_incremental(
+                self.data_speed_hump, self.layer, state_path
+            )
+
+    def test_incremental_median_rejected(self, tmp_path):
+        """
+        Medians cannot be merged
+        """
+        first = self.data_speed_hump.iloc[::2]
+        enricher = SingleAggregatorEnricher(
+            aggregator=SimpleAggregator(
+                group_by_column="borough",
+                value_column="humps",
+                aggregation_function=AGGREGATION_FUNCTIONS["median"],
+            ),
+            config=EnricherConfig(),
+        )
+        with pytest.raises(ValueError):
+            enricher.enrich_incremental(first, self.layer, tmp_path / "median.npz")
+
+    def test_sweep(self):
+        """
+        Sweeping variants over the mapped data matches enriching each of them
+        """
+        executor = self._executor(CountAggregator(group_by_column="borough"))
+        executor._mapped_data = self.data_speed_hump[["borough", "geometry"]]
+        executor.urban_layer = self.layer
+        executor._composed = True
+        variants = {
+            method: SingleAggregatorEnricher(
+                aggregator=SimpleAggregator(
+                    group_by_column="borough",
+                    value_column="humps",
+                    aggregation_function=AGGREGATION_FUNCTIONS[method],
+                ),
+                output_column=method,
+                config=EnricherConfig(),
+            )
+            for method in ("sum", "max")
+        }
+        variants["count"] = SingleAggregatorEnricher(
+            aggregator=CountAggregator(group_by_column="borough", where="humps > 1"),
+            output_column="count",
+            config=EnricherConfig(),
+        )
+        columns = list(self.layer.layer.columns)
+        results = executor.sweep(variants)
+        assert len(results) == 3 * len(self.layer.layer)
+        assert list(self.layer.layer.columns) == columns
+        table = results.pivot(index="element", columns="variant", values="value")
+        for name, enricher in variants.items():
+            expected = enricher.enrich(self.data_speed_hump, self.layer)
+            assert table[name].tolist() == pytest.approx(expected.layer[name].tolist())
+
+        """
+        Variants broken down per group cannot be swept
+    """
+        with pytest.raises(ValueError):
+            executor.sweep(
+                [
+                    SingleAggregatorEnricher(
+                        aggregator=CountAggregator(
+                            group_by_column=["borough", "humps"]
+                        ),
+                        config=EnricherConfig(),
+                    )
+                ]
+            )
+
+    def test_project_columns(self):
+        """
+        Loaders only read the columns the filter, mapping and enricher read
+        """
+        loader = ParquetLoader(
+            "test/data_files/small_VZV_Speed_Humps_with_LatLon.parquet",
+            latitude_column="latitude",
+            longitude_column="longitude",
+        )
+        enricher = SingleAggregatorEnricher(
+            aggregator=SimpleAggregator(
+                group_by_column="borough",
+                value_column="humps",
+                aggregation_function=AGGREGATION_FUNCTIONS["sum"],
+            ),
+            config=EnricherConfig(),
+        )
+        executor = PipelineExecutor(
+            [
+                ("loader", loader),
+                ("filter", BoundingBoxFilter()),
+                ("layer", self.layer),
+                ("enricher", enricher),
+            ],
+            project_columns=True,
+        )
+        executor._project_loaders(self.layer)
+        assert executor.bytes_saved["loader"] > 0
+        assert set(loader.load().columns) == {
+            "humps",
+            "longitude",
+            "latitude",
+            "geometry",
+        }
+
+        """
+        Enrichers reading unknown columns disable the projection
+    """
+        loader = ParquetLoader(
+            "test/data_files/small_VZV_Speed_Humps_with_LatLon.parquet",
+            latitude_column="latitude",
+            longitude_column="longitude",
+        )
+        enricher = SingleAggregatorEnricher(
+            aggregator=CountAggregator(
+                group_by_column="borough", count_function=lambda g: 1
+            ),
+            config=EnricherConfig(),
+        )
+        executor = PipelineExecutor(
+            [("loader", loader), ("layer", self.layer), ("enricher", enricher)],
+            project_columns=True,
+        )
+        executor._project_loaders(self.layer)
+        assert executor.bytes_saved == {}
+        assert loader.columns is None
+
+    def test_push_down_bounds(self):
+        """
+        The bounding box filter is pushed down into the loader, with the same result
+        """
+        file_path = "test/data_files/small_VZV_Speed_Humps_with_LatLon.parquet"
+        loader = ParquetLoader(
+            file_path, latitude_column="latitude", longitude_column="longitude"
+        )
+        bounding_box_filter = BoundingBoxFilter()
+        executor = PipelineExecutor(
+            [
+                ("loader", loader),
+                ("imputer", SimpleGeoImputer("latitude", "longitude")),
+                ("filter", bounding_box_filter),
+                ("layer", self.layer),
+            ]
+        )
+        executor._push_down_bounds(self.layer)
+        assert loader.bounds == bounding_box_filter.pushdown_bounds(self.layer)
+        expected = bounding_box_filter.transform(
+            ParquetLoader(
+                file_path, latitude_column="latitude", longitude_column="longitude"
+            ).load(),
+            self.layer,
+        )
+        data = loader.load()
+        assert data.index.equals(expected.index)
+        assert data.drop(columns="geometry").equals(expected.drop(columns="geometry"))
+
+        """
+        Imputers filling missing coordinates disable the pushdown
+    """
+        loader = ParquetLoader(
+            file_path, latitude_column="latitude", longitude_column="longitude"
+        )
+        executor = PipelineExecutor(
+            [
+                ("loader", loader),
+                (
+                    "imputer",
+                    AddressGeoImputer(
+                        "latitude", "longitude", address_column="on_street"
+                    ),
+                ),
+                ("filter", BoundingBoxFilter()),
+                ("layer", self.layer),
+            ]
+        )
+        executor._push_down_bounds(self.layer)
+        assert loader.bounds is None
+
+        """
+        Pushed down bounds only hold for one composition, and replace earlier ones
+    """
+        loader = ParquetLoader(
+            file_path, latitude_column="latitude", longitude_column="longitude"
+        )
+        layer = Tile2NetSidewalks()
+        layer.from_file(
+            "test/data_files/small_NYC-Polygons-09-07-2025_16_09/NYC-Polygons-09-07-2025_16_09.shp"
+        )
+        layer.mappings = self.layer.mappings
+        PipelineExecutor(
+            [("loader", loader), ("filter", BoundingBoxFilter()), ("layer", layer)]
+        ).compose()
+        assert loader.bounds is None
+        assert len(loader.load()) == 4025
+        assert loader.restrict_to_bounds((-74.0, 40.6, -73.9, 40.75))
+        assert loader.restrict_to_bounds((-73.8, 40.5, -73.7, 40.9))
+        assert loader.bounds == (-73.8, 40.5, -73.7, 40.9)
+        assert len(loader.load()) > 0
+        assert loader.restrict_to_bounds(None)
+        assert len(loader.load()) == 4025
+
+    def test_compose_map_projection(self):
+        """
+        Mapping a projection leaves the data as loaded, with the same enrichment
+        """
+        results = []
+        for map_projection in (False, True):
+            layer = Tile2NetSidewalks()
+            layer.from_file(
+                "test/data_files/small_NYC-Polygons-09-07-2025_16_09/NYC-Polygons-09-07-2025_16_09.shp"
+            )
+            layer.mappings = [
+                {
+                    "longitude_column": "longitude",
+                    "latitude_column": "latitude",
+                    "output_column": "sidewalk",
+                }
+            ]
+            executor = PipelineExecutor(
+                [
+                    (
+                        "loader",
+                        ParquetLoader(
+                            "test/data_files/small_VZV_Speed_Humps_with_LatLon.parquet",
+                            latitude_column="latitude",
+                            longitude_column="longitude",
+                        ),
+                    ),
+                    ("layer", layer),
+                    (
+                        "enricher",
+                        SingleAggregatorEnricher(
+                            CountAggregator(group_by_column="sidewalk"),
+                            output_column="count",
+                            config=EnricherConfig(),
+                        ),
+                    ),
+                ],
+                map_projection=map_projection,
+            )
+            executor.compose()
+            data, urban_layer = executor.transform()
+            results.append((data, urban_layer.layer["count"].copy()))
+        (mapped, counts), (loaded, projected_counts) = results
+        assert "sidewalk" in mapped.columns
+        assert "sidewalk" not in loaded.columns
+        assert counts.equals(projected_counts)
+
+    def test_keep_enricher_dtypes(self):
+        """
+        Columns the enrichers read keep their dtypes, and enrichments are unchanged
+        """
+        aggregator = SimpleAggregator(
+            group_by_column="on_street",
+            value_column="humps",
+            aggregation_function=AGGREGATION_FUNCTIONS["sum"],
+        )
+        loader = (
+            um.UrbanMapper()
+            .loader.from_file(self.file_path)
+            .with_columns(latitude_column="latitude", longitude_column="longitude")
+            .with_dtype_optimisation()
+            .build()
+        )
+        executor = PipelineExecutor(
+            [
+                ("loader", loader),
+                ("layer", self.layer),
+                (
+                    "enricher",
+                    SingleAggregatorEnricher(aggregator, config=EnricherConfig()),
+                ),
+            ]
+        )
+        executor._keep_enricher_dtypes()
+        data = loader.load()
+        assert data["on_street"].dtype == object
+        assert data["humps"].dtype == "int64"
+        assert data["from_stree"].dtype != object
+        expected = aggregator.aggregate(self.data_speed_hump)
+        assert aggregator.aggregate(data).equals(expected)
+
+        """
+        Enrichers reading unknown columns disable the optimisation
+    """
+        executor = self._executor(
+            CountAggregator(group_by_column="borough", count_function=lambda g: 1)
+        )
+        executor.steps.insert(0, ("loader", loader))
+        executor._keep_enricher_dtypes()
+        assert loader.additional_loader_parameters["dtype_optimisation"] is None